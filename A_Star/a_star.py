@@ -4,12 +4,19 @@ Allows creating weighted graphs and running A* to find shortest
 paths between a chosen start and target node.
 """
 
+import os
+import sys
 import tkinter as tk
 from tkinter import simpledialog, messagebox
 import math
-import heapq
 import threading
-import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.events import DONE, PATH, RELAX, VISIT, EventLog
+from algoviz.graph import Graph
+from algoviz.player import Player
+from algoviz.pqueue import IndexedHeap
 
 # --- Configuration & Aesthetics ---
 THEME = {
@@ -30,6 +37,10 @@ THEME = {
     "font_edge": ("Segoe UI", 9, "bold")
 }
 
+# Playback
+FPS = 4
+EVENTS_PER_FRAME = 1
+
 class Node:
     """Graph node storing A* scores and parent pointer."""
     def __init__(self, node_id, x, y):
@@ -57,14 +68,14 @@ class AStarApp:
         self.root.geometry("1000x750")
         self.root.configure(bg=THEME["bg_color"])
 
-        self.nodes = []
-        self.edges = []
+        self.graph = Graph()
         self.selected_node = None
         
         self.start_node = None
         self.target_node = None
         
         self.running_algorithm = False
+        self.path_edges = [] # (node, parent) pairs of the final path
 
         self._setup_ui()
 
@@ -104,13 +115,18 @@ class AStarApp:
         self.create_button(btn_frame, "Run A*", self.run_a_star, bg=THEME["accent_color"])
         self.create_button(btn_frame, "Clear Graph", self.clear_graph, bg="#333")
 
+        # Playback
+        self.player = Player(self.root, self.controls_panel, self.apply_event, reset=self._reset_playback,
+                             render=self.draw, fps=FPS, speed=EVENTS_PER_FRAME, bg=THEME["bg_color"])
+        self.player.frame.pack(pady=(10, 0))
+
     def create_button(self, parent, text, command, bg):
         tk.Button(parent, text=text, command=command, bg=bg, fg="white", 
                   relief="flat", padx=15, pady=8, font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT, padx=10)
 
     # --- Interaction ---
     def get_node_at(self, x, y):
-        for node in self.nodes:
+        for node in self.graph.nodes:
             if math.sqrt((x - node.x)**2 + (y - node.y)**2) <= node.radius + 5:
                 return node
         return None
@@ -174,17 +190,17 @@ class AStarApp:
         self.status_var.set(f"Added Edge {u.id}-{v.id} (Weight: {weight})")
 
     def add_node(self, x, y):
-        node = Node(len(self.nodes), x, y)
-        self.nodes.append(node)
+        node = Node(len(self.graph.nodes), x, y)
+        self.graph.add_node(node, record=False)
 
     def add_edge(self, u, v, weight):
-        self.edges = [e for e in self.edges if not ((e.source==u and e.destination==v) or (e.source==v and e.destination==u))]
-        self.edges.append(Edge(u, v, weight))
+        self.graph.add_edge(Edge(u, v, weight), record=False)
 
     def clear_graph(self):
         if self.running_algorithm: return
-        self.nodes = []
-        self.edges = []
+        self.player.clear()
+        self.path_edges = []
+        self.graph.clear()
         self.selected_node = None
         self.start_node = None
         self.target_node = None
@@ -196,15 +212,20 @@ class AStarApp:
         self.canvas.delete("all")
 
         # Edges
-        for edge in self.edges:
+        for edge in self.graph.edges:
             self.canvas.create_line(edge.source.x, edge.source.y, edge.destination.x, edge.destination.y, 
                                     width=2, fill=THEME["edge_color"])
             mx, my = (edge.source.x + edge.destination.x)/2, (edge.source.y + edge.destination.y)/2
             self.canvas.create_oval(mx-10, my-10, mx+10, my+10, fill="white", outline=THEME["edge_color"])
             self.canvas.create_text(mx, my, text=str(edge.weight), font=THEME["font_edge"])
 
+        # Final path
+        for node, parent in self.path_edges:
+            self.canvas.create_line(node.x, node.y, parent.x, parent.y, 
+                                    width=5, fill=THEME["path_color"])
+
         # Nodes
-        for node in self.nodes:
+        for node in self.graph.nodes:
             fill_color = node.color
             if node == self.start_node: fill_color = THEME["start_node"]
             elif node == self.target_node: fill_color = THEME["target_node"]
@@ -239,94 +260,105 @@ class AStarApp:
             return
         
         self.running_algorithm = True
+        self.player.clear()
+        self._reset_playback()
+        self.draw()
         self.status_var.set(f"Running A* from {self.start_node.id} to {self.target_node.id}...")
         threading.Thread(target=self._a_star_logic, daemon=True).start()
 
     def _a_star_logic(self):
-        # Reset
-        for n in self.nodes:
-            n.g_score = float('inf')
-            n.f_score = float('inf')
-            n.parent = None
-            n.color = THEME["node_fill"]
-
-        self.start_node.g_score = 0
-        self.start_node.f_score = self.heuristic(self.start_node, self.target_node)
-        
-        # Priority Queue: (f_score, h_score, id, node)
-        # h_score is tie breaker (prefer closer to goal), then id
-        open_set = [(self.start_node.f_score, self.heuristic(self.start_node, self.target_node), int(self.start_node.id), self.start_node)]
+        # Scores live in local tables; the nodes are only touched during playback
+        start, target = self.start_node, self.target_node
+        nodes = self.graph.nodes
+        index = {n: k for k, n in enumerate(nodes)}
+        g_score = {n: float('inf') for n in nodes}
+        parent = {start: None}
+        closed = set()
+        log = EventLog()
+
+        g_score[start] = 0
+        start_h = self.heuristic(start, target)
         
-        open_set_hash = {self.start_node}
-
-        self.refresh_ui()
+        # Open set keyed by (f_score, h_score): h breaks ties (prefer closer
+        # to goal), then node index. A better path lowers the key in place.
+        open_set = IndexedHeap(len(nodes))
+        open_set.push((start_h, start_h), index[start])
 
         while open_set:
-            _, _, _, current = heapq.heappop(open_set)
-            open_set_hash.discard(current)
-
-            if current == self.target_node:
-                self.reconstruct_path(current)
-                self.status_var.set(f"Path Found! Total Cost: {current.g_score}")
-                self.header_label.config(text=f"A* Complete! Cost: {current.g_score}")
-                self.running_algorithm = False
-                self.refresh_ui()
-                return
-
-            current.color = THEME["finished_color"]
-            if current == self.start_node: current.color = THEME["start_node"] # Keep Start Color
-            
-            self.refresh_ui()
-            time.sleep(0.4)
+            _, k = open_set.pop()
+            current = nodes[k]
+
+            if current == target:
+                self.reconstruct_path(current, parent, log)
+                log.emit(DONE, g_score[current])
+                break
+
+            closed.add(current)
+            log.emit(VISIT, current)
 
             neighbors = self._get_neighbors_with_weights(current)
             for neighbor, weight in neighbors:
-                if neighbor.color == THEME["finished_color"] and neighbor != self.target_node:
+                if neighbor in closed:
                     continue # Already processed
 
-                tentative_g_score = current.g_score + weight
+                tentative_g_score = g_score[current] + weight
 
-                if tentative_g_score < neighbor.g_score:
+                if tentative_g_score < g_score[neighbor]:
                     # Found better path
-                    neighbor.parent = current
-                    neighbor.g_score = tentative_g_score
-                    neighbor.f_score = tentative_g_score + self.heuristic(neighbor, self.target_node)
+                    parent[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    h = self.heuristic(neighbor, target)
                     
-                    if neighbor not in open_set_hash:
-                        heapq.heappush(open_set, (neighbor.f_score, self.heuristic(neighbor, self.target_node), int(neighbor.id), neighbor))
-                        open_set_hash.add(neighbor)
-                        if neighbor != self.target_node:
-                            neighbor.color = THEME["processing_color"]
-                        
-                        self.status_var.set(f"Updating Node {neighbor.id} (F: {int(neighbor.f_score)})")
-                        self.refresh_ui()
-                        time.sleep(0.2)
-
-        self.status_var.set("No Path Found")
-        self.header_label.config(text="No Path Found")
+                    open_set.push((tentative_g_score + h, h), index[neighbor])
+                    log.emit(RELAX, neighbor, tentative_g_score, tentative_g_score + h)
+        else:
+            log.emit(DONE, None)
+
         self.running_algorithm = False
-        self.refresh_ui()
-
-    def reconstruct_path(self, current):
-        path_cost = current.g_score
-        while current:
-            # Draw path edge? 
-            # We can just highlight nodes or draw lines
-            if current.parent:
-                # Find edge between current and parent
-                self.canvas.create_line(current.x, current.y, current.parent.x, current.parent.y, 
-                                        width=5, fill=THEME["path_color"])
-            current = current.parent
+        self.root.after(0, lambda: self.player.load(log))
+
+    def reconstruct_path(self, current, parent, log):
+        while parent[current]:
+            log.emit(PATH, current, parent[current])
+            current = parent[current]
+
+    # --- Playback ---
+    def apply_event(self, event):
+        kind = event[0]
+        if kind == VISIT:
+            event[1].color = THEME["finished_color"]
+        elif kind == RELAX:
+            _, node, g, f = event
+            node.g_score = g
+            node.f_score = f
+            if node != self.target_node:
+                node.color = THEME["processing_color"]
+            self.status_var.set(f"Updating Node {node.id} (F: {int(f)})")
+        elif kind == PATH:
+            self.path_edges.append((event[1], event[2]))
+        elif kind == DONE:
+            cost = event[1]
+            if cost is None:
+                self.status_var.set("No Path Found")
+                self.header_label.config(text="No Path Found")
+            else:
+                self.status_var.set(f"Path Found! Total Cost: {cost}")
+                self.header_label.config(text=f"A* Complete! Cost: {cost}")
+
+    def _reset_playback(self):
+        for n in self.graph.nodes:
+            n.g_score = float('inf')
+            n.f_score = float('inf')
+            n.parent = None
+            n.color = THEME["node_fill"]
+        if self.start_node is not None and self.target_node is not None:
+            self.start_node.g_score = 0
+            self.start_node.f_score = self.heuristic(self.start_node, self.target_node)
+        self.path_edges = []
+        self.header_label.config(text="A* Graph Visualizer (Set Start & Target)")
 
     def _get_neighbors_with_weights(self, node):
-        neighbors = []
-        for edge in self.edges:
-            if edge.source == node: neighbors.append((edge.destination, edge.weight))
-            elif edge.destination == node: neighbors.append((edge.source, edge.weight))
-        return neighbors
-
-    def refresh_ui(self):
-        self.root.after(0, self.draw)
+        return self.graph.neighbors_with_weights(node)
 
 if __name__ == "__main__":
     try:
@@ -4,12 +4,19 @@ This module provides an interactive canvas to create graphs
 and run breadth-first and depth-first searches for demonstration.
 """
 
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk
 import math
-import queue
 import threading
-import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.events import DONE, EXPAND, FINISH, VISIT, EventLog
+from algoviz.graph import Graph
+from algoviz.player import Player
 
 # --- Configuration & Aesthetics ---
 THEME = {
@@ -28,6 +35,10 @@ THEME = {
     "font_node": ("Segoe UI", 10, "bold")
 }
 
+# Playback
+FPS = 2
+EVENTS_PER_FRAME = 1
+
 class Node:
     """Represents a visual node in the graph canvas."""
     def __init__(self, node_id, x, y):
@@ -57,11 +68,11 @@ class GraphWizApp:
         self.root.geometry("1000x700")
         self.root.configure(bg=THEME["bg_color"])
 
-        self.nodes = []
-        self.edges = []
-        self.history = []
+        self.graph = Graph()
         self.selected_node = None
         self.running_algorithm = False
+        self.traversal = [] # Node ids in visit order during playback
+        self.status_text = None
 
         self._setup_ui()
 
@@ -123,6 +134,11 @@ class GraphWizApp:
         self.create_button("Reset", self.reset_graph, bg="#6e7681")
         self.create_button("Clear", self.clear_graph, bg="#d9534f")
 
+        # Playback
+        self.player = Player(self.root, self.controls_panel, self.apply_event, reset=self._reset_playback,
+                             render=self.render, fps=FPS, speed=EVENTS_PER_FRAME, bg=THEME["bg_color"])
+        self.player.frame.pack(side=tk.TOP, pady=(10, 0))
+
     def create_button(self, text, command, bg=None):
         btn = tk.Button(self.btn_frame, text=text, command=command,
                         bg=bg if bg else THEME["accent_color"],
@@ -140,13 +156,13 @@ class GraphWizApp:
         self.canvas.delete("all")
 
         # Draw Edges (Anti-aliasing simulated by thickness)
-        for edge in self.edges:
+        for edge in self.graph.edges:
             self.canvas.create_line(edge.source.x, edge.source.y, 
                                     edge.destination.x, edge.destination.y, 
                                     width=3, fill=THEME["edge_color"], capstyle=tk.ROUND, smooth=True)
 
         # Draw Nodes with simple shadow
-        for node in self.nodes:
+        for node in self.graph.nodes:
             # Shadow
             self.canvas.create_oval(node.x - node.radius + 3, node.y - node.radius + 3,
                                     node.x + node.radius + 3, node.y + node.radius + 3,
@@ -169,7 +185,7 @@ class GraphWizApp:
 
     # --- Interaction Logic ---
     def get_node_at(self, x, y):
-        for node in self.nodes:
+        for node in self.graph.nodes:
             dist = math.sqrt((x - node.x)**2 + (y - node.y)**2)
             if dist <= node.radius + 5: # Bit of tolerance
                 return node
@@ -229,138 +245,138 @@ class GraphWizApp:
             self.draw()
 
     def add_node(self, x, y):
-        node = Node(len(self.nodes), x, y)
-        self.nodes.append(node)
-        self.history.append(node)
+        return self.graph.add_node(Node(len(self.graph.nodes), x, y))
 
     def add_edge(self, u, v):
-        for edge in self.edges:
-            if (edge.source == u and edge.destination == v) or \
-               (edge.source == v and edge.destination == u):
-                return
-        edge = Edge(u, v)
-        self.edges.append(edge)
-        self.history.append(edge)
+        if self.graph.has_edge(u, v): return
+        self.graph.add_edge(Edge(u, v))
 
     def undo(self):
         if self.running_algorithm: return
-        if not self.history: return
-
-        item = self.history.pop()
-        if isinstance(item, Node):
-            if item in self.nodes:
-                self.nodes.remove(item)
-                self.edges = [e for e in self.edges if e.source != item and e.destination != item]
-                if self.selected_node == item: self.selected_node = None
-        elif isinstance(item, Edge):
-            if item in self.edges:
-                self.edges.remove(item)
+        if not self.graph.history: return
+
+        item = self.graph.undo()
+        if item is self.selected_node: self.selected_node = None
         self.draw()
         self.status_var.set("Undo Action")
 
     def reset_graph(self):
         if self.running_algorithm: return
-        for node in self.nodes:
-            node.color = THEME["node_fill"]
-            node.visited = False
+        self.player.clear()
+        self._reset_playback()
         self.status_var.set("Graph Reset")
         self.draw()
 
     def clear_graph(self):
         if self.running_algorithm: return
-        self.nodes = []
-        self.edges = []
-        self.history = []
+        self.player.clear()
+        self.graph.clear()
+        self._reset_playback()
         self.selected_node = None
         self.status_var.set("Graph Cleared")
         self.draw()
 
     # --- ALGORITHMS ---
     def run_bfs(self):
-        if self.running_algorithm or not self.nodes: return
+        if self.running_algorithm or not self.graph.nodes: return
         self.reset_graph()
         self.running_algorithm = True
         self.status_var.set("Running BFS...")
-        threading.Thread(target=self._bfs_logic, args=(self.nodes[0],), daemon=True).start()
+        threading.Thread(target=self._bfs_logic, args=(self.graph.nodes[0],), daemon=True).start()
 
     def _bfs_logic(self, start_node):
-        path = []
-        q = queue.Queue()
-        q.put(start_node)
-        start_node.visited = True
-        start_node.color = THEME["visited_color"]
-        
-        self.update_ui_deferred(path, start_node.id)
+        log = EventLog()
+        visited = {start_node}
+        q = deque([start_node])
+        log.emit(VISIT, start_node)
 
-        while not q.empty():
-            current = q.get()
+        while q:
+            current = q.popleft()
             
             if current != start_node:
-                current.color = THEME["processing_color"]
-                self.refresh_ui()
-            
-            time.sleep(0.6)
+                log.emit(EXPAND, current)
 
-            neighbors = self._get_neighbors(current)
-            for neighbor in neighbors:
-                if not neighbor.visited:
-                    neighbor.visited = True
-                    neighbor.color = THEME["visited_color"]
-                    q.put(neighbor)
-                    self.update_ui_deferred(path, neighbor.id)
-                    time.sleep(0.4)
+            for neighbor in self._get_neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    q.append(neighbor)
+                    log.emit(VISIT, neighbor)
             
-            current.color = THEME["finished_color"]
-            self.refresh_ui()
+            log.emit(FINISH, current)
 
-        self.running_algorithm = False
-        self.root.after(0, lambda: self.status_var.set(f"BFS Complete! Path: {'-'.join(path)}"))
+        log.emit(DONE, "BFS")
+        self._play(log)
 
     def run_dfs(self):
-        if self.running_algorithm or not self.nodes: return
+        if self.running_algorithm or not self.graph.nodes: return
         self.reset_graph()
         self.running_algorithm = True
         self.status_var.set("Running DFS...")
-        threading.Thread(target=self._dfs_logic, args=(self.nodes[0],), daemon=True).start()
+        threading.Thread(target=self._dfs_logic, args=(self.graph.nodes[0],), daemon=True).start()
 
     def _dfs_logic(self, start_node):
-        path = []
-        self._dfs_recursive(start_node, path)
-        self.running_algorithm = False
-        self.root.after(0, lambda: self.status_var.set(f"DFS Complete! Path: {'-'.join(path)}"))
-
-    def _dfs_recursive(self, current, path):
-        current.visited = True
-        current.color = THEME["processing_color"]
-        self.update_ui_deferred(path, current.id)
-        
-        time.sleep(0.6)
+        # Iterative DFS (explicit stack of neighbor iterators) so deep
+        # graphs don't hit the recursion limit; event order matches the
+        # recursive version.
+        log = EventLog()
+        visited = {start_node}
+        log.emit(VISIT, start_node)
+        log.emit(EXPAND, start_node)
+        stack = [(start_node, iter(self._get_neighbors(start_node)))]
+
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    log.emit(VISIT, neighbor)
+                    log.emit(EXPAND, neighbor)
+                    stack.append((neighbor, iter(self._get_neighbors(neighbor))))
+                    break
+            else:
+                log.emit(FINISH, current)
+                stack.pop()
 
-        neighbors = self._get_neighbors(current)
-        for neighbor in neighbors:
-            if not neighbor.visited:
-                self._dfs_recursive(neighbor, path)
-        
-        current.color = THEME["finished_color"]
-        self.refresh_ui()
+        log.emit(DONE, "DFS")
+        self._play(log)
 
     def _get_neighbors(self, node):
-        neighbors = []
-        for edge in self.edges:
-            if edge.source == node: neighbors.append(edge.destination)
-            elif edge.destination == node: neighbors.append(edge.source)
-        neighbors.sort(key=lambda n: int(n.id))
-        return neighbors
-
-    def update_ui_deferred(self, path_list, new_id):
-        path_list.append(new_id)
-        path_str = " -> ".join(path_list)
-        # Use simple blinking effect or just update
-        self.root.after(0, lambda: self.status_var.set(f"Path: {path_str}"))
-        self.root.after(0, self.draw)
-
-    def refresh_ui(self):
-        self.root.after(0, self.draw)
+        return sorted(self.graph.adjacency[node], key=lambda n: int(n.id))
+
+    def _play(self, log):
+        self.running_algorithm = False
+        self.root.after(0, self._load, log)
+
+    def _load(self, log):
+        # Each run's traversal and status start empty, not after the last run's
+        self._reset_playback()
+        self.player.load(log)
+
+    # --- Playback ---
+    def apply_event(self, event):
+        kind, node = event[0], event[1]
+        if kind == VISIT:
+            node.visited = True
+            node.color = THEME["visited_color"]
+            self.traversal.append(node.id)
+            self.status_text = None
+        elif kind == EXPAND:
+            node.color = THEME["processing_color"]
+        elif kind == FINISH:
+            node.color = THEME["finished_color"]
+        elif kind == DONE:
+            self.status_text = f"{event[1]} Complete! Path: {'-'.join(self.traversal)}"
+
+    def render(self):
+        self.status_var.set(self.status_text or f"Path: {' -> '.join(self.traversal)}")
+        self.draw()
+
+    def _reset_playback(self):
+        for node in self.graph.nodes:
+            node.color = THEME["node_fill"]
+            node.visited = False
+        self.traversal = []
+        self.status_text = None
 
 
 if __name__ == "__main__":
@@ -4,17 +4,30 @@ Provides an interactive demonstration of binary search on a
 sorted list with visual highlighting of ranges and midpoints.
 """
 
+import os
+import sys
 import tkinter as tk
-from tkinter import messagebox, simpledialog
-import random
-import time
+from tkinter import filedialog, messagebox, simpledialog
 import threading
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.bars import BarRenderer
+from algoviz.datasets import DISTRIBUTIONS, FILE_TYPES, TEXT_EXTENSIONS, generate, load_file, parse_csv
+from algoviz.events import COMPARE, DISCARD, DONE, PAGE, EventLog
+from algoviz.metrics import Metrics, write_csv
+from algoviz.mmapdata import MappedArray, PageMap
+from algoviz.player import Player
+
 # Configuration
 WIDTH = 800
 HEIGHT = 400
 DELAY = 1.0  # Slower for binary search to see steps clearly
 
+# Playback
+FPS = round(1 / DELAY)
+EVENTS_PER_FRAME = 1
+
 # Colors
 COLOR_BG = "#ffffff"
 COLOR_BAR_DEFAULT = "#007acc"
@@ -22,6 +35,7 @@ COLOR_BAR_ACTIVE_RANGE = "#90e0ef" # Light blue for current range
 COLOR_BAR_MID = "#ffd700"          # Gold for Middle
 COLOR_BAR_FOUND = "#28a745"        # Green
 COLOR_BAR_DISCARDED = "#e0e0e0"    # Grey for discarded
+COLOR_PAGE = "#e0e0e0"             # Pages of a mapped file not read yet
 COLOR_TEXT = "#000000"
 
 class BinarySearchApp:
@@ -33,13 +47,18 @@ class BinarySearchApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Binary Search Visualizer")
-        self.root.geometry("900x600")
+        self.root.geometry("1100x680")
         self.root.configure(bg=COLOR_BG)
 
-        self.data = []
+        self.data = [] # A list, or the MappedArray of a loaded binary file
+        self.mapped = None
         self.running = False
         self.target = None
-        self.discarded_indices = set()
+        self.discarded = [] # (first, last, COLOR_BAR_DISCARDED) spans, in search order
+        self.spans = []
+        self.color_map = {}
+        self.metrics = Metrics() # Counts up to the event being shown
+        self.runs = [] # metrics.FIELDS rows of the finished runs, for export
 
         self._setup_ui()
         # self.generate_data() # Removed default generation
@@ -61,9 +80,16 @@ class BinarySearchApp:
         self.status_label = tk.Label(self.root, textvariable=self.status_var, font=("Segoe UI", 14), bg=COLOR_BG, fg=COLOR_TEXT)
         self.status_label.pack(pady=20)
 
-        # Canvas
-        self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, bg="#f0f0f0", highlightthickness=0)
-        self.canvas.pack(pady=10)
+        # Canvas, with the operation counts beside it
+        body = tk.Frame(self.root, bg=COLOR_BG)
+        body.pack(pady=10)
+        self.canvas = tk.Canvas(body, width=WIDTH, height=HEIGHT, bg="#f0f0f0", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT)
+        self.bars = BarRenderer(self.canvas, WIDTH, HEIGHT, COLOR_BAR_DEFAULT, COLOR_TEXT)
+        self.pages = PageMap(self.canvas, WIDTH, HEIGHT, COLOR_PAGE) # Replaces the bars for mapped files
+        self.metrics_var = tk.StringVar(value=self.metrics.summary())
+        tk.Label(body, textvariable=self.metrics_var, font=("Consolas", 10), justify=tk.LEFT, anchor="n",
+                 bg=COLOR_BG, fg=COLOR_TEXT).pack(side=tk.LEFT, fill=tk.Y, padx=15)
 
         # Controls
         controls_frame = tk.Frame(self.root, bg=COLOR_BG)
@@ -77,7 +103,12 @@ class BinarySearchApp:
         btn_style = {"bg": "#333", "fg": "white", "font": ("Segoe UI", 10, "bold"), "relief": "flat", "padx": 15, "pady": 5}
 
         tk.Button(controls_frame, text="Search", command=self.start_search, **btn_style).pack(side=tk.LEFT, padx=10)
+        self.dist_var = tk.StringVar(value=DISTRIBUTIONS[0])
+        menu = tk.OptionMenu(controls_frame, self.dist_var, *DISTRIBUTIONS)
+        menu.config(highlightthickness=0, **btn_style)
+        menu.pack(side=tk.LEFT, padx=10)
         tk.Button(controls_frame, text="Generate Random", command=self.generate_data, **btn_style).pack(side=tk.LEFT, padx=10)
+        tk.Button(controls_frame, text="Export Metrics", command=self.export_metrics, **btn_style).pack(side=tk.LEFT, padx=10)
 
         # Custom Data Section
         custom_frame = tk.Frame(self.root, bg=COLOR_BG)
@@ -86,14 +117,23 @@ class BinarySearchApp:
         self.custom_entry = tk.Entry(custom_frame, font=("Segoe UI", 10), width=30)
         self.custom_entry.pack(side=tk.LEFT, padx=5)
         tk.Button(custom_frame, text="Use Custom Data (Auto-Sorted)", command=self.use_custom_data, bg="#555", fg="white", relief="flat").pack(side=tk.LEFT, padx=5)
+        tk.Button(custom_frame, text="Load File", command=self.load_file, bg="#555", fg="white", relief="flat").pack(side=tk.LEFT, padx=5)
+
+        # Playback
+        self.player = Player(self.root, self.root, self.apply_event, reset=self._reset_playback,
+                             render=self.render, fps=FPS, speed=EVENTS_PER_FRAME, bg=COLOR_BG)
+        self.player.frame.pack()
 
     def generate_data(self):
         if self.running: return
-        self.data = [random.randint(10, 100) for _ in range(15)]
+        size = simpledialog.askinteger("Generate Random", "How many numbers?", parent=self.root,
+                                       minvalue=1, initialvalue=15)
+        if size is None: return
+        self.player.clear()
+        self.data = generate(self.dist_var.get(), size, low=10, high=max(100, size))
         self.data.sort() # Critical for Binary Search
-        self.discarded_indices = set()
-        self.draw_bars(color_map={})
-        self.status_var.set("New Sorted Random Array Generated")
+        self.show_data()
+        self.status_var.set(f"Generated {size:,} numbers ({self.dist_var.get()}), sorted")
 
     def use_custom_data(self):
         if self.running: return
@@ -104,48 +144,72 @@ class BinarySearchApp:
         
         try:
             # Parse CSV
-            new_data = [int(x.strip()) for x in raw_data.split(',')]
-            if not new_data: raise ValueError
+            new_data = parse_csv(raw_data)
             
             # Auto-Sort for Binary Search
             new_data.sort()
             
+            self.player.clear()
             self.data = new_data
-            self.discarded_indices = set()
-            self.draw_bars(color_map={})
+            self.show_data()
             self.status_var.set("Custom Data Loaded & Sorted")
         except ValueError:
             messagebox.showerror("Error", "Invalid format. Use comma-separated integers (e.g., 10, 20, 5).")
 
-    def draw_bars(self, color_map):
-        self.canvas.delete("all")
-        c_width = WIDTH
-        c_height = HEIGHT
-        
-        x_width = c_width / len(self.data)
-        offset = 10
-        spacing = 5
-        
-        if not self.data: return
-        max_val = max(self.data)
-        normalized_data = [i / max_val for i in self.data]
+    def load_file(self):
+        # Text files are read into a list; binary ones are mapped, however large
+        if self.running: return
+        path = filedialog.askopenfilename(parent=self.root, filetypes=FILE_TYPES)
+        if not path: return
+        try:
+            if os.path.splitext(path)[1].lower() in TEXT_EXTENSIONS:
+                data = load_file(path)
+                data.sort()
+                self.player.clear()
+                self.data = data
+                self.show_data()
+                self.status_var.set(f"Loaded {len(data):,} numbers from {os.path.basename(path)}")
+                return
+            mapped = MappedArray(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.running = True
+        self.status_var.set(f"Checking that {os.path.basename(path)} is sorted...")
+        threading.Thread(target=self._check_mapped, args=(mapped,), daemon=True).start()
 
-        for i, height in enumerate(normalized_data):
-            x0 = i * x_width + offset + spacing
-            y0 = c_height - (height * (c_height - 50))
-            x1 = (i + 1) * x_width + offset
-            y1 = c_height
+    def _check_mapped(self, mapped):
+        # Binary search needs sorted data, and a mapped file cannot be sorted in place
+        ok = mapped.is_sorted()
+        self.root.after(0, self._mapped_checked, mapped, ok)
 
-            val = self.data[i]
-            
-            # Determine Color
-            if i in self.discarded_indices:
-                color = COLOR_BAR_DISCARDED
-            else:
-                color = color_map.get(i, COLOR_BAR_DEFAULT)
-                
-            self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="")
-            self.canvas.create_text(x0 + (x1-x0)/2, y0 - 15, text=str(val), font=("Segoe UI", 10, "bold"), fill=COLOR_TEXT)
+    def _mapped_checked(self, mapped, ok):
+        self.running = False
+        if ok: return self.show_mapped(mapped)
+        mapped.close()
+        self.status_var.set(f"{os.path.basename(mapped.path)} is not sorted")
+        messagebox.showerror("Error", f"{os.path.basename(mapped.path)} is not sorted. Sort it with \"Sort File\" in the sorting visualizer first.")
+
+    def show_data(self):
+        self._unmap()
+        self.discarded, self.spans, self.color_map = [], [], {}
+        self.bars.load(self.data)
+        self.bars.draw()
+
+    def show_mapped(self, mapped):
+        self.player.clear()
+        self._unmap()
+        self.mapped = self.data = mapped
+        self.discarded, self.spans, self.color_map = [], [], {}
+        self.bars.load([]) # Hand the canvas over to the page map
+        self.pages.load(mapped.pages)
+        self.pages.draw()
+        self.status_var.set(f"Mapped {len(mapped):,} numbers ({mapped.pages:,} pages) from {os.path.basename(mapped.path)}")
+
+    def _unmap(self):
+        if self.mapped is None: return
+        self.mapped.close()
+        self.mapped = None
 
     def start_search(self):
         if self.running: return
@@ -156,55 +220,108 @@ class BinarySearchApp:
         
         self.target = int(target_str)
         self.running = True
-        self.discarded_indices = set()
+        self.player.clear()
+        self.discarded, self.spans, self.color_map = [], [], {}
+        self.pages.reset()
+        self.metrics = Metrics()
         threading.Thread(target=self.binary_search, daemon=True).start()
 
     def binary_search(self):
+        log = EventLog()
         low = 0
         high = len(self.data) - 1
+        found = None
 
         while low <= high:
             mid = (low + high) // 2
             mid_val = self.data[mid]
-            
-            # Visualize Range
-            self.status_var.set(f"Checking range [{low}, {high}]. Mid index {mid} value is {mid_val}")
-            
-            # Color active range and mid
-            color_map = {mid: COLOR_BAR_MID}
-            for i in range(low, high + 1):
-                if i != mid:
-                    color_map[i] = COLOR_BAR_ACTIVE_RANGE
-            
-            self.update_ui(color_map)
-            time.sleep(DELAY)
+            if self.mapped is not None:
+                page = self.mapped.page_of(mid)
+                log.emit(PAGE, page, page)
+            log.emit(COMPARE, low, high, mid)
 
             if mid_val == self.target:
-                self.status_var.set(f"Found {self.target} at index {mid}!")
-                self.update_ui({mid: COLOR_BAR_FOUND})
-                self.running = False
-                return
+                found = mid
+                break
             elif mid_val < self.target:
-                self.status_var.set(f"{mid_val} < {self.target}. Discarding left half.")
                 # Discard left half
-                for i in range(low, mid + 1):
-                    self.discarded_indices.add(i)
+                log.emit(DISCARD, low, mid, mid)
                 low = mid + 1
             else:
-                self.status_var.set(f"{mid_val} > {self.target}. Discarding right half.")
                 # Discard right half
-                for i in range(mid, high + 1):
-                    self.discarded_indices.add(i)
+                log.emit(DISCARD, mid, high, mid)
                 high = mid - 1
-            
-            self.update_ui({})
-            time.sleep(DELAY)
+        log.emit(DONE, found)
 
-        self.status_var.set(f"Value {self.target} not found.")
+        metrics = Metrics()
+        for event in log:
+            self.count_event(metrics, event)
         self.running = False
+        self.root.after(0, self.runs.append, metrics.row("Binary Search", len(self.data)))
+        self.root.after(0, lambda: self.player.load(log))
+
+    def count_event(self, metrics, event):
+        if event[0] == COMPARE: metrics.compare(event[3]) # data[mid] against the target
+
+    def export_metrics(self):
+        if not self.runs:
+            self.status_var.set("No finished runs to export yet.")
+            return
+        filename = filedialog.asksaveasfilename(parent=self.root, defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv")])
+        if not filename: return
+        with open(filename, "w", newline="") as out:
+            write_csv(self.runs, out)
+        self.status_var.set(f"Exported {len(self.runs)} runs to {filename}")
+
+    # --- Playback ---
+    def apply_event(self, event):
+        self.count_event(self.metrics, event)
+        kind = event[0]
+        if kind == COMPARE:
+            _, low, high, mid = event
+            self.status_var.set(f"Checking range [{low}, {high}]. Mid index {mid} value is {self.data[mid]}")
+            
+            # Color active range and mid
+            self.spans = self.discarded + [(low, high, COLOR_BAR_ACTIVE_RANGE)]
+            self.color_map = {mid: COLOR_BAR_MID}
+        elif kind == PAGE:
+            self.pages.touch(event[1], event[2], COLOR_BAR_MID)
+        elif kind == DISCARD:
+            _, first, last, mid = event
+            mid_val = self.data[mid]
+            if mid_val < self.target:
+                self.status_var.set(f"{mid_val} < {self.target}. Discarding left half.")
+            else:
+                self.status_var.set(f"{mid_val} > {self.target}. Discarding right half.")
+            self.discarded.append((first, last, COLOR_BAR_DISCARDED))
+            self.spans = list(self.discarded)
+            self.color_map = {}
+        elif kind == DONE:
+            i = event[1]
+            if i is None:
+                self.status_var.set(f"Value {self.target} not found.")
+            else:
+                self.status_var.set(f"Found {self.target} at index {i}!")
+                self.color_map = {i: COLOR_BAR_FOUND}
+                if self.mapped is not None:
+                    page = self.mapped.page_of(i)
+                    self.pages.touch(page, page, COLOR_BAR_FOUND)
+
+    def render(self):
+        if self.mapped is not None:
+            self.pages.draw()
+            self.metrics_var.set(f"{self.metrics.summary()}\n\n"
+                                 f"Pages read {self.pages.touched:>12,}\n"
+                                 f"of         {self.pages.pages:>12,}")
+            return
+        self.bars.draw(self.color_map, self.spans)
+        self.metrics_var.set(self.metrics.summary())
 
-    def update_ui(self, color_map):
-        self.root.after(0, lambda: self.draw_bars(color_map))
+    def _reset_playback(self):
+        self.metrics.reset()
+        self.pages.reset()
+        self.discarded, self.spans, self.color_map = [], [], {}
 
 if __name__ == "__main__":
     try:
@@ -1,19 +1,38 @@
-"""Bubble sort visualizer with Tkinter.
+"""Sorting visualizer with Tkinter (bubble sort and friends).
 
-Interactive GUI to demonstrate bubble sort operations (compare, swap)
-on a small list of integers with animation controls.
+Interactive GUI to demonstrate sorting operations (compare, swap,
+write) on a list of integers with animation controls. The algorithms
+live in algoviz.sorting; pick one from the menu and compare their
+operation counts.
 """
 
+import os
+import sys
 import tkinter as tk
-from tkinter import messagebox, simpledialog
-import random
-import time
+from tkinter import filedialog, messagebox, simpledialog
 import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.bars import BarRenderer
+from algoviz.datasets import DISTRIBUTIONS, FILE_TYPES, TEXT_EXTENSIONS, binary_type, generate, is_sorted, parse_csv
+from algoviz.events import COMPARE, DONE, SWAP, WRITE, EventLog
+from algoviz.metrics import Metrics, write_csv
+from algoviz.mmapdata import PAGE_SIZE, MappedArray, PageMap, external_sort
+from algoviz.player import Player
+from algoviz.sorting import SORTS
 
 # Configuration
 WIDTH = 800
 HEIGHT = 400
-DELAY = 0.3  # Speed of animation
+DELAY = 0.3  # Seconds per animation step
+
+# Playback
+FPS = round(1 / DELAY)
+EVENTS_PER_FRAME = 1
+MAX_LOG_EVENTS = 2_000_000 # Longer runs are counted but not recorded for playback
+PROGRESS_EVERY = 1 << 20   # Events between status updates while sorting
 
 # Colors
 COLOR_BG = "#ffffff"
@@ -21,22 +40,30 @@ COLOR_BAR_DEFAULT = "#007acc"
 COLOR_BAR_COMPARE = "#ffd700"   # Gold
 COLOR_BAR_SWAP = "#dc3545"      # Red
 COLOR_BAR_SORTED = "#28a745"    # Green
+COLOR_PAGE = "#e0e0e0"          # File pages not read or written yet
 COLOR_TEXT = "#000000"
 
 class BubbleSortApp:
-    """Application that animates the bubble sort algorithm.
+    """Application that animates a sorting algorithm picked from algoviz.sorting.
 
     Users can enter custom data or provide values via a dialog.
-    The UI highlights comparisons and swaps during sorting.
+    The UI highlights comparisons, swaps and writes during sorting
+    and reports how many of each the algorithm needed.
     """
     def __init__(self, root):
         self.root = root
-        self.root.title("Bubble Sort Visualizer")
-        self.root.geometry("900x600")
+        self.root.title("Sorting Visualizer")
+        self.root.geometry("1100x680")
         self.root.configure(bg=COLOR_BG)
 
         self.data = []
+        self.initial_data = [] # Data as it was when the sort started
+        self.color_map = {}
+        self.spans = [] # (first, last, color) ranges drawn under color_map
+        self.metrics = Metrics() # Counts up to the event being shown
+        self.runs = [] # metrics.FIELDS rows of the finished runs, for export
         self.running = False
+        self.stop_requested = False
 
         self._setup_ui()
         # Prompt immediately at startup
@@ -49,9 +76,16 @@ class BubbleSortApp:
         self.status_label = tk.Label(self.root, textvariable=self.status_var, font=("Segoe UI", 14), bg=COLOR_BG, fg=COLOR_TEXT)
         self.status_label.pack(pady=20)
 
-        # Canvas
-        self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, bg="#f0f0f0", highlightthickness=0)
-        self.canvas.pack(pady=10)
+        # Canvas, with the operation counts beside it
+        body = tk.Frame(self.root, bg=COLOR_BG)
+        body.pack(pady=10)
+        self.canvas = tk.Canvas(body, width=WIDTH, height=HEIGHT, bg="#f0f0f0", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT)
+        self.bars = BarRenderer(self.canvas, WIDTH, HEIGHT, COLOR_BAR_DEFAULT, COLOR_TEXT)
+        self.pages = PageMap(self.canvas, WIDTH, HEIGHT, COLOR_PAGE) # Shown while sorting a file
+        self.metrics_var = tk.StringVar(value=self.metrics.summary())
+        tk.Label(body, textvariable=self.metrics_var, font=("Consolas", 10), justify=tk.LEFT, anchor="n",
+                 bg=COLOR_BG, fg=COLOR_TEXT).pack(side=tk.LEFT, fill=tk.Y, padx=15)
 
         # Controls
         controls_frame = tk.Frame(self.root, bg=COLOR_BG)
@@ -59,8 +93,25 @@ class BubbleSortApp:
 
         btn_style = {"bg": "#333", "fg": "white", "font": ("Segoe UI", 10, "bold"), "relief": "flat", "padx": 15, "pady": 5}
 
+        self.sort_var = tk.StringVar(value="Bubble Sort")
+        menu = tk.OptionMenu(controls_frame, self.sort_var, *SORTS)
+        menu.config(highlightthickness=0, **btn_style)
+        menu.pack(side=tk.LEFT, padx=10)
         tk.Button(controls_frame, text="Start Sort", command=self.start_sort, **btn_style).pack(side=tk.LEFT, padx=10)
+        tk.Button(controls_frame, text="Stop", command=self.stop_sort, **btn_style).pack(side=tk.LEFT, padx=10)
         tk.Button(controls_frame, text="Enter New Data", command=self.prompt_startup_data, **btn_style).pack(side=tk.LEFT, padx=10)
+        self.dist_var = tk.StringVar(value=DISTRIBUTIONS[0])
+        dist_menu = tk.OptionMenu(controls_frame, self.dist_var, *DISTRIBUTIONS)
+        dist_menu.config(highlightthickness=0, **btn_style)
+        dist_menu.pack(side=tk.LEFT, padx=10)
+        tk.Button(controls_frame, text="Random Data", command=self.prompt_random_data, **btn_style).pack(side=tk.LEFT, padx=10)
+        tk.Button(controls_frame, text="Sort File", command=self.sort_file, **btn_style).pack(side=tk.LEFT, padx=10)
+        tk.Button(controls_frame, text="Export Metrics", command=self.export_metrics, **btn_style).pack(side=tk.LEFT, padx=10)
+
+        # Playback
+        self.player = Player(self.root, self.root, self.apply_event, reset=self._reset_playback,
+                             render=self.render, fps=FPS, speed=EVENTS_PER_FRAME, bg=COLOR_BG)
+        self.player.frame.pack()
 
     def prompt_startup_data(self):
         if self.running: return
@@ -68,78 +119,194 @@ class BubbleSortApp:
         if user_input:
             self.load_data(user_input)
 
+    def prompt_random_data(self):
+        if self.running: return
+        size = simpledialog.askinteger("Random Data", "How many numbers?", parent=self.root,
+                                       minvalue=1, initialvalue=30)
+        if size is None: return
+        self.player.clear()
+        self.data = generate(self.dist_var.get(), size, high=max(100, size))
+        self.show_data()
+        self.status_var.set(f"Generated {size:,} numbers ({self.dist_var.get()}). Ready to sort.")
+
     def load_data(self, raw_data):
         try:
-            new_data = [int(x.strip()) for x in raw_data.split(',')]
-            if not new_data: raise ValueError
+            new_data = parse_csv(raw_data)
+            self.player.clear()
             self.data = new_data
-            self.draw_bars(color_map={})
+            self.show_data()
             self.status_var.set(f"Loaded {len(self.data)} numbers. Ready to sort.")
         except ValueError:
             messagebox.showerror("Error", "Invalid format. Use comma-separated integers.")
 
-    def draw_bars(self, color_map):
-        self.canvas.delete("all")
-        c_width = WIDTH
-        c_height = HEIGHT
-        
-        if not self.data: return
-        
-        x_width = c_width / len(self.data)
-        offset = 10
-        spacing = 5
-        max_val = max(self.data) if self.data else 1
-
-        for i, val in enumerate(self.data):
-            normalized_h = val / max_val
-            
-            x0 = i * x_width + offset + spacing
-            y0 = c_height - (normalized_h * (c_height - 50))
-            x1 = (i + 1) * x_width + offset
-            y1 = c_height
-
-            color = color_map.get(i, COLOR_BAR_DEFAULT)
-            
-            self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="")
-            self.canvas.create_text(x0 + (x1-x0)/2, y0 - 15, text=str(val), font=("Segoe UI", 10, "bold"), fill=COLOR_TEXT)
+    def show_data(self):
+        self.color_map, self.spans = {}, []
+        if self.pages.pages: self.pages.load(0) # Back from "Sort File": clear the page map
+        self.bars.load(self.data)
+        self.bars.draw()
 
     def start_sort(self):
         if self.running or not self.data: return
         self.running = True
-        threading.Thread(target=self.bubble_sort, daemon=True).start()
-
-    def bubble_sort(self):
-        n = len(self.data)
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                # Compare j and j+1
-                self.status_var.set(f"Comparing index {j} ({self.data[j]}) and {j+1} ({self.data[j+1]})")
-                self.update_ui({j: COLOR_BAR_COMPARE, j+1: COLOR_BAR_COMPARE})
-                time.sleep(DELAY)
-
-                if self.data[j] > self.data[j+1]:
-                    # Swap
-                    self.data[j], self.data[j+1] = self.data[j+1], self.data[j]
-                    self.status_var.set(f"Swapping {self.data[j+1]} and {self.data[j]}")
-                    self.update_ui({j: COLOR_BAR_SWAP, j+1: COLOR_BAR_SWAP})
-                    time.sleep(DELAY)
-                
-                # Reset colors for next step
-                self.update_ui({})
-            
-            # Metric: The element at n-i-1 is now sorted
-            # We can visualize this if we want, or just wait for end to show all sorted?
-            # A common way is to keep 'sorted' ones green.
-            # But the draw_bars logic simply redraws every frame. 
-            # I won't complicate draw_bars with persistent state, but I can pass a list of sorted indices if I stored them.
-            # Simplified: just finish loop.
-        
-        self.status_var.set("Sorting Complete!")
-        self.update_ui({i: COLOR_BAR_SORTED for i in range(n)})
+        self.stop_requested = False
+        self.player.clear()
+        self.initial_data = list(self.data)
+        self.show_data() # Also takes the canvas back after "Sort File"
+        self.metrics = Metrics()
+        name = self.sort_var.get()
+        self.status_var.set(f"Running {name} on {len(self.data)} numbers...")
+        threading.Thread(target=self._sort_logic, args=(name,), daemon=True).start()
+
+    def stop_sort(self):
+        # The worker checks this between events; a stopped run shows how far it got
+        if self.running: self.stop_requested = True
+
+    def _sort_logic(self, name):
+        # Sorts a copy at full speed; self.data follows along during playback
+        data = list(self.initial_data)
+        log = EventLog()
+        metrics = Metrics() # Totals for the whole run, recorded or not
+        try:
+            for total, event in enumerate(SORTS[name](data), 1):
+                metrics.record(event)
+                if log is not None:
+                    log.append(event)
+                    if len(log) > MAX_LOG_EVENTS: log = None # Too long to animate
+                if total % PROGRESS_EVERY == 0:
+                    self.root.after(0, self.status_var.set, f"{name}: {total:,} operations so far...")
+                if self.stop_requested: break
+        except ValueError as e:
+            self.running = False
+            self.root.after(0, messagebox.showerror, "Error", str(e))
+            return
+
+        stopped = self.stop_requested
+        self.running = False
+        if not stopped and not is_sorted(data):
+            self.root.after(0, messagebox.showerror, "Error", f"{name} left the data out of order.")
+            return
+        if not stopped: # Partial counts would export as if the sort had finished
+            self.root.after(0, self.runs.append, metrics.row(name, len(data)))
+        if log is not None:
+            log.emit(DONE, name, metrics, stopped)
+            self.root.after(0, lambda: self.player.load(log))
+        else:
+            # Skip the animation and show where the sort ended
+            def show():
+                self.data = data
+                self.bars.load(data)
+                self.metrics = metrics
+                self.apply_event((DONE, name, metrics, stopped))
+                self.render()
+            self.root.after(0, show)
+
+    def sort_file(self):
+        # External merge sort of a binary file too large to animate, or to load
+        if self.running: return
+        src = filedialog.askopenfilename(parent=self.root, filetypes=FILE_TYPES)
+        if not src: return
+        base, ext = os.path.splitext(src)
+        if ext.lower() in TEXT_EXTENSIONS:
+            messagebox.showerror("Error", "Sort File works on binary files of 32- or 64-bit integers.")
+            return
+        dst = filedialog.asksaveasfilename(parent=self.root, defaultextension=ext, filetypes=FILE_TYPES,
+                                           initialfile=os.path.basename(base) + "_sorted" + ext)
+        if not dst: return
+        if os.path.abspath(dst) == os.path.abspath(src):
+            messagebox.showerror("Error", "Choose a different file for the sorted output.")
+            return
+        if binary_type(dst) != binary_type(src):
+            # The output is written in the source's integer type, and read back by its extension
+            messagebox.showerror("Error", f"Save the sorted file with the same extension as the source ({ext}).")
+            return
+        self.running = True
+        self.stop_requested = False
+        self.player.clear()
+        self.bars.load([]) # Hand the canvas over to the page map
+        self.pages.load((os.path.getsize(src) + PAGE_SIZE - 1) // PAGE_SIZE)
+        self.pages.draw()
+        self.status_var.set(f"Sorting {os.path.basename(src)} into runs...")
+        threading.Thread(target=self._external_logic, args=(src, dst), daemon=True).start()
+
+    def _external_logic(self, src, dst):
+        start = time.perf_counter()
+        on_pages = lambda phase, first, last: self.root.after(0, self._show_pages, phase, first, last)
+        try:
+            runs = external_sort(src, dst, on_pages=on_pages, should_stop=lambda: self.stop_requested)
+            if runs is not None:
+                with MappedArray(dst, binary_type(src)) as result:
+                    n, ok = len(result), result.is_sorted()
+        except (OSError, ValueError) as e:
+            self.running = False
+            self.root.after(0, messagebox.showerror, "Error", str(e))
+            return
         self.running = False
+        if runs is None:
+            message = f"Stopped; {os.path.basename(dst)} is incomplete."
+        elif not ok:
+            message = f"{os.path.basename(dst)} came out of order."
+        else:
+            message = (f"Sorted {n:,} numbers into {os.path.basename(dst)} in {time.perf_counter() - start:.1f}s "
+                       f"({runs} sorted run{'s' if runs > 1 else ''} merged)")
+        self.root.after(0, self.status_var.set, message)
+
+    def _show_pages(self, phase, first, last):
+        self.pages.touch(first, last, COLOR_BAR_COMPARE if phase == "read" else COLOR_BAR_SORTED)
+        self.pages.draw()
+        verb = "Read and sorted" if phase == "read" else "Merged"
+        self.status_var.set(f"{verb} pages {first:,}-{last:,} of {self.pages.pages:,}")
+
+    def export_metrics(self):
+        if not self.runs:
+            self.status_var.set("No finished runs to export yet.")
+            return
+        filename = filedialog.asksaveasfilename(parent=self.root, defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv")])
+        if not filename: return
+        with open(filename, "w", newline="") as out:
+            write_csv(self.runs, out)
+        self.status_var.set(f"Exported {len(self.runs)} runs to {filename}")
+
+    # --- Playback ---
+    def apply_event(self, event):
+        kind = event[0]
+        if kind != DONE: self.metrics.record(event)
+        if kind == COMPARE:
+            _, j, k = event
+            self.status_var.set(f"Comparing index {j} ({self.data[j]}) and {k} ({self.data[k]})")
+            self.color_map = {j: COLOR_BAR_COMPARE, k: COLOR_BAR_COMPARE}
+        elif kind == SWAP:
+            _, j, k = event
+            self.data[j], self.data[k] = self.data[k], self.data[j]
+            self.bars.changed(j, k)
+            self.status_var.set(f"Swapping {self.data[k]} and {self.data[j]}")
+            self.color_map = {j: COLOR_BAR_SWAP, k: COLOR_BAR_SWAP}
+        elif kind == WRITE:
+            _, i, value = event
+            self.data[i] = value
+            self.bars.changed(i)
+            self.status_var.set(f"Writing {value} at index {i}")
+            self.color_map = {i: COLOR_BAR_SWAP}
+        elif kind == DONE:
+            _, name, metrics, stopped = event
+            summary = f"{metrics.compares:,} compares, {metrics.swaps:,} swaps, {metrics.writes:,} writes"
+            if stopped:
+                self.status_var.set(f"{name} stopped after {summary}")
+                self.color_map = {}
+            else:
+                self.status_var.set(f"{name} complete: {summary}")
+                self.color_map = {}
+                self.spans = [(0, len(self.data) - 1, COLOR_BAR_SORTED)]
+
+    def render(self):
+        self.bars.draw(self.color_map, self.spans)
+        self.metrics_var.set(self.metrics.summary())
 
-    def update_ui(self, color_map):
-        self.root.after(0, lambda: self.draw_bars(color_map))
+    def _reset_playback(self):
+        self.data = list(self.initial_data)
+        self.bars.load(self.data)
+        self.color_map, self.spans = {}, []
+        self.metrics.reset()
 
 if __name__ == "__main__":
     try:
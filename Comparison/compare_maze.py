@@ -5,18 +5,31 @@ exploration behavior and speed of Dijkstra and A* on the
 same randomly generated maze.
 """
 
+import argparse
+import os
+import sys
 import tkinter as tk
-import time
+from tkinter import simpledialog
 import threading
-import heapq
+from functools import partial
 import random
 
-# Configuration
-CELL_SIZE = 15
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.cells import canvas_size, fit_cell_size, make_cells
+from algoviz.events import DONE, PATH, VISIT, EventLog, interleave
+from algoviz.landmarks import Landmarks
+from algoviz.mazegen import GENERATORS
+from algoviz.pathfinding import astar
+from algoviz.pathservice import PathService
+from algoviz.player import Player
+
+# Configuration (defaults; see --rows/--cols/--cell-size and "Grid Size")
+CELL_SIZE = 15   # Largest cell size; bigger grids shrink their cells to fit
 COLS = 20
 ROWS = 20
-WIDTH = COLS * CELL_SIZE
-HEIGHT = ROWS * CELL_SIZE
+WIDTH = 30 * CELL_SIZE   # Largest canvas area per racer
+HEIGHT = 30 * CELL_SIZE
 
 # Colors
 COLOR_WALL = "#000000"
@@ -29,25 +42,29 @@ COLOR_VISITED_ASTAR = "#9C27B0"    # Purple
 COLOR_PATH_FINAL = "#ffff00"
 COLOR_BG = "#f0f0f0"
 
+# Playback (each frame's events are shared round-robin by both racers)
+FPS = 50
+EVENTS_PER_FRAME = 4
+
 class CompareApp:
     """Application that runs a simultaneous comparison of two algorithms.
 
     The app generates a shared maze and visualizes Dijkstra (left)
     and A* (right) exploring the grid and tracing their final paths.
     """
-    def __init__(self, root):
+    def __init__(self, root, rows=ROWS, cols=COLS, cell_size=None, seed=None, generator="Backtracker"):
         self.root = root
         self.root.title("Race: Dijkstra vs A*")
-        self.root.geometry(f"{WIDTH*2 + 80}x{HEIGHT + 200}")
         self.root.configure(bg=COLOR_BG)
 
-        self.grid_map = [] # Shared map data (0=Path, 1=Wall, 5=Mud)
-        self.start = (0,0)
-        self.end = (ROWS-1, COLS-1)
+        self.fixed_cell_size = cell_size # None = fit to WIDTH x HEIGHT
+        self.rng = random.Random(seed) # Drives maze and mud generation
+        self.generator = generator # Key of GENERATORS
+        self.paths = PathService() # Caches solves per maze state
         self.running = False
 
         self._setup_ui()
-        self.generate_maze()
+        self.set_grid_size(rows, cols)
 
     def _setup_ui(self):
         # Header
@@ -68,185 +85,197 @@ class CompareApp:
         canvas_frame.pack(pady=10)
 
         # Left: Dijkstra
-        frame_l = tk.Frame(canvas_frame, bg=COLOR_BG)
-        frame_l.pack(side=tk.LEFT, padx=10)
-        tk.Label(frame_l, text="Dijkstra (Blind Search)", bg=COLOR_BG).pack()
-        self.c_dijkstra = tk.Canvas(frame_l, width=WIDTH, height=HEIGHT, bg="black", highlightthickness=0)
-        self.c_dijkstra.pack()
+        self.frame_l = tk.Frame(canvas_frame, bg=COLOR_BG)
+        self.frame_l.pack(side=tk.LEFT, padx=10)
+        tk.Label(self.frame_l, text="Dijkstra (Blind Search)", bg=COLOR_BG).pack()
 
         # Right: A*
-        frame_r = tk.Frame(canvas_frame, bg=COLOR_BG)
-        frame_r.pack(side=tk.LEFT, padx=10)
-        tk.Label(frame_r, text="A* (Heuristic Search)", bg=COLOR_BG).pack()
-        self.c_astar = tk.Canvas(frame_r, width=WIDTH, height=HEIGHT, bg="black", highlightthickness=0)
-        self.c_astar.pack()
+        self.frame_r = tk.Frame(canvas_frame, bg=COLOR_BG)
+        self.frame_r.pack(side=tk.LEFT, padx=10)
+        tk.Label(self.frame_r, text="A* (Heuristic Search)", bg=COLOR_BG).pack()
+        self.c_dijkstra = self.c_astar = None # Built by set_grid_size()
 
         # Controls
         ctrl_frame = tk.Frame(self.root, bg=COLOR_BG)
         ctrl_frame.pack(pady=10)
         
         btn_style = {"relief": "flat", "bg": "#333", "fg": "white", "font": ("Segoe UI", 10, "bold"), "padx": 15}
+        self.generator_var = tk.StringVar(value=self.generator)
+        menu = tk.OptionMenu(ctrl_frame, self.generator_var, *GENERATORS, command=self.set_generator)
+        menu.config(highlightthickness=0, **btn_style)
+        menu.pack(side=tk.LEFT, padx=5)
         tk.Button(ctrl_frame, text="Generate Maze", command=self.generate_maze, **btn_style).pack(side=tk.LEFT, padx=5)
         tk.Button(ctrl_frame, text="Add Mud", command=self.add_mud, **btn_style).pack(side=tk.LEFT, padx=5)
+        tk.Button(ctrl_frame, text="Grid Size", command=self.ask_grid_size, **btn_style).pack(side=tk.LEFT, padx=5)
+        self.use_landmarks = tk.BooleanVar(value=False)
+        tk.Checkbutton(ctrl_frame, text="A* Landmarks", variable=self.use_landmarks, bg=COLOR_BG).pack(side=tk.LEFT, padx=5)
         tk.Button(ctrl_frame, text="START RACE", command=self.start_race, bg="#007acc", fg="white", font=("Segoe UI", 10, "bold"), relief="flat", padx=15).pack(side=tk.LEFT, padx=5)
 
-    def draw_grid(self, canvas):
-        canvas.delete("all")
-        for r in range(ROWS):
-            for c in range(COLS):
+        # Playback
+        self.player = Player(self.root, self.root, self.apply_event, reset=self._reset_playback,
+                             render=self.render_stats, fps=FPS, speed=EVENTS_PER_FRAME, bg=COLOR_BG)
+        self.player.frame.pack(pady=5)
+
+        self.lane_text = ["Dijkstra: Ready", "A*: Ready"]
+        self.visit_counts = [0, 0]
+
+    def _build_canvases(self):
+        # Fresh canvases per size, so no items or renderer bindings carry over
+        if self.c_dijkstra is not None:
+            self.c_dijkstra.destroy()
+            self.c_astar.destroy()
+        width, height = canvas_size(self.rows, self.cols, self.cell_size, WIDTH, HEIGHT)
+
+        self.c_dijkstra = tk.Canvas(self.frame_l, width=width, height=height, bg="black", highlightthickness=0)
+        self.c_dijkstra.pack()
+        self.cells_dijkstra = make_cells(self.c_dijkstra, self.rows, self.cols, self.cell_size)
+
+        self.c_astar = tk.Canvas(self.frame_r, width=width, height=height, bg="black", highlightthickness=0)
+        self.c_astar.pack()
+        self.cells_astar = make_cells(self.c_astar, self.rows, self.cols, self.cell_size)
+
+        # One lane per racer: (cells, label, name, visited color)
+        self.lanes = [
+            (self.cells_dijkstra, self.lbl_dijkstra, "Dijkstra", COLOR_VISITED_DIJKSTRA),
+            (self.cells_astar, self.lbl_astar, "A*", COLOR_VISITED_ASTAR),
+        ]
+        self.root.geometry(f"{max(width*2, 600) + 80}x{height + 260}")
+
+    def set_grid_size(self, rows, cols):
+        """Switch to a rows x cols grid and generate a new maze for it."""
+        self.rows, self.cols = rows, cols
+        self.cell_size = self.fixed_cell_size or fit_cell_size(rows, cols, WIDTH, HEIGHT, CELL_SIZE)
+        self.start = (0,0)
+        self.end = (rows-1, cols-1)
+        self.player.clear()
+        self._build_canvases()
+        self.generate_maze()
+
+    def ask_grid_size(self):
+        if self.running: return
+        rows = simpledialog.askinteger("Grid Size", "Rows:", parent=self.root, minvalue=2, initialvalue=self.rows)
+        if rows is None: return
+        cols = simpledialog.askinteger("Grid Size", "Columns:", parent=self.root, minvalue=2, initialvalue=self.cols)
+        if cols is None: return
+        self.set_grid_size(rows, cols)
+
+    def draw_grid(self, cells):
+        colors = []
+        for r in range(self.rows):
+            for c in range(self.cols):
                 color = COLOR_PATH
-                if self.grid_map[r][c] == 1: color = COLOR_WALL
-                elif self.grid_map[r][c] == 5: color = COLOR_MUD
-                
-                x1, y1 = c*CELL_SIZE, r*CELL_SIZE
-                canvas.create_rectangle(x1, y1, x1+CELL_SIZE, y1+CELL_SIZE, fill=color, outline="")
+                if self.grid_map[r, c] == 1: color = COLOR_WALL
+                elif self.grid_map[r, c] == 5: color = COLOR_MUD
+                colors.append(color)
         
         # Start/End
-        self.draw_cell(canvas, self.start[0], self.start[1], COLOR_START)
-        self.draw_cell(canvas, self.end[0], self.end[1], COLOR_END)
+        colors[self.start[0] * self.cols + self.start[1]] = COLOR_START
+        colors[self.end[0] * self.cols + self.end[1]] = COLOR_END
+        cells.draw(colors)
 
-    def draw_cell(self, canvas, r, c, color):
-        x1, y1 = c*CELL_SIZE, r*CELL_SIZE
-        canvas.create_rectangle(x1, y1, x1+CELL_SIZE, y1+CELL_SIZE, fill=color, outline="")
+    def set_generator(self, name):
+        """Switch to another maze generator and generate a maze with it."""
+        if self.running:
+            self.generator_var.set(self.generator)
+            return
+        self.generator = name
+        self.generate_maze()
 
     def generate_maze(self):
         if self.running: return
-        self.grid_map = [[1 for _ in range(COLS)] for _ in range(ROWS)]
+        self.player.clear()
+        self.grid_map = GENERATORS[self.generator](self.rows, self.cols, rng=self.rng)
+        self.paths.load(self.grid_map)
         
-        # Simple DFS Maze
-        stack = [(0,0)]
-        self.grid_map[0][0] = 0
-        visited = set([(0,0)])
-        
-        while stack:
-            r, c = stack[-1]
-            neighbors = []
-            for dr, dc in [(-2,0), (2,0), (0,-2), (0,2)]:
-                nr, nc = r+dr, c+dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS and self.grid_map[nr][nc] == 1:
-                    neighbors.append((nr,nc,dr,dc))
-            
-            if neighbors:
-                nr, nc, dr, dc = random.choice(neighbors)
-                self.grid_map[r+dr//2][c+dc//2] = 0
-                self.grid_map[nr][nc] = 0
-                stack.append((nr,nc))
-            else:
-                stack.pop()
-        
-        self.grid_map[ROWS-1][COLS-1] = 0
-        self.grid_map[ROWS-2][COLS-1] = 0
-        
-        self.draw_grid(self.c_dijkstra)
-        self.draw_grid(self.c_astar)
+        self.draw_grid(self.cells_dijkstra)
+        self.draw_grid(self.cells_astar)
         self.lbl_dijkstra.config(text="Dijkstra: Ready")
         self.lbl_astar.config(text="A*: Ready")
 
     def add_mud(self):
         if self.running: return
-        for r in range(ROWS):
-            for c in range(COLS):
-                if self.grid_map[r][c] == 0 and random.random() < 0.1:
-                    self.grid_map[r][c] = 5
-        self.draw_grid(self.c_dijkstra)
-        self.draw_grid(self.c_astar)
+        self.player.clear()
+        self._reset_playback()
+        self.render_stats()
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.grid_map[r, c] == 0 and (r, c) != self.start and (r, c) != self.end:
+                    if self.rng.random() < 0.1:
+                        self.paths.set_cell(r, c, 5)
+                        for cells, _, _, _ in self.lanes:
+                            cells.set_base(r, c, COLOR_MUD)
 
     def start_race(self):
         if self.running: return
         self.running = True
+        self.player.clear()
         
         # Reset visual state only (not the map)
-        self.draw_grid(self.c_dijkstra)
-        self.draw_grid(self.c_astar)
+        self._reset_playback()
+        self.render_stats()
 
-        t1 = threading.Thread(target=self.run_dijkstra, daemon=True)
-        t2 = threading.Thread(target=self.run_astar, daemon=True)
-        t1.start()
-        t2.start()
-        
-        # Monitor threads
-        threading.Thread(target=self.monitor_race, args=(t1, t2), daemon=True).start()
+        threading.Thread(target=self._race_logic, args=(self.use_landmarks.get(),), daemon=True).start()
 
-    def monitor_race(self, t1, t2):
-        t1.join()
-        t2.join()
+    def _race_logic(self, use_landmarks=False):
+        # Both searches run to completion first; the player then advances
+        # them in lockstep so the race is judged by work done, not threads
+        log = interleave(self.run_dijkstra(), self.run_astar(use_landmarks))
+        self.root.after(0, lambda: self.player.load(log))
         self.running = False
 
     # --- Dijkstra ---
     def run_dijkstra(self):
-        pq = [(0, self.start)]
-        costs = {self.start: 0}
-        visited_count = 0
-        parents = {self.start: None}
-        
-        while pq:
-            cost, (r, c) = heapq.heappop(pq)
-            
-            if (r,c) == self.end:
-                self.trace_path(self.c_dijkstra, parents)
-                self.lbl_dijkstra.config(text=f"Dijkstra: Done! Visited: {visited_count}")
-                return
-
-            if (r,c) != self.start:
-                visited_count += 1
-                self.root.after(0, lambda rr=r, cc=c: self.draw_cell(self.c_dijkstra, rr, cc, COLOR_VISITED_DIJKSTRA))
-                self.lbl_dijkstra.config(text=f"Dijkstra: Visiting... {visited_count}")
-                time.sleep(0.01) # Slow down to see race
-            
-            for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-                nr, nc = r+dr, c+dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS and self.grid_map[nr][nc] != 1:
-                    weight = 5 if self.grid_map[nr][nc] == 5 else 1
-                    new_cost = cost + weight
-                    
-                    if new_cost < costs.get((nr,nc), float('inf')):
-                        costs[(nr,nc)] = new_cost
-                        parents[(nr,nc)] = (r,c)
-                        heapq.heappush(pq, (new_cost, (nr,nc)))
+        # Served from the cached shortest-path tree of the start cell
+        return self.paths.memo(("dijkstra", self.start, self.end), lambda: self._record(self.paths.dijkstra))
 
     # --- A* ---
-    def run_astar(self):
-        def h(r, c): return abs(r-self.end[0]) + abs(c-self.end[1])
-        
-        pq = [(0, 0, self.start)] # (f, h, pos)
-        g_costs = {self.start: 0}
-        visited_count = 0
-        parents = {self.start: None}
-
-        while pq:
-            f, _, (r, c) = heapq.heappop(pq)
-            
-            if (r,c) == self.end:
-                self.trace_path(self.c_astar, parents)
-                self.lbl_astar.config(text=f"A*: Done! Visited: {visited_count}")
-                return
-
-            if (r,c) != self.start:
-                visited_count += 1
-                self.root.after(0, lambda rr=r, cc=c: self.draw_cell(self.c_astar, rr, cc, COLOR_VISITED_ASTAR))
-                self.lbl_astar.config(text=f"A*: Visiting... {visited_count}")
-                time.sleep(0.01)
-
-            for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-                nr, nc = r+dr, c+dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS and self.grid_map[nr][nc] != 1:
-                    weight = 5 if self.grid_map[nr][nc] == 5 else 1
-                    new_g = g_costs.get((r,c)) + weight
-                    
-                    if new_g < g_costs.get((nr,nc), float('inf')):
-                        g_costs[(nr,nc)] = new_g
-                        parents[(nr,nc)] = (r,c)
-                        new_h = h(nr, nc)
-                        heapq.heappush(pq, (new_g + new_h, new_h, (nr,nc)))
-
-    def trace_path(self, canvas, parents):
-        curr = self.end
-        while curr:
-            if curr != self.start and curr != self.end:
-                r, c = curr
-                self.root.after(0, lambda rr=r, cc=c, cv=canvas: self.draw_cell(cv, rr, cc, COLOR_PATH_FINAL))
-            curr = parents.get(curr)
-            time.sleep(0.01)
+    def run_astar(self, use_landmarks=False):
+        return self.paths.memo(("astar", use_landmarks, self.start, self.end), lambda: self._astar_log(use_landmarks))
+
+    def _astar_log(self, use_landmarks):
+        if not use_landmarks: return self._record(partial(astar, self.grid_map))
+        # ALT bound instead of Manhattan; the tables are cached per maze state
+        landmarks = self.paths.memo(("landmarks",), lambda: Landmarks(self.grid_map), nbytes=lambda lm: lm.nbytes)
+        return self._record(partial(astar, self.grid_map, potential=landmarks.potential(self.end)))
+
+    def _record(self, solver):
+        # solver(start, end, on_visit=...) with the grid already bound
+        log = EventLog()
+        result = solver(self.start, self.end, on_visit=log.recorder(VISIT))
+        for r, c in reversed(result.path):
+            log.emit(PATH, r, c)
+        log.emit(DONE, result.cost)
+        return log
+
+    def apply_event(self, item):
+        lane, event = item
+        cells, _, name, color = self.lanes[lane]
+        kind = event[0]
+        if kind == VISIT:
+            _, r, c = event
+            if (r, c) == self.start: return
+            self.visit_counts[lane] += 1
+            cells.paint(r, c, color)
+            self.lane_text[lane] = f"{name}: Visiting... {self.visit_counts[lane]}"
+        elif kind == PATH:
+            _, r, c = event
+            if (r, c) != self.start and (r, c) != self.end:
+                cells.paint(r, c, COLOR_PATH_FINAL)
+        elif kind == DONE:
+            if event[1] is None:
+                self.lane_text[lane] = f"{name}: No Path! Visited: {self.visit_counts[lane]}"
+            else:
+                self.lane_text[lane] = f"{name}: Done! Visited: {self.visit_counts[lane]}"
+
+    def render_stats(self):
+        for (_, label, _, _), text in zip(self.lanes, self.lane_text):
+            label.config(text=text)
+
+    def _reset_playback(self):
+        self.visit_counts = [0, 0]
+        self.lane_text = [f"{name}: Ready" for _, _, name, _ in self.lanes]
+        for cells, _, _, _ in self.lanes:
+            cells.reset()
 
 if __name__ == "__main__":
     try:
@@ -254,6 +283,15 @@ if __name__ == "__main__":
         windll.shcore.SetProcessDpiAwareness(1)
     except:
         pass
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--cols", type=int, default=COLS)
+    parser.add_argument("--cell-size", type=int, help="pixels per cell (default: fit the window)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible mazes")
+    parser.add_argument("--generator", choices=list(GENERATORS), default="Backtracker")
+    args = parser.parse_args()
+    if args.rows < 2 or args.cols < 2: parser.error("the grid needs at least 2 rows and 2 columns")
+
     root = tk.Tk()
-    app = CompareApp(root)
+    app = CompareApp(root, args.rows, args.cols, args.cell_size, args.seed, args.generator)
     root.mainloop()
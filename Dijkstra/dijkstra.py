@@ -1,15 +1,24 @@
 """Dijkstra algorithm visualizer for weighted graphs using Tkinter.
 
 Provides interactive graph building and a visualization of
-Dijkstra's algorithm on a user-created graph.
+Dijkstra's algorithm on a user-created graph. "All Pairs" computes
+every shortest path at once; hovering two nodes then shows theirs.
 """
 
+import os
+import sys
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
+from tkinter import ttk, simpledialog, messagebox, filedialog
 import math
-import heapq
 import threading
-import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.apsp import all_pairs, graph_edges
+from algoviz.events import DONE, RELAX, VISIT, EventLog
+from algoviz.graph import Graph
+from algoviz.player import Player
+from algoviz.pqueue import IndexedHeap
 
 # --- Configuration & Aesthetics ---
 THEME = {
@@ -28,6 +37,10 @@ THEME = {
     "font_edge": ("Segoe UI", 9, "bold")
 }
 
+# Playback
+FPS = 3
+EVENTS_PER_FRAME = 1
+
 class Node:
     """Graph node used by the visualizer.
 
@@ -63,10 +76,14 @@ class DijkstraApp:
         self.root.geometry("1000x700")
         self.root.configure(bg=THEME["bg_color"])
 
-        self.nodes = []
-        self.edges = []
+        self.graph = Graph()
         self.selected_node = None
         self.running_algorithm = False
+        self.run_start = None
+        self._highlighted = None # Node shown as "being updated" for one step
+        self.all_pairs = None # apsp.ShortestPaths for the current graph, if computed
+        self.hovered = [] # Last two distinct nodes under the mouse
+        self.shown_path = set() # Edges of the hovered pair's shortest path
 
         self._setup_ui()
 
@@ -87,6 +104,7 @@ class DijkstraApp:
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_down)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
+        self.canvas.bind("<Motion>", self.on_hover)
 
         # Controls
         self.controls_panel = tk.Frame(self.root, bg=THEME["bg_color"], pady=20)
@@ -100,15 +118,22 @@ class DijkstraApp:
         btn_frame.pack()
 
         self.create_button(btn_frame, "Run Dijkstra", self.run_dijkstra, bg=THEME["accent_color"])
+        self.create_button(btn_frame, "All Pairs", self.run_all_pairs, bg=THEME["accent_color"])
+        self.create_button(btn_frame, "Export Matrix", self.export_all_pairs, bg=THEME["accent_color"])
         self.create_button(btn_frame, "Clear Graph", self.clear_graph, bg="#d9534f")
 
+        # Playback
+        self.player = Player(self.root, self.controls_panel, self.apply_event, reset=self._reset_playback,
+                             render=self.draw, fps=FPS, speed=EVENTS_PER_FRAME, bg=THEME["bg_color"])
+        self.player.frame.pack(pady=(10, 0))
+
     def create_button(self, parent, text, command, bg):
         tk.Button(parent, text=text, command=command, bg=bg, fg="white", 
                   relief="flat", padx=20, pady=8, font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT, padx=10)
 
     # --- Interaction ---
     def get_node_at(self, x, y):
-        for node in self.nodes:
+        for node in self.graph.nodes:
             if math.sqrt((x - node.x)**2 + (y - node.y)**2) <= node.radius + 5:
                 return node
         return None
@@ -150,6 +175,27 @@ class DijkstraApp:
         self.drag_node = None
         self.draw()
 
+    def on_hover(self, event):
+        # With all pairs computed, entering a node shows the path from the previous one
+        if self.all_pairs is None or self.running_algorithm: return
+        node = self.get_node_at(event.x, event.y)
+        if node is None or node in self.hovered[-1:]: return
+        self.hovered = self.hovered[-1:] + [node]
+        if len(self.hovered) == 2: self.show_path(*self.hovered)
+
+    def show_path(self, u, v):
+        """Highlight the cached shortest path from u to v (no search is run)."""
+        nodes = self.graph.nodes
+        i, j = nodes.index(u), nodes.index(v)
+        path = [nodes[k] for k in self.all_pairs.path(i, j)]
+        self.shown_path = {self.graph.get_edge(a, b) for a, b in zip(path, path[1:])}
+        if path:
+            route = " -> ".join(node.id for node in path)
+            self.status_var.set(f"Shortest path {u.id} -> {v.id}: {route} (cost {self.all_pairs.distance(i, j)})")
+        else:
+            self.status_var.set(f"No path from {u.id} to {v.id}")
+        self.draw()
+
     def prompt_edge_weight(self, u, v):
         weight = simpledialog.askinteger("Edge Weight", f"Enter weight for edge {u.id}-{v.id}:", 
                                        parent=self.root, minvalue=1, initialvalue=1)
@@ -158,19 +204,28 @@ class DijkstraApp:
         self.status_var.set(f"Added Edge {u.id}-{v.id} (Weight: {weight})")
 
     def add_node(self, x, y):
-        node = Node(len(self.nodes), x, y)
-        self.nodes.append(node)
+        node = Node(len(self.graph.nodes), x, y)
+        self.graph.add_node(node, record=False)
+        self._drop_all_pairs()
 
     def add_edge(self, u, v, weight):
-        # Remove existing if any
-        self.edges = [e for e in self.edges if not ((e.source==u and e.destination==v) or (e.source==v and e.destination==u))]
-        self.edges.append(Edge(u, v, weight))
+        # Replaces the existing edge, if any
+        self.graph.add_edge(Edge(u, v, weight), record=False)
+        self._drop_all_pairs()
+
+    def _drop_all_pairs(self):
+        # The cached table is only valid for the graph it was computed on
+        self.all_pairs = None
+        self.hovered = []
+        self.shown_path = set()
 
     def clear_graph(self):
         if self.running_algorithm: return
-        self.nodes = []
-        self.edges = []
+        self.player.clear()
+        self.graph.clear()
+        self._drop_all_pairs()
         self.selected_node = None
+        self.run_start = None
         self.status_var.set("Graph Cleared")
         self.draw()
 
@@ -178,10 +233,11 @@ class DijkstraApp:
         self.canvas.delete("all")
 
         # Edges
-        for edge in self.edges:
+        for edge in self.graph.edges:
             # Line
+            on_path = edge in self.shown_path
             self.canvas.create_line(edge.source.x, edge.source.y, edge.destination.x, edge.destination.y, 
-                                    width=2, fill=THEME["edge_color"])
+                                    width=4 if on_path else 2, fill=THEME["path_color"] if on_path else THEME["edge_color"])
             
             # Weight Label (Midpoint)
             mx, my = (edge.source.x + edge.destination.x)/2, (edge.source.y + edge.destination.y)/2
@@ -189,7 +245,7 @@ class DijkstraApp:
             self.canvas.create_text(mx, my, text=str(edge.weight), font=THEME["font_edge"])
 
         # Nodes
-        for node in self.nodes:
+        for node in self.graph.nodes:
             # Highlight Selection
             if node == self.selected_node:
                 self.canvas.create_oval(node.x - node.radius - 3, node.y - node.radius - 3,
@@ -209,64 +265,117 @@ class DijkstraApp:
 
     # --- Dijkstra Algorithm ---
     def run_dijkstra(self):
-        if self.running_algorithm or not self.nodes: return
+        if self.running_algorithm or not self.graph.nodes: return
         
         # Assume start node is the first one or selected one
-        start_node = self.selected_node if self.selected_node else self.nodes[0]
+        start_node = self.selected_node if self.selected_node else self.graph.nodes[0]
         
         self.running_algorithm = True
+        self.player.clear()
+        self.run_start = start_node
+        self.shown_path = set()
+        self._reset_playback()
+        self.draw()
         self.status_var.set(f"Running Dijkstra from Node {start_node.id}...")
         threading.Thread(target=self._dijkstra_logic, args=(start_node,), daemon=True).start()
 
     def _dijkstra_logic(self, start_node):
-        # Reset
-        for n in self.nodes:
-            n.distance = float('inf')
-            n.visited = False
-            n.color = THEME["node_fill"]
-        
-        start_node.distance = 0
-        pq = [(0, int(start_node.id), start_node)] # (dist, id_tiebreaker, node_obj)
-        
-        self.refresh_ui()
+        # Runs on its own distance table; the nodes are only touched
+        # during playback
+        log = EventLog()
+        nodes = self.graph.nodes
+        index = {n: k for k, n in enumerate(nodes)}
+        distance = {n: float('inf') for n in nodes}
+        distance[start_node] = 0
+        visited = set()
+        pq = IndexedHeap(len(nodes)) # One entry per node; relaxing lowers it in place
+        pq.push(0, index[start_node])
 
         while pq:
-            d, _, current = heapq.heappop(pq)
-            
-            if current.visited: continue
-            current.visited = True
-            current.color = THEME["finished_color"]
-            self.status_var.set(f"Visited Node {current.id}. Distance: {d}")
-            self.refresh_ui()
-            time.sleep(0.5)
+            d, k = pq.pop()
+            current = nodes[k]
+            visited.add(current)
+            log.emit(VISIT, current, d)
 
             # Neighbors
             neighbors = self._get_neighbors_with_weights(current)
             for neighbor, weight in neighbors:
-                if not neighbor.visited:
+                if neighbor not in visited:
                     new_dist = d + weight
-                    if new_dist < neighbor.distance:
-                        neighbor.distance = new_dist
-                        neighbor.color = THEME["processing_color"] # Highlight being updated
-                        heapq.heappush(pq, (new_dist, int(neighbor.id), neighbor))
-                        self.status_var.set(f"Updated Node {neighbor.id} distance to {new_dist}")
-                        self.refresh_ui()
-                        time.sleep(0.3)
-                        neighbor.color = THEME["node_fill"] # Reset color after update
+                    if new_dist < distance[neighbor]:
+                        distance[neighbor] = new_dist
+                        pq.push(new_dist, index[neighbor])
+                        log.emit(RELAX, neighbor, new_dist)
         
+        log.emit(DONE)
+        self.running_algorithm = False
+        self.root.after(0, lambda: self.player.load(log))
+
+    # --- All Pairs ---
+    def run_all_pairs(self):
+        if self.running_algorithm or not self.graph.nodes: return
+        self.running_algorithm = True
+        self.player.clear()
+        self._drop_all_pairs()
+        self.draw()
+        self.status_var.set(f"Computing all pairs for {len(self.graph.nodes)} nodes...")
+        threading.Thread(target=self._all_pairs_logic, daemon=True).start()
+
+    def _all_pairs_logic(self):
+        # Floyd-Warshall on dense graphs, Dijkstra from every node on sparse ones
+        n, edges = graph_edges(self.graph)
+        table = all_pairs(n, edges)
         self.running_algorithm = False
-        self.status_var.set("Dijkstra Complete!")
-        self.refresh_ui()
+        self.root.after(0, lambda: self._all_pairs_ready(table))
+
+    def _all_pairs_ready(self, table):
+        self.all_pairs = table
+        engine = "Floyd-Warshall" if table.method == "floyd" else "Dijkstra from every node"
+        self.status_var.set(f"All pairs ready ({engine}). Hover two nodes to see their shortest path.")
+
+    def export_all_pairs(self):
+        if self.all_pairs is None:
+            self.status_var.set("Run All Pairs first.")
+            return
+        filename = filedialog.asksaveasfilename(parent=self.root, defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv")])
+        if not filename: return
+        with open(filename, "w", newline="") as out:
+            self.all_pairs.write_csv(out, [node.id for node in self.graph.nodes])
+        self.status_var.set(f"Exported distances and next hops to {filename}")
+
+    # --- Playback ---
+    def apply_event(self, event):
+        if self._highlighted is not None:
+            self._highlighted.color = THEME["node_fill"] # Reset color after update
+            self._highlighted = None
+
+        kind = event[0]
+        if kind == VISIT:
+            _, node, d = event
+            node.visited = True
+            node.color = THEME["finished_color"]
+            self.status_var.set(f"Visited Node {node.id}. Distance: {d}")
+        elif kind == RELAX:
+            _, node, d = event
+            node.distance = d
+            node.color = THEME["processing_color"] # Highlight being updated
+            self._highlighted = node
+            self.status_var.set(f"Updated Node {node.id} distance to {d}")
+        elif kind == DONE:
+            self.status_var.set("Dijkstra Complete!")
+
+    def _reset_playback(self):
+        for n in self.graph.nodes:
+            n.distance = float('inf')
+            n.visited = False
+            n.color = THEME["node_fill"]
+        if self.run_start is not None:
+            self.run_start.distance = 0
+        self._highlighted = None
 
     def _get_neighbors_with_weights(self, node):
-        neighbors = []
-        for edge in self.edges:
-            if edge.source == node: neighbors.append((edge.destination, edge.weight))
-            elif edge.destination == node: neighbors.append((edge.source, edge.weight))
-        return neighbors
-
-    def refresh_ui(self):
-        self.root.after(0, self.draw)
+        return self.graph.neighbors_with_weights(node)
 
 if __name__ == "__main__":
     try:
@@ -4,17 +4,29 @@ Displays a maze and visualizes Dijkstra's algorithm on a grid
 with optional higher-cost 'mud' tiles.
 """
 
+import argparse
+import os
+import sys
 import tkinter as tk
+from tkinter import simpledialog
 import random
 import threading
-import time
-import heapq
 
-# Configuration
-CELL_SIZE = 25
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.cells import canvas_size, fit_cell_size, make_cells
+from algoviz.events import DONE, PATH, VISIT, EventLog
+from algoviz.incremental import LPAStar
+from algoviz.mazegen import GENERATORS
+from algoviz.pathfinding import bidirectional_dijkstra
+from algoviz.pathservice import PathService
+from algoviz.player import Player
+
+# Configuration (defaults; see --rows/--cols/--cell-size and "Grid Size")
+CELL_SIZE = 25   # Largest cell size; bigger grids shrink their cells to fit
 COLS = 30
 ROWS = 25
-WIDTH = COLS * CELL_SIZE
+WIDTH = COLS * CELL_SIZE   # Largest canvas area
 HEIGHT = ROWS * CELL_SIZE
 
 # Colors
@@ -24,29 +36,37 @@ COLOR_MUD = "#8b4513"        # SaddleBrown (Cost 5)
 COLOR_START = "#00ff00"      # Green
 COLOR_END = "#ff0000"        # Red
 COLOR_VISITED = "#add8e6"    # Light Blue
+COLOR_VISITED_BACK = "#ffb6c1" # Light Pink (backward half of a bidirectional search)
 COLOR_PATH_FINAL = "#ffff00" # Yellow for the solution path
 COLOR_BG = "#f0f0f0"
 
+BACKWARD = "back" # Tags VISIT events from the backward search
+
+# Playback
+FPS = 60
+EVENTS_PER_FRAME = 3
+
 class DijkstraMazeApp:
     """Tkinter app that generates mazes and runs Dijkstra's algorithm.
 
     Keeps a grid with cells that can be walls, normal path, or
     higher-cost terrain and visualizes the search and result.
     """
-    def __init__(self, root):
+    def __init__(self, root, rows=ROWS, cols=COLS, cell_size=None, seed=None, generator="Backtracker"):
         self.root = root
         self.root.title("Dijkstra Maze Solver (Weighted)")
-        self.root.geometry(f"{WIDTH + 50}x{HEIGHT + 150}")
         self.root.configure(bg=COLOR_BG)
 
-        # 0 = Path, 1 = Wall, 5 = Mud
-        self.grid = [] 
-        self.start = (0, 0)
-        self.end = (ROWS - 1, COLS - 1)
+        self.fixed_cell_size = cell_size # None = fit to WIDTH x HEIGHT
+        self.rng = random.Random(seed) # Drives maze and mud generation
+        self.generator = generator # Key of GENERATORS
+        self.paths = PathService() # Caches solves per maze state
+        self.planner = None # LPA* search kept between wall edits (Live Replan)
+        self.last_cell = None # Cell toggled last, so a drag toggles each cell once
         self.running = False
 
         self._setup_ui()
-        self.generate_maze()
+        self.set_grid_size(rows, cols)
 
     def _setup_ui(self):
         # Header
@@ -62,96 +82,126 @@ class DijkstraMazeApp:
 
         btn_style = {"bg": "#007acc", "fg": "white", "font": ("Segoe UI", 9, "bold"), "relief": "flat", "padx": 10}
         
+        self.generator_var = tk.StringVar(value=self.generator)
+        menu = tk.OptionMenu(self.controls_frame, self.generator_var, *GENERATORS, command=self.set_generator)
+        menu.config(highlightthickness=0, **btn_style)
+        menu.pack(side=tk.LEFT, padx=5)
         tk.Button(self.controls_frame, text="Generate Maze", command=self.generate_maze_thread, **btn_style).pack(side=tk.LEFT, padx=5)
         tk.Button(self.controls_frame, text="Add Random Mud", command=self.add_mud, **btn_style).pack(side=tk.LEFT, padx=5)
         tk.Button(self.controls_frame, text="Run Dijkstra", command=self.run_dijkstra, **btn_style).pack(side=tk.LEFT, padx=5)
+        self.bidirectional = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.controls_frame, text="Bidirectional", variable=self.bidirectional, bg=COLOR_BG).pack(side=tk.LEFT, padx=5)
+        self.live = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.controls_frame, text="Live Replan", variable=self.live, command=self.toggle_live,
+                       bg=COLOR_BG).pack(side=tk.LEFT, padx=5)
         tk.Button(self.controls_frame, text="Reset Visuals", command=self.reset_visuals, **btn_style).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.controls_frame, text="Grid Size", command=self.ask_grid_size, **btn_style).pack(side=tk.LEFT, padx=5)
+
+        # Playback
+        self.player = Player(self.root, self.root, self.apply_event, reset=self._reset_playback,
+                             fps=FPS, speed=EVENTS_PER_FRAME, bg=COLOR_BG)
+        self.player.frame.pack(side=tk.TOP, pady=5)
+
+        self.canvas = None # Built by set_grid_size()
 
-        # Canvas
-        self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, bg=COLOR_WALL, highlightthickness=0)
+    def _build_canvas(self):
+        # A fresh canvas per size, so no items or renderer bindings carry over
+        if self.canvas is not None: self.canvas.destroy()
+        width, height = canvas_size(self.rows, self.cols, self.cell_size, WIDTH, HEIGHT)
+        self.canvas = tk.Canvas(self.root, width=width, height=height, bg=COLOR_WALL, highlightthickness=0)
         self.canvas.pack(pady=10)
+        self.cells = make_cells(self.canvas, self.rows, self.cols, self.cell_size)
+        self.root.geometry(f"{max(width, 750) + 50}x{height + 210}")
         
         # Click handler
         self.canvas.bind("<Button-1>", self.on_click)
-        self.canvas.bind("<B1-Motion>", self.on_click)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+
+    def set_grid_size(self, rows, cols):
+        """Switch to a rows x cols grid and generate a new maze for it."""
+        self.rows, self.cols = rows, cols
+        self.cell_size = self.fixed_cell_size or fit_cell_size(rows, cols, WIDTH, HEIGHT, CELL_SIZE)
+        self.start = (0, 0)
+        self.end = (rows - 1, cols - 1)
+        self.player.clear()
+        self._build_canvas()
+        self.generate_maze()
+
+    def ask_grid_size(self):
+        if self.running: return
+        rows = simpledialog.askinteger("Grid Size", "Rows:", parent=self.root, minvalue=2, initialvalue=self.rows)
+        if rows is None: return
+        cols = simpledialog.askinteger("Grid Size", "Columns:", parent=self.root, minvalue=2, initialvalue=self.cols)
+        if cols is None: return
+        self.set_grid_size(rows, cols)
 
     def on_click(self, event):
         if self.running: return
-        c = event.x // CELL_SIZE
-        r = event.y // CELL_SIZE
+        r, c = self.cells.cell_at(event.x, event.y)
         
-        if 0 <= r < ROWS and 0 <= c < COLS:
+        if self.grid.in_bounds(r, c):
             # Toggle Wall/Path/Mud cycle? Or just toggle Wall/Path manually.
             # Let's make manual click toggling Wall <-> Path for simplicity
             # Use "Add Mud" button for Mud
             if (r, c) == self.start or (r, c) == self.end: return
+            self.last_cell = (r, c)
+            self.player.clear()
             
-            if self.grid[r][c] == 1:
-                self.grid[r][c] = 0
-                self.draw_cell(r, c, COLOR_PATH)
+            if self.grid[r, c] == 1:
+                self.paths.set_cell(r, c, 0)
+                self.cells.set_base(r, c, COLOR_PATH)
             else:
-                self.grid[r][c] = 1
-                self.draw_cell(r, c, COLOR_WALL)
+                self.paths.set_cell(r, c, 1)
+                self.cells.set_base(r, c, COLOR_WALL)
+            if self.planner is not None: self.replan([(r, c)])
+
+    def on_drag(self, event):
+        # Motion events repeat within a cell; toggle it only on entry
+        if self.cells.cell_at(event.x, event.y) != self.last_cell: self.on_click(event)
 
     def reset_visuals(self):
         if self.running: return
-        self.draw_grid()
+        self.player.clear()
+        self.cells.reset()
+
+    def _reset_playback(self):
+        self.cells.reset()
+        self.header_label.config(text="Dijkstra Maze (Mud Cost = 5)")
 
     def draw_grid(self):
-        self.canvas.delete("all")
-        for r in range(ROWS):
-            for c in range(COLS):
+        colors = []
+        for r in range(self.rows):
+            for c in range(self.cols):
                 color = COLOR_PATH
-                if self.grid[r][c] == 1: color = COLOR_WALL
-                elif self.grid[r][c] == 5: color = COLOR_MUD
-                self.draw_cell(r, c, color)
+                if self.grid[r, c] == 1: color = COLOR_WALL
+                elif self.grid[r, c] == 5: color = COLOR_MUD
+                colors.append(color)
         
-        self.draw_cell(self.start[0], self.start[1], COLOR_START)
-        self.draw_cell(self.end[0], self.end[1], COLOR_END)
+        colors[self.start[0] * self.cols + self.start[1]] = COLOR_START
+        colors[self.end[0] * self.cols + self.end[1]] = COLOR_END
+        self.cells.draw(colors)
 
     def draw_cell(self, r, c, color):
-        x1 = c * CELL_SIZE
-        y1 = r * CELL_SIZE
-        x2 = x1 + CELL_SIZE
-        y2 = y1 + CELL_SIZE
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
+        self.cells.paint(r, c, color)
+
+    def set_generator(self, name):
+        """Switch to another maze generator and generate a maze with it."""
+        if self.running:
+            self.generator_var.set(self.generator)
+            return
+        self.generator = name
+        self.generate_maze_thread()
 
     def generate_maze_thread(self):
         if self.running: return
         self.running = True
+        self.player.clear()
         threading.Thread(target=self._generate_maze_logic, daemon=True).start()
 
     def generate_maze(self):
-        self.grid = [[1 for _ in range(COLS)] for _ in range(ROWS)]
-        
-        # DFS Backtracker for generation
-        stack = []
-        self.grid[0][0] = 0
-        stack.append((0, 0))
-
-        while stack:
-            r, c = stack[-1]
-            neighbors = []
-            directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-            
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS and self.grid[nr][nc] == 1:
-                    neighbors.append((nr, nc, dr, dc))
-            
-            if neighbors:
-                nr, nc, dr, dc = random.choice(neighbors)
-                wr, wc = r + dr//2, c + dc//2
-                self.grid[wr][wc] = 0
-                self.grid[nr][nc] = 0
-                stack.append((nr, nc))
-            else:
-                stack.pop()
-        
-        # Ensure end accessible
-        self.grid[ROWS-1][COLS-1] = 0
-        self.grid[ROWS-2][COLS-1] = 0 
-        self.grid[ROWS-1][COLS-2] = 0
+        self.grid = GENERATORS[self.generator](self.rows, self.cols, rng=self.rng)
+        self.paths.load(self.grid)
+        self.planner = None
 
         self.root.after(0, self.draw_grid)
         self.running = False
@@ -161,74 +211,107 @@ class DijkstraMazeApp:
 
     def add_mud(self):
         if self.running: return
+        self.player.clear()
+        self.cells.reset()
         # Randomly turn 20% of path cells into Mud
-        for r in range(ROWS):
-            for c in range(COLS):
-                if self.grid[r][c] == 0 and (r, c) != self.start and (r, c) != self.end:
-                    if random.random() < 0.2:
-                        self.grid[r][c] = 5 # Weight 5
-        self.draw_grid()
+        changed = []
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.grid[r, c] == 0 and (r, c) != self.start and (r, c) != self.end:
+                    if self.rng.random() < 0.2:
+                        self.paths.set_cell(r, c, 5) # Weight 5
+                        self.cells.set_base(r, c, COLOR_MUD)
+                        changed.append((r, c))
+        if self.planner is not None: self.replan(changed)
 
     def run_dijkstra(self):
         if self.running: return
         self.running = True
-        self.reset_visuals() # Clear old path
-        threading.Thread(target=self._dijkstra_logic, daemon=True).start()
-
-    def _dijkstra_logic(self):
-        # Priority Queue: (cost, r, c, path_list)
-        pq = [(0, self.start[0], self.start[1], [self.start])]
-        
-        # Distances
-        costs = {self.start: 0}
-        visited = set()
+        self.player.clear()
+        self.cells.reset() # Clear old path
+        self.planner = None
+        bidirectional, live = self.bidirectional.get(), self.live.get()
+        if live: self.header_label.config(text="Running Incremental Dijkstra (LPA*)...")
+        else: self.header_label.config(text=f"Running {'Bidirectional ' if bidirectional else ''}Dijkstra...")
+        threading.Thread(target=self._dijkstra_logic, args=(bidirectional, live), daemon=True).start()
 
-        while pq:
-            cost, r, c, path = heapq.heappop(pq)
-            
-            if (r, c) in visited: continue
-            visited.add((r, c))
-
-            if (r, c) == self.end:
-                self.highlight_path(path)
-                final_cost = costs[(r, c)]
-                self.header_label.config(text=f"Path Found! Total Cost: {final_cost}")
-                self.running = False
-                return
-
-            if (r, c) != self.start:
-                # visualize visit
-                if self.grid[r][c] == 5:
-                    self.color_cell_thread(r, c, "#a0522d") # Visited Mud (Slightly lighter brown?) or just blue
-                else:
-                    self.color_cell_thread(r, c, COLOR_VISITED)
-                time.sleep(0.005)
-
-            # Neighbors
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS:
-                    cell_type = self.grid[nr][nc]
-                    if cell_type != 1: # Not Wall
-                        weight = 1 if cell_type == 0 else 5
-                        new_cost = cost + weight
-                        
-                        if new_cost < costs.get((nr, nc), float('inf')):
-                            costs[(nr, nc)] = new_cost
-                            new_path = list(path)
-                            new_path.append((nr, nc))
-                            heapq.heappush(pq, (new_cost, nr, nc, new_path))
-        
+    def _dijkstra_logic(self, bidirectional=False, live=False):
+        # Solve at full speed, or reuse the log of an earlier run on this
+        # exact maze; the player animates the recorded events
+        if live:
+            # Not cached: the planner's state must follow the edits that come next
+            log = self._record_live()
+        else:
+            log = self.paths.memo(("dijkstra", bidirectional, self.start, self.end),
+                                  lambda: self._record(bidirectional))
+        self.root.after(0, lambda: self.player.load(log))
         self.running = False
 
-    def color_cell_thread(self, r, c, color):
-        self.root.after(0, lambda: self.draw_cell(r, c, color))
+    def toggle_live(self):
+        # Unticking stops repairing; the next run starts a fresh planner
+        if not self.live.get(): self.planner = None
+
+    def _record_live(self):
+        # Incremental Dijkstra (LPA* without a heuristic); replan() repairs it after each edit
+        log = EventLog()
+        planner = LPAStar(self.grid, self.start, self.end, heuristic=False)
+        result = planner.compute(on_visit=log.recorder(VISIT))
+        for r, c in result.path:
+            log.emit(PATH, r, c)
+        log.emit(DONE, result.cost)
+        self.planner = planner
+        return log
+
+    def replan(self, changed):
+        """Repair the live search after the given cells changed and show the new path at once.
+
+        Only cells the edit made inconsistent are re-expanded; they are
+        drawn as visited.
+        """
+        for r, c in changed:
+            self.planner.update_cell(r, c)
+        log = EventLog()
+        result = self.planner.compute(on_visit=log.recorder(VISIT))
+        self.cells.reset()
+        for event in log:
+            self.apply_event(event)
+        for r, c in result.path:
+            self.apply_event((PATH, r, c))
+        cost = f"Total Cost: {result.cost}" if result.cost is not None else "No Path"
+        self.header_label.config(text=f"Replanned: {cost} ({result.visited} cells repaired)")
 
-    def highlight_path(self, path):
-        for r, c in path:
+    def _record(self, bidirectional):
+        log = EventLog()
+        if bidirectional:
+            result = bidirectional_dijkstra(self.grid, self.start, self.end, on_visit=log.recorder(VISIT),
+                                            on_visit_back=log.recorder(VISIT, BACKWARD))
+        else:
+            # Served from the cached shortest-path tree of the start cell
+            result = self.paths.dijkstra(self.start, self.end, on_visit=log.recorder(VISIT))
+        for r, c in result.path:
+            log.emit(PATH, r, c)
+        log.emit(DONE, result.cost)
+        return log
+
+    def apply_event(self, event):
+        kind = event[0]
+        if kind == VISIT:
+            r, c = event[1], event[2]
+            if (r, c) == self.start or (r, c) == self.end: return
+            # visualize visit
+            if len(event) > 3: # BACKWARD
+                self.draw_cell(r, c, "#cd853f" if self.grid[r, c] == 5 else COLOR_VISITED_BACK)
+            elif self.grid[r, c] == 5:
+                self.draw_cell(r, c, "#a0522d") # Visited Mud (Slightly lighter brown?) or just blue
+            else:
+                self.draw_cell(r, c, COLOR_VISITED)
+        elif kind == PATH:
+            _, r, c = event
             if (r, c) != self.start and (r, c) != self.end:
-                self.color_cell_thread(r, c, COLOR_PATH_FINAL)
-            time.sleep(0.01)
+                self.draw_cell(r, c, COLOR_PATH_FINAL)
+        elif kind == DONE:
+            cost = event[1]
+            self.header_label.config(text=f"Path Found! Total Cost: {cost}" if cost is not None else "No Path Found")
 
 if __name__ == "__main__":
     try:
@@ -236,6 +319,15 @@ if __name__ == "__main__":
         windll.shcore.SetProcessDpiAwareness(1)
     except:
         pass
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--cols", type=int, default=COLS)
+    parser.add_argument("--cell-size", type=int, help="pixels per cell (default: fit the window)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible mazes")
+    parser.add_argument("--generator", choices=list(GENERATORS), default="Backtracker")
+    args = parser.parse_args()
+    if args.rows < 2 or args.cols < 2: parser.error("the grid needs at least 2 rows and 2 columns")
+
     root = tk.Tk()
-    app = DijkstraMazeApp(root)
+    app = DijkstraMazeApp(root, args.rows, args.cols, args.cell_size, args.seed, args.generator)
     root.mainloop()
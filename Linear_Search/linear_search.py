@@ -4,24 +4,38 @@ This module provides a small GUI to demonstrate linear search
 by animating checks over an array of integers.
 """
 
+import os
+import sys
 import tkinter as tk
-from tkinter import messagebox, simpledialog
-import random
-import time
+from tkinter import filedialog, messagebox, simpledialog
 import threading
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.bars import BarRenderer
+from algoviz.datasets import DISTRIBUTIONS, FILE_TYPES, TEXT_EXTENSIONS, generate, load_file, parse_csv
+from algoviz.events import COMPARE, DONE, PAGE, EventLog
+from algoviz.metrics import Metrics, write_csv
+from algoviz.mmapdata import MappedArray, PageMap
+from algoviz.player import Player
+
 # Configuration
 WIDTH = 800
 HEIGHT = 400
 BAR_WIDTH = 20
 DELAY = 0.5  # Seconds between steps
 
+# Playback
+FPS = round(1 / DELAY)
+EVENTS_PER_FRAME = 1
+
 # Colors
 COLOR_BG = "#ffffff"
 COLOR_BAR_DEFAULT = "#007acc"
 COLOR_BAR_CHECKING = "#ffd700"  # Gold
 COLOR_BAR_FOUND = "#28a745"     # Green
 COLOR_BAR_NOT_FOUND = "#dc3545" # Red
+COLOR_PAGE = "#e0e0e0"          # Pages of a mapped file not read yet
 COLOR_TEXT = "#000000"
 
 class LinearSearchApp:
@@ -33,13 +47,16 @@ class LinearSearchApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Linear Search Visualizer")
-        self.root.geometry("900x600")
+        self.root.geometry("1100x680")
         self.root.configure(bg=COLOR_BG)
 
-        self.data = []
-        self.bars = []
+        self.data = [] # A list, or the MappedArray of a loaded binary file
+        self.mapped = None
         self.running = False
         self.target = None
+        self.color_map = {}
+        self.metrics = Metrics() # Counts up to the event being shown
+        self.runs = [] # metrics.FIELDS rows of the finished runs, for export
 
         self._setup_ui()
         # self.generate_data() # Removed default generation
@@ -63,9 +80,16 @@ class LinearSearchApp:
         self.status_label = tk.Label(self.root, textvariable=self.status_var, font=("Segoe UI", 14), bg=COLOR_BG, fg=COLOR_TEXT)
         self.status_label.pack(pady=20)
 
-        # Canvas
-        self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, bg="#f0f0f0", highlightthickness=0)
-        self.canvas.pack(pady=10)
+        # Canvas, with the operation counts beside it
+        body = tk.Frame(self.root, bg=COLOR_BG)
+        body.pack(pady=10)
+        self.canvas = tk.Canvas(body, width=WIDTH, height=HEIGHT, bg="#f0f0f0", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT)
+        self.bars = BarRenderer(self.canvas, WIDTH, HEIGHT, COLOR_BAR_DEFAULT, COLOR_TEXT)
+        self.pages = PageMap(self.canvas, WIDTH, HEIGHT, COLOR_PAGE) # Replaces the bars for mapped files
+        self.metrics_var = tk.StringVar(value=self.metrics.summary())
+        tk.Label(body, textvariable=self.metrics_var, font=("Consolas", 10), justify=tk.LEFT, anchor="n",
+                 bg=COLOR_BG, fg=COLOR_TEXT).pack(side=tk.LEFT, fill=tk.Y, padx=15)
 
         # Controls
         controls_frame = tk.Frame(self.root, bg=COLOR_BG)
@@ -79,7 +103,12 @@ class LinearSearchApp:
         btn_style = {"bg": "#333", "fg": "white", "font": ("Segoe UI", 10, "bold"), "relief": "flat", "padx": 15, "pady": 5}
 
         tk.Button(controls_frame, text="Search", command=self.start_search, **btn_style).pack(side=tk.LEFT, padx=10)
+        self.dist_var = tk.StringVar(value=DISTRIBUTIONS[0])
+        menu = tk.OptionMenu(controls_frame, self.dist_var, *DISTRIBUTIONS)
+        menu.config(highlightthickness=0, **btn_style)
+        menu.pack(side=tk.LEFT, padx=10)
         tk.Button(controls_frame, text="Generate Random", command=self.generate_data, **btn_style).pack(side=tk.LEFT, padx=10)
+        tk.Button(controls_frame, text="Export Metrics", command=self.export_metrics, **btn_style).pack(side=tk.LEFT, padx=10)
 
         # Custom Data Section
         custom_frame = tk.Frame(self.root, bg=COLOR_BG)
@@ -88,12 +117,22 @@ class LinearSearchApp:
         self.custom_entry = tk.Entry(custom_frame, font=("Segoe UI", 10), width=30)
         self.custom_entry.pack(side=tk.LEFT, padx=5)
         tk.Button(custom_frame, text="Use Custom Data", command=self.use_custom_data, bg="#555", fg="white", relief="flat").pack(side=tk.LEFT, padx=5)
+        tk.Button(custom_frame, text="Load File", command=self.load_file, bg="#555", fg="white", relief="flat").pack(side=tk.LEFT, padx=5)
+
+        # Playback
+        self.player = Player(self.root, self.root, self.apply_event, reset=self._reset_playback,
+                             render=self.render, fps=FPS, speed=EVENTS_PER_FRAME, bg=COLOR_BG)
+        self.player.frame.pack()
 
     def generate_data(self):
         if self.running: return
-        self.data = [random.randint(10, 100) for _ in range(20)]
-        self.draw_bars(color_map={})
-        self.status_var.set("New Random Array Generated")
+        size = simpledialog.askinteger("Generate Random", "How many numbers?", parent=self.root,
+                                       minvalue=1, initialvalue=20)
+        if size is None: return
+        self.player.clear()
+        self.data = generate(self.dist_var.get(), size, low=10, high=max(100, size))
+        self.show_data()
+        self.status_var.set(f"Generated {size:,} numbers ({self.dist_var.get()})")
 
     def use_custom_data(self):
         if self.running: return
@@ -104,36 +143,53 @@ class LinearSearchApp:
         
         try:
             # Parse CSV
-            new_data = [int(x.strip()) for x in raw_data.split(',')]
-            if not new_data: raise ValueError
+            new_data = parse_csv(raw_data)
+            self.player.clear()
             self.data = new_data
-            self.draw_bars(color_map={})
+            self.show_data()
             self.status_var.set("Custom Data Loaded")
         except ValueError:
             messagebox.showerror("Error", "Invalid format. Use comma-separated integers (e.g., 10, 20, 5).")
 
-    def draw_bars(self, color_map):
-        self.canvas.delete("all")
-        c_width = WIDTH
-        c_height = HEIGHT
-        
-        x_width = c_width / len(self.data)
-        offset = 10
-        spacing = 5
-        
-        normalized_data = [i / max(self.data) for i in self.data]
+    def load_file(self):
+        # Text files are read into a list; binary ones are mapped, however large
+        if self.running: return
+        path = filedialog.askopenfilename(parent=self.root, filetypes=FILE_TYPES)
+        if not path: return
+        try:
+            if os.path.splitext(path)[1].lower() in TEXT_EXTENSIONS:
+                data = load_file(path)
+                self.player.clear()
+                self.data = data
+                self.show_data()
+                self.status_var.set(f"Loaded {len(data):,} numbers from {os.path.basename(path)}")
+                return
+            mapped = MappedArray(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.show_mapped(mapped)
+
+    def show_data(self):
+        self._unmap()
+        self.color_map = {}
+        self.bars.load(self.data)
+        self.bars.draw()
 
-        for i, height in enumerate(normalized_data):
-            x0 = i * x_width + offset + spacing
-            y0 = c_height - (height * (c_height - 50))
-            x1 = (i + 1) * x_width + offset
-            y1 = c_height
+    def show_mapped(self, mapped):
+        self.player.clear()
+        self._unmap()
+        self.mapped = self.data = mapped
+        self.color_map = {}
+        self.bars.load([]) # Hand the canvas over to the page map
+        self.pages.load(mapped.pages)
+        self.pages.draw()
+        self.status_var.set(f"Mapped {len(mapped):,} numbers ({mapped.pages:,} pages) from {os.path.basename(mapped.path)}")
 
-            val = self.data[i]
-            color = color_map.get(i, COLOR_BAR_DEFAULT)
-            
-            self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="")
-            self.canvas.create_text(x0 + (x1-x0)/2, y0 - 15, text=str(val), font=("Segoe UI", 10, "bold"), fill=COLOR_TEXT)
+    def _unmap(self):
+        if self.mapped is None: return
+        self.mapped.close()
+        self.mapped = None
 
     def start_search(self):
         if self.running: return
@@ -144,27 +200,86 @@ class LinearSearchApp:
         
         self.target = int(target_str)
         self.running = True
+        self.player.clear()
+        self.pages.reset()
+        self.metrics = Metrics()
         threading.Thread(target=self.linear_search, daemon=True).start()
 
     def linear_search(self):
-        for i, val in enumerate(self.data):
-            self.status_var.set(f"Checking index {i}: Is {val} == {self.target}?")
-            
-            # Highlight checking
-            self.update_ui({i: COLOR_BAR_CHECKING})
-            time.sleep(DELAY)
-
-            if val == self.target:
-                self.status_var.set(f"Found {self.target} at index {i}!")
-                self.update_ui({i: COLOR_BAR_FOUND})
-                self.running = False
-                return
+        log = EventLog()
+        found = None
+        if self.mapped is not None:
+            found = self.mapped.find(self.target, log.recorder(PAGE))
+        else:
+            for i, val in enumerate(self.data):
+                log.emit(COMPARE, i)
+                if val == self.target:
+                    found = i
+                    break
+        log.emit(DONE, found)
 
-        self.status_var.set(f"Value {self.target} not found in array.")
+        metrics = Metrics()
+        for event in log:
+            self.count_event(metrics, event)
         self.running = False
+        self.root.after(0, self.runs.append, metrics.row("Linear Search", len(self.data)))
+        self.root.after(0, lambda: self.player.load(log))
+
+    def count_event(self, metrics, event):
+        if event[0] == COMPARE: metrics.compare(event[1]) # data[i] against the target
+        elif event[0] == DONE and self.mapped is not None:
+            # A mapped scan reports pages, having compared every item up to the match
+            i = event[1]
+            metrics.compares = metrics.reads = len(self.data) if i is None else i + 1
+
+    def export_metrics(self):
+        if not self.runs:
+            self.status_var.set("No finished runs to export yet.")
+            return
+        filename = filedialog.asksaveasfilename(parent=self.root, defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv")])
+        if not filename: return
+        with open(filename, "w", newline="") as out:
+            write_csv(self.runs, out)
+        self.status_var.set(f"Exported {len(self.runs)} runs to {filename}")
+
+    # --- Playback ---
+    def apply_event(self, event):
+        self.count_event(self.metrics, event)
+        kind = event[0]
+        if kind == COMPARE:
+            i = event[1]
+            self.status_var.set(f"Checking index {i}: Is {self.data[i]} == {self.target}?")
+            self.color_map = {i: COLOR_BAR_CHECKING}
+        elif kind == PAGE:
+            _, first, last = event
+            self.status_var.set(f"Scanning pages {first:,}-{last:,} of {self.pages.pages:,} for {self.target}")
+            self.pages.touch(first, last, COLOR_BAR_CHECKING)
+        elif kind == DONE:
+            i = event[1]
+            if i is None:
+                self.status_var.set(f"Value {self.target} not found in array.")
+            else:
+                self.status_var.set(f"Found {self.target} at index {i}!")
+                self.color_map = {i: COLOR_BAR_FOUND}
+                if self.mapped is not None:
+                    page = self.mapped.page_of(i)
+                    self.pages.touch(page, page, COLOR_BAR_FOUND)
+
+    def render(self):
+        if self.mapped is not None:
+            self.pages.draw()
+            self.metrics_var.set(f"{self.metrics.summary()}\n\n"
+                                 f"Pages read {self.pages.touched:>12,}\n"
+                                 f"of         {self.pages.pages:>12,}")
+            return
+        self.bars.draw(self.color_map)
+        self.metrics_var.set(self.metrics.summary())
 
-    def update_ui(self, color_map):
-        self.root.after(0, lambda: self.draw_bars(color_map))
+    def _reset_playback(self):
+        self.metrics.reset()
+        self.pages.reset()
+        self.color_map = {}
 
 if __name__ == "__main__":
     try:
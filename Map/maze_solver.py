@@ -4,17 +4,27 @@ Provides a simple Tkinter-based maze generator (DFS backtracker)
 and visual BFS/DFS solvers for demonstration and teaching.
 """
 
+import argparse
+import os
+import sys
 import tkinter as tk
+from tkinter import simpledialog
 import random
 import threading
-import time
-from collections import deque
 
-# Configuration
-CELL_SIZE = 25
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoviz.cells import canvas_size, fit_cell_size, make_cells
+from algoviz.events import PATH, VISIT, EventLog, interleave
+from algoviz.mazegen import GENERATORS
+from algoviz.pathfinding import solve
+from algoviz.player import Player
+
+# Configuration (defaults; see --rows/--cols/--cell-size and "Grid Size")
+CELL_SIZE = 25   # Largest cell size; bigger grids shrink their cells to fit
 COLS = 25
 ROWS = 25
-WIDTH = COLS * CELL_SIZE
+WIDTH = COLS * CELL_SIZE   # Largest canvas area
 HEIGHT = ROWS * CELL_SIZE
 
 # Colors
@@ -26,28 +36,34 @@ COLOR_VISITED = "#add8e6"    # Light Blue
 COLOR_PATH_FINAL = "#ffff00" # Yellow for the solution path
 COLOR_BG = "#f0f0f0"
 
+# Playback
+FPS = 60
+EVENTS_PER_FRAME = 1
+
 class MazeApp:
     """Main application class for maze generation and visualization.
 
     Attributes:
         root: The Tk root window.
-        grid: 2D grid representing walls (1) and paths (0).
+        rows, cols: Grid dimensions.
+        cell_size: Pixels per cell (fractional when zoomed out).
+        grid: Flat Grid of walls (1) and paths (0).
         start: Tuple for start cell coordinates (row, col).
         end: Tuple for end cell coordinates (row, col).
     """
-    def __init__(self, root):
+    def __init__(self, root, rows=ROWS, cols=COLS, cell_size=None, seed=None, generator="Backtracker"):
         self.root = root
         self.root.title("Maze Generator & Solver")
-        self.root.geometry(f"{WIDTH + 50}x{HEIGHT + 100}")
         self.root.configure(bg=COLOR_BG)
 
-        self.grid = [] # 2D array: 1 = Wall, 0 = Path
-        self.start = (0, 0)
-        self.end = (ROWS - 1, COLS - 1)
+        self.fixed_cell_size = cell_size # None = fit to WIDTH x HEIGHT
+        self.rng = random.Random(seed) # Drives maze generation
+        self.dfs_rng = random.Random(seed) # DFS's neighbor order, kept apart so solving never shifts later mazes
+        self.generator = generator # Key of GENERATORS
         self.running = False
 
         self._setup_ui()
-        self.generate_maze()
+        self.set_grid_size(rows, cols)
 
     def _setup_ui(self):
         # Controls Header
@@ -56,87 +72,90 @@ class MazeApp:
 
         btn_style = {"bg": "#007acc", "fg": "white", "font": ("Segoe UI", 10, "bold"), "relief": "flat", "padx": 10}
         
+        self.generator_var = tk.StringVar(value=self.generator)
+        menu = tk.OptionMenu(self.controls_frame, self.generator_var, *GENERATORS, command=self.set_generator)
+        menu.config(highlightthickness=0, **btn_style)
+        menu.pack(side=tk.LEFT, padx=10)
         tk.Button(self.controls_frame, text="Generate Maze", command=self.generate_maze_thread, **btn_style).pack(side=tk.LEFT, padx=10)
         tk.Button(self.controls_frame, text="Start BFS", command=lambda: self.run_search("BFS"), **btn_style).pack(side=tk.LEFT, padx=10)
         tk.Button(self.controls_frame, text="Start DFS", command=lambda: self.run_search("DFS"), **btn_style).pack(side=tk.LEFT, padx=10)
         tk.Button(self.controls_frame, text="Compare BFS & DFS", command=self.open_compare_window, **btn_style).pack(side=tk.LEFT, padx=10)
         tk.Button(self.controls_frame, text="Reset", command=self.reset_visuals, **btn_style).pack(side=tk.LEFT, padx=10)
+        tk.Button(self.controls_frame, text="Grid Size", command=self.ask_grid_size, **btn_style).pack(side=tk.LEFT, padx=10)
         tk.Label(self.controls_frame, text="Map Visualizer", bg=COLOR_BG, font=("Segoe UI", 12, "bold")).pack(side=tk.RIGHT, padx=20)
 
-        # Canvas
-        self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, bg=COLOR_WALL, highlightthickness=0)
+        # Playback
+        self.player = Player(self.root, self.root, self.apply_event, reset=lambda: self.cells.reset(),
+                             fps=FPS, speed=EVENTS_PER_FRAME, bg=COLOR_BG)
+        self.player.frame.pack(side=tk.TOP)
+
+        self.canvas = None # Built by set_grid_size()
+
+    def _build_canvas(self):
+        # A fresh canvas per size, so no items or renderer bindings carry over
+        if self.canvas is not None: self.canvas.destroy()
+        width, height = canvas_size(self.rows, self.cols, self.cell_size, WIDTH, HEIGHT)
+        self.canvas = tk.Canvas(self.root, width=width, height=height, bg=COLOR_WALL, highlightthickness=0)
         self.canvas.pack(pady=10)
+        self.cells = make_cells(self.canvas, self.rows, self.cols, self.cell_size)
+        self.root.geometry(f"{max(width, 900) + 50}x{height + 160}")
+
+    def set_grid_size(self, rows, cols):
+        """Switch to a rows x cols grid and generate a new maze for it."""
+        self.rows, self.cols = rows, cols
+        self.cell_size = self.fixed_cell_size or fit_cell_size(rows, cols, WIDTH, HEIGHT, CELL_SIZE)
+        self.start = (0, 0)
+        self.end = (rows - 1, cols - 1)
+        self.player.clear()
+        self._build_canvas()
+        self.generate_maze()
+
+    def ask_grid_size(self):
+        if self.running: return
+        rows = simpledialog.askinteger("Grid Size", "Rows:", parent=self.root, minvalue=2, initialvalue=self.rows)
+        if rows is None: return
+        cols = simpledialog.askinteger("Grid Size", "Columns:", parent=self.root, minvalue=2, initialvalue=self.cols)
+        if cols is None: return
+        self.set_grid_size(rows, cols)
 
     def reset_visuals(self):
         if self.running: return
-        self.draw_grid()
+        self.player.clear()
+        self.cells.reset()
 
     def draw_grid(self):
-        self.canvas.delete("all")
-        self._draw_grid_on_canvas(self.canvas)
-
-    def _draw_grid_on_canvas(self, canvas):
-        for r in range(ROWS):
-            for c in range(COLS):
-                color = COLOR_WALL if self.grid[r][c] == 1 else COLOR_PATH
-                self._draw_cell_on_canvas(canvas, r, c, color)
+        self.cells.draw(self.cell_colors())
+
+    def cell_colors(self):
+        colors = []
+        for r in range(self.rows):
+            for c in range(self.cols):
+                colors.append(COLOR_WALL if self.grid[r, c] == 1 else COLOR_PATH)
         
-        # Draw Start/End
-        self._draw_cell_on_canvas(canvas, self.start[0], self.start[1], COLOR_START)
-        self._draw_cell_on_canvas(canvas, self.end[0], self.end[1], COLOR_END)
+        # Start/End
+        colors[self.start[0] * self.cols + self.start[1]] = COLOR_START
+        colors[self.end[0] * self.cols + self.end[1]] = COLOR_END
+        return colors
 
     def draw_cell(self, r, c, color):
-        self._draw_cell_on_canvas(self.canvas, r, c, color)
+        self.cells.paint(r, c, color)
 
-    def _draw_cell_on_canvas(self, canvas, r, c, color):
-        x1 = c * CELL_SIZE
-        y1 = r * CELL_SIZE
-        x2 = x1 + CELL_SIZE
-        y2 = y1 + CELL_SIZE
-        canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
+    def set_generator(self, name):
+        """Switch to another maze generator and generate a maze with it."""
+        if self.running:
+            self.generator_var.set(self.generator)
+            return
+        self.generator = name
+        self.generate_maze_thread()
 
     def generate_maze_thread(self):
         if self.running: return
         self.running = True
+        self.player.clear()
         threading.Thread(target=self._generate_maze_logic, daemon=True).start()
 
     def generate_maze(self):
-        # Initialize grid with walls
-        self.grid = [[1 for _ in range(COLS)] for _ in range(ROWS)]
-        
-        # Iterative Randomized Prim's / DFS for maze generation
-        # Let's use DFS Backtracker for nice long corridors
-        stack = []
-        start_cell = (0, 0)
-        self.grid[0][0] = 0
-        stack.append(start_cell)
-
-        while stack:
-            r, c = stack[-1]
-            
-            # Find unvisited neighbors (distance 2 away)
-            neighbors = []
-            directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-            
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS and self.grid[nr][nc] == 1:
-                    neighbors.append((nr, nc, dr, dc))
-            
-            if neighbors:
-                nr, nc, dr, dc = random.choice(neighbors)
-                # Knock down wall between
-                wr, wc = r + dr//2, c + dc//2
-                self.grid[wr][wc] = 0
-                self.grid[nr][nc] = 0
-                stack.append((nr, nc))
-            else:
-                stack.pop()
-        
-        # Ensure end is accessible (sometimes basic algo leaves it walled if COLS/ROWS are even)
-        self.grid[ROWS-1][COLS-1] = 0
-        self.grid[ROWS-2][COLS-1] = 0 
-        self.grid[ROWS-1][COLS-2] = 0
+        self.grid = GENERATORS[self.generator](self.rows, self.cols, rng=self.rng)
 
         self.root.after(0, self.draw_grid)
         self.running = False
@@ -149,76 +168,48 @@ class MazeApp:
     def run_search(self, algo_type):
         if self.running: return
         self.running = True
-        # Redraw to clear previous paths
-        self.draw_grid()
+        self.player.clear()
+        # Clear previous paths
+        self.cells.reset()
         
-        threading.Thread(target=self._solve_logic, args=(algo_type, self.canvas, self._on_search_complete), daemon=True).start()
-    
-    def _on_search_complete(self):
+        threading.Thread(target=self._search_logic, args=(algo_type,), daemon=True).start()
+
+    def _search_logic(self, algo_type):
+        log = self._solve_logic(algo_type)
+        self.root.after(0, lambda: self.player.load(log))
         self.running = False
 
     def open_compare_window(self):
         if self.running: return
-        CompareWindow(self.root, self.grid, self.start, self.end, self.draw_cell, self._solve_logic)
-
-    def _solve_logic(self, algo_type, target_canvas, on_complete=None):
-        q = deque() if algo_type == "BFS" else [] # Stack for DFS
-        q.append((self.start, [self.start]))
-        visited = set()
-        visited.add(self.start)
-
-        while q:
-            if algo_type == "BFS":
-                (r, c), path = q.popleft()
-            else:
-                try:
-                    (r, c), path = q.pop()
-                except IndexError: break # Stack empty
-
-            if (r, c) == self.end:
-                self.highlight_path(path, target_canvas)
-                if on_complete: on_complete()
-                return
-
-            if (r, c) != self.start:
-                self.color_cell_thread(r, c, COLOR_VISITED, target_canvas)
-                time.sleep(0.015) # Speed of animation
-
-            neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-            if algo_type == "DFS": random.shuffle(neighbors)
-
-            for dr, dc in neighbors:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < ROWS and 0 <= nc < COLS:
-                    if self.grid[nr][nc] == 0 and (nr, nc) not in visited:
-                        visited.add((nr, nc))
-                        new_path = list(path)
-                        new_path.append((nr, nc))
-                        q.append(((nr, nc), new_path))
-        
-        if on_complete: on_complete()
-
-    def color_cell_thread(self, r, c, color, canvas):
-        try:
-            self.root.after(0, lambda: self._draw_cell_on_canvas(canvas, r, c, color))
-        except: pass
-
-    def highlight_path(self, path, canvas):
-        for r, c in path:
-            if (r, c) != self.start and (r, c) != self.end:
-                self.color_cell_thread(r, c, COLOR_PATH_FINAL, canvas)
-            time.sleep(0.01)
+        CompareWindow(self.root, self.rows, self.cols, self.cell_size, self.cell_colors(),
+                      self._apply_on_cells, self._solve_logic)
+
+    def _solve_logic(self, algo_type):
+        """Run algo_type at full speed and return its event log."""
+        log = EventLog()
+        result = solve(algo_type, self.grid, self.start, self.end, on_visit=log.recorder(VISIT), rng=self.dfs_rng)
+        for r, c in result.path:
+            log.emit(PATH, r, c)
+        return log
+
+    def apply_event(self, event):
+        self._apply_on_cells(self.cells, event)
+
+    def _apply_on_cells(self, cells, event):
+        kind, r, c = event
+        if (r, c) == self.start or (r, c) == self.end: return
+        color = COLOR_VISITED if kind == VISIT else COLOR_PATH_FINAL
+        cells.paint(r, c, color)
 
 class CompareWindow:
-    def __init__(self, master, grid, start, end, draw_func, solve_func):
+    def __init__(self, master, rows, cols, cell_size, colors, apply_func, solve_func):
         self.top = tk.Toplevel(master)
         self.top.title("BFS vs DFS Comparison")
-        self.top.geometry(f"{WIDTH*2 + 80}x{HEIGHT + 100}")
+        width, height = canvas_size(rows, cols, cell_size, WIDTH, HEIGHT)
+        self.top.geometry(f"{width*2 + 80}x{height + 160}")
         self.top.configure(bg=COLOR_BG)
         
-        self.grid = grid
-        self.start = start
-        self.end = end
+        self.colors = colors # Snapshot of the main maze, start/end included
         
         # Reuse logic from main app (hacky but effective for simple script)
         # We need a reference to the main app instance methods if they were static, but they are instance.
@@ -230,6 +221,7 @@ class CompareWindow:
         # This is fine since grids are identical.
         
         self.solve_func = solve_func
+        self.apply_func = apply_func
         
         # Layout
         frame = tk.Frame(self.top, bg=COLOR_BG)
@@ -238,42 +230,46 @@ class CompareWindow:
         # Left (BFS)
         self.lbl_bfs = tk.Label(frame, text="Breadth-First Search (BFS)", bg=COLOR_BG, font=("Segoe UI", 12, "bold"))
         self.lbl_bfs.grid(row=0, column=0)
-        self.canvas_bfs = tk.Canvas(frame, width=WIDTH, height=HEIGHT, bg=COLOR_WALL, highlightthickness=0)
+        self.canvas_bfs = tk.Canvas(frame, width=width, height=height, bg=COLOR_WALL, highlightthickness=0)
         self.canvas_bfs.grid(row=1, column=0, padx=10)
+        self.cells_bfs = make_cells(self.canvas_bfs, rows, cols, cell_size)
         
         # Right (DFS)
         self.lbl_dfs = tk.Label(frame, text="Depth-First Search (DFS)", bg=COLOR_BG, font=("Segoe UI", 12, "bold"))
         self.lbl_dfs.grid(row=0, column=1)
-        self.canvas_dfs = tk.Canvas(frame, width=WIDTH, height=HEIGHT, bg=COLOR_WALL, highlightthickness=0)
+        self.canvas_dfs = tk.Canvas(frame, width=width, height=height, bg=COLOR_WALL, highlightthickness=0)
         self.canvas_dfs.grid(row=1, column=1, padx=10)
+        self.cells_dfs = make_cells(self.canvas_dfs, rows, cols, cell_size)
+
+        # Playback (both searches share one timeline)
+        self.player = Player(self.top, frame, self.apply_event, reset=self.reset_both,
+                             fps=FPS, speed=EVENTS_PER_FRAME * 2, bg=COLOR_BG)
+        self.player.frame.grid(row=2, column=0, columnspan=2, pady=10)
         
         # Draw Initial Grids
-        self.draw_initial(self.canvas_bfs)
-        self.draw_initial(self.canvas_dfs)
+        self.draw_both()
         
         # Start Race
         self.start_race()
 
-    def draw_initial(self, canvas):
-        # We need to draw the main grid onto these canvases
-        # Can't use main app draw_grid cause it targets self.canvas
-        # We'll use the _draw_cell_on_canvas if we can access it or just manual loop
-        for r in range(ROWS):
-            for c in range(COLS):
-                color = COLOR_WALL if self.grid[r][c] == 1 else COLOR_PATH
-                x1, y1 = c * CELL_SIZE, r * CELL_SIZE
-                canvas.create_rectangle(x1, y1, x1+CELL_SIZE, y1+CELL_SIZE, fill=color, outline="")
-        
-        # Start/End
-        sx, sy = self.start[1]*CELL_SIZE, self.start[0]*CELL_SIZE
-        canvas.create_rectangle(sx, sy, sx+CELL_SIZE, sy+CELL_SIZE, fill=COLOR_START, outline="")
-        ex, ey = self.end[1]*CELL_SIZE, self.end[0]*CELL_SIZE
-        canvas.create_rectangle(ex, ey, ex+CELL_SIZE, ey+CELL_SIZE, fill=COLOR_END, outline="")
+    def draw_both(self):
+        self.cells_bfs.draw(self.colors)
+        self.cells_dfs.draw(self.colors)
+
+    def reset_both(self):
+        self.cells_bfs.reset()
+        self.cells_dfs.reset()
 
     def start_race(self):
-        # Run both in threads
-        threading.Thread(target=self.solve_func, args=("BFS", self.canvas_bfs), daemon=True).start()
-        threading.Thread(target=self.solve_func, args=("DFS", self.canvas_dfs), daemon=True).start()
+        threading.Thread(target=self._race_logic, daemon=True).start()
+
+    def _race_logic(self):
+        log = interleave(self.solve_func("BFS"), self.solve_func("DFS"))
+        self.top.after(0, lambda: self.player.load(log))
+
+    def apply_event(self, item):
+        lane, event = item
+        self.apply_func(self.cells_dfs if lane else self.cells_bfs, event)
 
 
 if __name__ == "__main__":
@@ -282,6 +278,15 @@ if __name__ == "__main__":
         windll.shcore.SetProcessDpiAwareness(1)
     except:
         pass
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--cols", type=int, default=COLS)
+    parser.add_argument("--cell-size", type=int, help="pixels per cell (default: fit the window)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible mazes")
+    parser.add_argument("--generator", choices=list(GENERATORS), default="Backtracker")
+    args = parser.parse_args()
+    if args.rows < 2 or args.cols < 2: parser.error("the grid needs at least 2 rows and 2 columns")
+
     root = tk.Tk()
-    app = MazeApp(root)
+    app = MazeApp(root, args.rows, args.cols, args.cell_size, args.seed, args.generator)
     root.mainloop()
@@ -0,0 +1,6 @@
+"""Shared, GUI-independent building blocks for the visualizers.
+
+The apps in the top-level folders (``Dijkstra/``, ``A_Star/``, ``Map/``,
+``Comparison/`` ...) stay runnable as plain scripts; the algorithm code
+they share lives here so it can also be imported and run headless.
+"""
@@ -0,0 +1,204 @@
+"""All-pairs shortest paths for the weighted graph apps.
+
+Two engines, picked by edge density:
+
+* Floyd–Warshall for dense graphs, O(n^3). With NumPy installed each
+  of the n relaxation rounds is one vectorized min over the matrix;
+  without it a plain triple loop runs.
+* Dijkstra from every source for sparse graphs, O(n m log n). Sources
+  are independent, so large graphs split them across a process pool.
+
+Both return a ShortestPaths table: the distance matrix plus a next-hop
+matrix, from which any path is read off in O(length) without
+searching again.
+
+Graphs are given as a node count and (i, j, weight) edges over node
+indices 0..n-1; edges are undirected.
+"""
+
+import csv
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .pqueue import IndexedHeap
+
+try:
+    import numpy as np
+except ImportError: # Optional: Floyd–Warshall falls back to pure Python
+    np = None
+
+INF = math.inf
+DENSE_THRESHOLD = 0.25 # Edge density (m over n(n-1)/2) from which Floyd–Warshall is used
+POOL_MIN_NODES = 256   # Below this, starting worker processes costs more than it saves
+METHODS = ("auto", "floyd", "dijkstra")
+
+
+class ShortestPaths:
+    """Distances and next hops between every pair of nodes.
+
+    Attributes:
+        dist: n x n list of lists; dist[i][j] is INF when j is unreachable.
+        next: n x n list of lists; next[i][j] is the node after i on a
+            shortest path to j (i itself when i == j, -1 if unreachable).
+        method: "floyd" or "dijkstra", the engine that built the table.
+    """
+    def __init__(self, dist, next_hop, method):
+        self.dist = dist
+        self.next = next_hop
+        self.method = method
+
+    def __len__(self):
+        return len(self.dist)
+
+    def distance(self, i, j):
+        return self.dist[i][j]
+
+    def path(self, i, j):
+        """Node indices of a shortest path from i to j ([] if unreachable)."""
+        if self.next[i][j] < 0: return []
+        path = [i]
+        while i != j:
+            i = self.next[i][j]
+            path.append(i)
+        return path
+
+    def write_csv(self, out, labels=None):
+        """Write one row per ordered pair: source, target, distance, next_hop.
+
+        labels maps node indices to the names written (default: the
+        indices); unreachable pairs get an empty distance and next hop.
+        """
+        labels = labels or range(len(self))
+        writer = csv.writer(out)
+        writer.writerow(["source", "target", "distance", "next_hop"])
+        for i, (row, hops) in enumerate(zip(self.dist, self.next)):
+            for j, (d, hop) in enumerate(zip(row, hops)):
+                if hop < 0: writer.writerow([labels[i], labels[j], "", ""])
+                else: writer.writerow([labels[i], labels[j], d, labels[hop]])
+
+
+def graph_edges(graph):
+    """(n, edges) for a Graph: node indices follow graph.nodes."""
+    index = {node: k for k, node in enumerate(graph.nodes)}
+    return len(index), [(index[e.source], index[e.destination], e.weight) for e in graph.edges]
+
+
+def density(n, edges):
+    return 2 * len(edges) / (n * (n - 1)) if n > 1 else 1.0
+
+
+def floyd_warshall(n, edges):
+    """All pairs by Floyd–Warshall; vectorized when NumPy is available."""
+    if np is not None:
+        dist = np.full((n, n), INF)
+        hop = np.full((n, n), -1, dtype=np.int64)
+        diagonal = np.arange(n)
+        dist[diagonal, diagonal] = 0
+        hop[diagonal, diagonal] = diagonal
+        for i, j, w in edges:
+            if w < dist[i, j]:
+                dist[i, j] = dist[j, i] = w
+                hop[i, j], hop[j, i] = j, i
+        for k in range(n):
+            via = dist[:, k, None] + dist[None, k, :]
+            better = via < dist
+            np.minimum(dist, via, out=dist)
+            hop = np.where(better, hop[:, k, None], hop)
+        dist = [[d if d == INF else _number(d) for d in row] for row in dist.tolist()]
+        return ShortestPaths(dist, hop.tolist(), "floyd")
+
+    dist = [[INF] * n for _ in range(n)]
+    hop = [[-1] * n for _ in range(n)]
+    for i in range(n):
+        dist[i][i] = 0
+        hop[i][i] = i
+    for i, j, w in edges:
+        if w < dist[i][j]:
+            dist[i][j] = dist[j][i] = w
+            hop[i][j], hop[j][i] = j, i
+    for k in range(n):
+        dist_k = dist[k]
+        for i in range(n):
+            dist_i = dist[i]
+            d_ik = dist_i[k]
+            if d_ik == INF: continue
+            hop_i = hop[i]
+            hop_ik = hop_i[k]
+            for j in range(n):
+                d = d_ik + dist_k[j]
+                if d < dist_i[j]:
+                    dist_i[j] = d
+                    hop_i[j] = hop_ik
+    return ShortestPaths(dist, hop, "floyd")
+
+
+def _number(d):
+    # NumPy works in floats; give integer weights their ints back
+    return int(d) if d.is_integer() else d
+
+
+def _adjacency(n, edges):
+    adjacency = [[] for _ in range(n)]
+    for i, j, w in edges:
+        adjacency[i].append((j, w))
+        adjacency[j].append((i, w))
+    return adjacency
+
+
+def _dijkstra_rows(n, adjacency, sources):
+    # One (dist, next-hop) row per source; runs in worker processes
+    rows = []
+    for s in sources:
+        dist = [INF] * n
+        first = [-1] * n # First hop from s toward each node
+        dist[s] = 0
+        first[s] = s
+        pq = IndexedHeap(n)
+        pq.push(0, s)
+        while pq:
+            d, u = pq.pop()
+            for v, w in adjacency[u]:
+                new_dist = d + w
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    first[v] = v if u == s else first[u]
+                    pq.push(new_dist, v)
+        rows.append((dist, first))
+    return rows
+
+
+def repeated_dijkstra(n, edges, processes=None):
+    """All pairs by Dijkstra from every source.
+
+    Graphs of at least POOL_MIN_NODES nodes spread the sources over
+    processes worker processes (default: one per CPU).
+    """
+    adjacency = _adjacency(n, edges)
+    processes = processes or os.cpu_count() or 1
+    if n < POOL_MIN_NODES or processes < 2:
+        rows = _dijkstra_rows(n, adjacency, range(n))
+    else:
+        # Spawned, not forked: the apps call this from a thread next to Tk
+        chunks = [range(k, n, processes * 4) for k in range(processes * 4)]
+        with ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_dijkstra_rows, [n] * len(chunks), [adjacency] * len(chunks), chunks))
+        rows = [None] * n
+        for chunk, part in zip(chunks, parts):
+            for s, row in zip(chunk, part):
+                rows[s] = row
+    return ShortestPaths([dist for dist, _ in rows], [first for _, first in rows], "dijkstra")
+
+
+def all_pairs(n, edges, method="auto", processes=None):
+    """ShortestPaths for an undirected graph of n nodes.
+
+    method is one of METHODS; "auto" runs Floyd–Warshall once the edge
+    density reaches DENSE_THRESHOLD and repeated Dijkstra below it.
+    """
+    if method == "auto":
+        method = "floyd" if density(n, edges) >= DENSE_THRESHOLD else "dijkstra"
+    if method == "floyd": return floyd_warshall(n, edges)
+    if method == "dijkstra": return repeated_dijkstra(n, edges, processes)
+    raise ValueError(f"unknown method {method!r}")
@@ -0,0 +1,150 @@
+"""Incremental bar-chart rendering for the sort and search visualizers.
+
+Bars are canvas items created once per array and afterwards only moved
+(when their value changed) or recolored (when their color changed);
+the scale comes from the array's maximum, computed when it is loaded
+rather than on every frame. A frame therefore costs O(changed bars).
+
+Past BAR_LIMIT values a bar per element is no longer readable or
+cheap, so the chart switches to one column per pixel. Each column
+aggregates the values that fall into it: a solid line up to their
+minimum and a lighter one from the minimum to the maximum. A sorted
+stretch draws as ordinary bars, an unsorted one as a light band, so
+million-element arrays stay legible with a fixed number of items.
+"""
+
+BAR_LIMIT = 1000   # Longest array drawn with one rectangle per element
+LABEL_LIMIT = 60   # Longest array that also gets a value label per bar
+SPACING = 5        # Gap between bars in pixels (less when bars are thin)
+COLOR_RANGE = "#9ecae1" # Min-to-max part of an unmarked pixel column
+
+
+class BarRenderer:
+    """Bar chart of a list of numbers, updated in place.
+
+    Call load() for a new (or reset) array, changed() for positions the
+    caller wrote, and draw() once per frame with the colors to show.
+
+    Attributes:
+        canvas: The Tk canvas drawn on.
+        data: The list shown (kept by reference, not copied).
+        columns: Number of pixel columns, or None when drawing bars.
+    """
+    def __init__(self, canvas, width, height, color, text_color="#000000", offset=10, top_margin=50):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.color = color
+        self.text_color = text_color
+        self.offset = offset
+        self.top_margin = top_margin
+        self.data = []
+        self.columns = None
+        self._items = []  # Rectangles, or (solid, range) line pairs per column
+        self._labels = []
+        self._shown = []  # Color shown per bar or column
+        self._pending = set() # Bars or columns whose geometry is stale
+        self._scale = 1.0
+
+    def load(self, data):
+        """Show data. Items are reused when only the values changed."""
+        n = len(data)
+        same_shape = n == len(self.data) and self._items
+        self.data = data
+        top = max(data, default=1)
+        self._scale = (self.height - self.top_margin) / (top if top > 0 else 1)
+        if same_shape:
+            self._pending.update(range(len(self._items)))
+            return
+
+        self.canvas.delete("all")
+        self._items, self._labels, self._pending = [], [], set()
+        if not n: return
+        if n <= BAR_LIMIT:
+            self.columns = None
+            create = self.canvas.create_rectangle
+            self._items = [create(*self._bar(i), fill=self.color, outline="") for i in range(n)]
+            if n <= LABEL_LIMIT:
+                text = self.canvas.create_text
+                self._labels = [text(0, 0, font=("Segoe UI", 10, "bold"), fill=self.text_color) for _ in range(n)]
+                self._pending.update(range(n))
+        else:
+            self.columns = min(n, self.width - 2 * self.offset)
+            line = self.canvas.create_line
+            thickness = max(1, (self.width - 2 * self.offset) / self.columns)
+            self._items = [(line(0, 0, 0, 0, fill=self.color, width=thickness),
+                            line(0, 0, 0, 0, fill=COLOR_RANGE, width=thickness)) for _ in range(self.columns)]
+            self._pending.update(range(self.columns))
+        self._shown = [self.color] * len(self._items)
+
+    def changed(self, *indices):
+        """Positions whose values the caller has written since the last draw()."""
+        if self.columns is None: self._pending.update(indices)
+        else: self._pending.update(i * self.columns // len(self.data) for i in indices)
+
+    def draw(self, marks=None, spans=(), default=None):
+        """Bring the canvas up to date.
+
+        Every bar gets default (the bar color if None), then each
+        (first, last, color) of spans over positions first..last, then
+        marks, a {position: color} dict. Only bars whose geometry or
+        color changed reach Tk.
+        """
+        if not self._items: return
+        pending, self._pending = self._pending, set()
+        if self.columns is None: self._draw_bars(pending, marks or {}, spans, default or self.color)
+        else: self._draw_columns(pending, marks or {}, spans, default or self.color)
+
+    def _y(self, value):
+        return min(self.height, max(0, self.height - value * self._scale))
+
+    def _bar(self, i):
+        step = (self.width - 2 * self.offset) / len(self.data)
+        x0 = self.offset + i * step
+        return (x0 + min(SPACING, step / 4), self._y(self.data[i]), x0 + step, self.height)
+
+    def _draw_bars(self, pending, marks, spans, default):
+        canvas, items, labels, data = self.canvas, self._items, self._labels, self.data
+        for i in pending:
+            x0, y0, x1, y1 = self._bar(i)
+            canvas.coords(items[i], x0, y0, x1, y1)
+            if labels:
+                canvas.coords(labels[i], (x0 + x1) / 2, y0 - 15)
+                canvas.itemconfig(labels[i], text=str(data[i]))
+
+        wanted = [default] * len(items)
+        for first, last, color in spans:
+            wanted[first:last + 1] = [color] * (last + 1 - first)
+        for i, color in marks.items():
+            wanted[i] = color
+        shown = self._shown
+        for i, color in enumerate(wanted):
+            if shown[i] != color:
+                canvas.itemconfig(items[i], fill=color)
+                shown[i] = color
+
+    def _draw_columns(self, pending, marks, spans, default):
+        canvas, items, data, columns = self.canvas, self._items, self.data, self.columns
+        n = len(data)
+        step = (self.width - 2 * self.offset) / columns
+        for c in pending:
+            chunk = data[c * n // columns:(c + 1) * n // columns]
+            x = self.offset + (c + 0.5) * step
+            low, high = self._y(min(chunk)), self._y(max(chunk))
+            solid, band = items[c]
+            canvas.coords(solid, x, self.height, x, low)
+            canvas.coords(band, x, low, x, high)
+
+        wanted = [default] * columns
+        for first, last, color in spans:
+            c0, c1 = first * columns // n, last * columns // n
+            wanted[c0:c1 + 1] = [color] * (c1 + 1 - c0)
+        for i, color in marks.items():
+            wanted[i * columns // n] = color
+        shown = self._shown
+        for c, color in enumerate(wanted):
+            if shown[c] != color:
+                solid, band = items[c]
+                canvas.itemconfig(solid, fill=color)
+                canvas.itemconfig(band, fill=COLOR_RANGE if color == self.color else color)
+                shown[c] = color
@@ -0,0 +1,124 @@
+"""Headless batch runner and benchmark for the maze solvers.
+
+Generates seeded mazes with the same generators the apps use
+(algoviz.mazegen), optionally sprinkles mud, runs every solver in algoviz.pathfinding
+without a window and reports one row per (maze, algorithm)::
+
+    python -m algoviz.bench --rows 301 --cols 301 --mud 0.1 --repeat 5
+    python -m algoviz.bench --generator Kruskal "Open Field" --repeat 3
+    python -m algoviz.bench --algorithms Dijkstra --queue heap bucket radix
+    python -m algoviz.bench --format json --label v2 -o results.json
+
+Wall time is measured on an untraced run; peak memory comes from a
+second run under tracemalloc (skip it with --no-memory). JPS only
+applies to mazes without mud and otherwise runs A*; its rows then say
+so (JPS_FALLBACK) instead of passing A*'s numbers off as JPS.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from .mazegen import GENERATORS, add_mud
+from .pathfinding import ALGORITHMS, dfs, dijkstra, uniform_cost
+from .pqueue import QUEUES
+
+FIELDS = ["label", "generator", "rows", "cols", "mud", "seed", "algorithm", "queue", "time_s",
+          "expanded", "peak_frontier", "peak_mem_kb", "cost", "path_len"]
+JPS_FALLBACK = "JPS->A*" # Algorithm of JPS rows on mazes with mud, where jps() runs astar()
+
+
+def _run(name, grid, start, end, seed, queue):
+    if name == "DFS":
+        return dfs(grid, start, end, rng=random.Random(seed))
+    if name == "Dijkstra":
+        return dijkstra(grid, start, end, queue=queue)
+    return ALGORITHMS[name](grid, start, end)
+
+
+def bench(rows, cols, mud=0.0, seeds=(0,), algorithms=None, memory=True, label="",
+          generators=("Backtracker",), queues=("auto",)):
+    """Benchmark each algorithm on one maze per (generator, seed) and return result rows.
+
+    Dijkstra runs once per entry of queues (see algoviz.pqueue.QUEUES).
+    """
+    results = []
+    for generator, seed in itertools.product(generators, seeds):
+        rng = random.Random(seed)
+        grid = GENERATORS[generator](rows, cols, rng=rng)
+        start, end = (0, 0), (rows - 1, cols - 1)
+        if mud: add_mud(grid, mud, rng=rng, keep=(start, end))
+
+        runs = [(name, queue) for name in algorithms or ALGORITHMS
+                for queue in (queues if name == "Dijkstra" else (None,))]
+        for name, queue in runs:
+            t0 = time.perf_counter()
+            result = _run(name, grid, start, end, seed, queue)
+            elapsed = time.perf_counter() - t0
+
+            peak_kb = None
+            if memory:
+                tracemalloc.start()
+                _run(name, grid, start, end, seed, queue)
+                peak_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                tracemalloc.stop()
+
+            if name == "JPS" and not uniform_cost(grid): name = JPS_FALLBACK
+            results.append({
+                "label": label, "generator": generator, "rows": rows, "cols": cols, "mud": mud, "seed": seed,
+                "algorithm": name, "queue": result.queue, "time_s": round(elapsed, 6),
+                "expanded": result.visited, "peak_frontier": result.peak_frontier,
+                "peak_mem_kb": peak_kb, "cost": result.cost, "path_len": len(result.path),
+            })
+    return results
+
+
+def write(results, out, fmt="csv"):
+    if fmt == "json":
+        json.dump(results, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m algoviz.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=101)
+    parser.add_argument("--cols", type=int, default=101)
+    parser.add_argument("--generator", nargs="+", choices=list(GENERATORS), default=["Backtracker"],
+                        help="maze generator(s) to benchmark on")
+    parser.add_argument("--mud", type=float, default=0.0, help="chance that a path cell becomes mud (0-1)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first maze")
+    parser.add_argument("--repeat", type=int, default=1, help="number of mazes (seeds seed, seed+1, ...)")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--queue", nargs="+", choices=QUEUES, default=["auto"],
+                        help="priority queue(s) to run Dijkstra with")
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--label", default="", help="tag stored in every row, e.g. a version")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.rows < 2 or args.cols < 2: parser.error("the maze needs at least 2 rows and 2 columns")
+    if not 0 <= args.mud <= 1: parser.error("--mud must be between 0 and 1")
+
+    results = bench(args.rows, args.cols, args.mud, range(args.seed, args.seed + args.repeat),
+                    args.algorithms, memory=not args.no_memory, label=args.label,
+                    generators=args.generator, queues=args.queue)
+
+    if args.output:
+        with open(args.output, "w", newline="") as out:
+            write(results, out, args.format)
+    else:
+        write(results, sys.stdout, args.format)
+
+
+if __name__ == "__main__":
+    main()
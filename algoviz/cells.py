@@ -0,0 +1,294 @@
+"""Frame-coalesced cell painting for the maze canvases.
+
+Every cell gets one rectangle item, created once and kept for the
+life of the canvas. Painting a cell only records it in a dirty set;
+the set is drained with ``itemconfig`` at most once per frame, and
+only cells whose color actually changed reach Tk. Clearing a run's
+marks or redrawing a new maze therefore costs O(changed cells), with
+no item churn.
+
+Past a few tens of thousands of cells the items themselves are the
+bottleneck, so RasterCanvas keeps the maze as a PhotoImage with one
+pixel per cell instead; make_cells() picks between the two.
+"""
+
+import math
+import threading
+import tkinter as tk
+
+FRAME_MS = 16 # ~60 FPS
+RASTER_THRESHOLD = 40000 # Cells above which make_cells() returns a RasterCanvas
+
+# Raster view scales: n > 0 draws a cell as n x n pixels, n < 0 shows
+# every -n-th cell (Tk's subsample)
+ZOOM_LEVELS = (-8, -4, -3, -2, 1, 2, 3, 4, 6, 8, 12, 16, 25)
+MAX_VIEW_PIXELS = 4096 * 4096 # Largest zoomed image we are willing to allocate
+
+
+class CellCanvas:
+    """Grid of persistent rectangles on a Tk canvas, recolored in place.
+
+    Colors come in two layers: the base (walls, paths, mud, start/end)
+    and marks painted over it during a run (visited cells, the final
+    path). reset() restores just the marked cells to the base.
+
+    paint() is safe to call from worker threads; everything else, and
+    flush() (scheduled automatically), runs on the Tk main loop.
+
+    Attributes:
+        canvas: The Tk canvas holding the cells.
+        rows, cols: Grid dimensions.
+        cell_size: Side length of a cell in pixels.
+        items: Flat list of rectangle ids, indexed r * cols + c.
+        base: Base color of every cell, same indexing.
+    """
+    def __init__(self, canvas, rows, cols, cell_size, frame_ms=FRAME_MS):
+        self.canvas = canvas
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.frame_ms = frame_ms
+        self.items = []
+        self.base = []
+
+        self._shown = []   # Color currently on the canvas, per cell
+        self._dirty = {}   # cell index -> wanted color, last write wins
+        self._marked = set()
+        self._lock = threading.Lock()
+        self._scheduled = False
+
+    def cell_at(self, x, y):
+        """Map widget coordinates (e.g. event.x, event.y) to (row, col)."""
+        size = self.cell_size
+        return int(self.canvas.canvasy(y)) // size, int(self.canvas.canvasx(x)) // size
+
+    def draw(self, colors):
+        """Show a new base (rows * cols colors in row-major order).
+
+        Creates the items on first use; afterwards only cells whose
+        color differs from what is shown are updated, and all marks
+        are dropped.
+        """
+        colors = list(colors)
+        if not self._shown:
+            self._create(colors)
+            return
+
+        with self._lock:
+            self._marked.clear()
+            shown, dirty = self._shown, self._dirty
+            dirty.clear()
+            for i, color in enumerate(colors):
+                if shown[i] != color:
+                    dirty[i] = color
+        self.base = colors
+        self.flush()
+
+    def _create(self, colors):
+        self.canvas.delete("all")
+        create = self.canvas.create_rectangle
+        size = self.cell_size
+        items = []
+        i = 0
+        for r in range(self.rows):
+            y = r * size
+            for c in range(self.cols):
+                x = c * size
+                items.append(create(x, y, x + size, y + size, fill=colors[i], outline=""))
+                i += 1
+        self.items = items
+        self.base = colors
+        self._shown = list(colors)
+
+    def set_base(self, r, c, color):
+        """Change the base color of one cell (e.g. a toggled wall)."""
+        i = r * self.cols + c
+        self.base[i] = color
+        with self._lock:
+            self._marked.discard(i)
+            self._dirty[i] = color
+        self._schedule()
+
+    def paint(self, r, c, color):
+        """Mark cell (r, c) with color until the next reset()."""
+        i = r * self.cols + c
+        with self._lock:
+            self._marked.add(i)
+            self._dirty[i] = color
+        self._schedule()
+
+    def reset(self):
+        """Restore every marked cell to its base color."""
+        base = self.base
+        with self._lock:
+            for i in self._marked:
+                self._dirty[i] = base[i]
+            self._marked.clear()
+        self.flush()
+
+    def _schedule(self):
+        with self._lock:
+            if self._scheduled: return
+            self._scheduled = True
+        self.canvas.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        """Push all dirty cells to the canvas."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            self._scheduled = False
+        itemconfig, items, shown = self.canvas.itemconfig, self.items, self._shown
+        for i, color in dirty.items():
+            if shown[i] != color:
+                itemconfig(items[i], fill=color)
+                shown[i] = color
+
+
+class RasterCanvas(CellCanvas):
+    """Same interface as CellCanvas, backed by a pixel buffer.
+
+    The maze lives in ``image`` at one pixel per cell. Dirty cells are
+    written back as one row strip per touched row with
+    ``PhotoImage.put``, and only the bounding box of the change is
+    copied into the zoomed ``view`` shown on the canvas.
+
+    Mouse wheel zooms (see ZOOM_LEVELS); dragging with the right or
+    middle button pans.
+
+    Attributes:
+        image: Source image, cols x rows pixels.
+        view: Image on the canvas; ``image`` itself at scale 1.
+        scale: Current entry of ZOOM_LEVELS.
+    """
+    def __init__(self, canvas, rows, cols, cell_size, frame_ms=FRAME_MS):
+        super().__init__(canvas, rows, cols, cell_size, frame_ms)
+        self.image = None
+        self.view = None
+        self._view_item = None
+        self.scale = self._fit(cell_size)
+
+        canvas.bind("<MouseWheel>", lambda e: self.zoom(1 if e.delta > 0 else -1, e.x, e.y))
+        canvas.bind("<Button-4>", lambda e: self.zoom(1, e.x, e.y))
+        canvas.bind("<Button-5>", lambda e: self.zoom(-1, e.x, e.y))
+        for button in (2, 3):
+            canvas.bind(f"<ButtonPress-{button}>", lambda e: canvas.scan_mark(e.x, e.y))
+            canvas.bind(f"<B{button}-Motion>", lambda e: canvas.scan_dragto(e.x, e.y, gain=1))
+
+    def _fit(self, cell_size):
+        # Largest level not above cell_size whose view stays within MAX_VIEW_PIXELS
+        best = ZOOM_LEVELS[0]
+        for level in ZOOM_LEVELS:
+            size = level if level > 0 else 1 / -level
+            if size <= cell_size and self.rows * self.cols * max(level, 1) ** 2 <= MAX_VIEW_PIXELS:
+                best = level
+        return best
+
+    def cell_at(self, x, y):
+        x, y = int(self.canvas.canvasx(x)), int(self.canvas.canvasy(y))
+        if self.scale > 0:
+            return y // self.scale, x // self.scale
+        return y * -self.scale, x * -self.scale
+
+    def _create(self, colors):
+        self.canvas.delete("all")
+        self.image = tk.PhotoImage(master=self.canvas, width=self.cols, height=self.rows)
+        cols = self.cols
+        self.image.put(" ".join("{" + " ".join(colors[i:i + cols]) + "}"
+                                for i in range(0, len(colors), cols)))
+        self.base = colors
+        self._shown = list(colors)
+        self._view_item = None
+        self._show_view()
+
+    def _show_view(self):
+        scale = self.scale
+        if scale == 1: self.view = self.image
+        elif scale > 1: self.view = self.image.zoom(scale)
+        else: self.view = self.image.subsample(-scale)
+
+        if self._view_item is None:
+            self._view_item = self.canvas.create_image(0, 0, image=self.view, anchor=tk.NW)
+        else:
+            self.canvas.itemconfig(self._view_item, image=self.view)
+        self.canvas.config(scrollregion=(0, 0, self.view.width(), self.view.height()))
+
+    def zoom(self, steps, x=0, y=0):
+        """Move steps entries through ZOOM_LEVELS, keeping (x, y) in place."""
+        if self.image is None: return
+        i = ZOOM_LEVELS.index(self.scale) + steps
+        i = max(0, min(i, len(ZOOM_LEVELS) - 1))
+        level = ZOOM_LEVELS[i]
+        if level > 1 and self.rows * self.cols * level * level > MAX_VIEW_PIXELS: return
+        if level == self.scale: return
+
+        r, c = self.cell_at(x, y)
+        self.scale = level
+        self._show_view()
+
+        # Scroll so the cell under the pointer stays under it
+        width, height = self.view.width(), self.view.height()
+        px = c * level if level > 0 else c // -level
+        py = r * level if level > 0 else r // -level
+        if width: self.canvas.xview_moveto(max(0, px - x) / width)
+        if height: self.canvas.yview_moveto(max(0, py - y) / height)
+
+    def flush(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            self._scheduled = False
+        if self.image is None: return
+
+        shown, cols = self._shown, self.cols
+        spans = {} # row -> [first col, last col] of changed cells
+        for i, color in dirty.items():
+            if shown[i] == color: continue
+            shown[i] = color
+            r, c = divmod(i, cols)
+            span = spans.get(r)
+            if span is None: spans[r] = [c, c]
+            elif c < span[0]: span[0] = c
+            elif c > span[1]: span[1] = c
+        if not spans: return
+
+        put = self.image.put
+        for r, (c0, c1) in spans.items():
+            start = r * cols
+            put("{" + " ".join(shown[start + c0:start + c1 + 1]) + "}", to=(c0, r))
+
+        if self.view is not self.image:
+            self._blit(min(spans), max(spans) + 1,
+                       min(s[0] for s in spans.values()), max(s[1] for s in spans.values()) + 1)
+
+    def _blit(self, r0, r1, c0, c1):
+        # Copy the changed box of the source image into the scaled view
+        scale = self.scale
+        if scale > 1:
+            args = ("-to", c0 * scale, r0 * scale, "-zoom", scale)
+        else:
+            step = -scale
+            r0, c0 = r0 - r0 % step, c0 - c0 % step
+            args = ("-to", c0 // step, r0 // step, "-subsample", step)
+        self.view.tk.call(self.view.name, "copy", self.image.name,
+                          "-from", c0, r0, c1, r1, *args)
+
+
+def fit_cell_size(rows, cols, width, height, max_size):
+    """Largest cell size, at most max_size, that fits rows x cols into width x height.
+
+    Whole pixels where possible; grids larger than the area get a
+    fraction below 1, which only a RasterCanvas can show (zoomed out).
+    """
+    size = min(max_size, width / cols, height / rows)
+    return int(size) if size >= 1 else size
+
+
+def canvas_size(rows, cols, cell_size, width, height):
+    """Canvas (width, height) for the grid, capped at width x height."""
+    return min(width, math.ceil(cols * cell_size)), min(height, math.ceil(rows * cell_size))
+
+
+def make_cells(canvas, rows, cols, cell_size, threshold=RASTER_THRESHOLD):
+    """Return a CellCanvas, or a RasterCanvas for grids above threshold cells."""
+    if rows * cols > threshold or cell_size < 1:
+        return RasterCanvas(canvas, rows, cols, cell_size)
+    return CellCanvas(canvas, rows, cols, cell_size)
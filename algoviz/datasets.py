@@ -0,0 +1,156 @@
+"""Input data for the sort and search apps: generation, bulk loading, checks.
+
+With NumPy installed, generating, parsing and checking are vectorized,
+so multi-million element datasets take milliseconds rather than
+seconds; without it the same functions run in plain Python. Either
+way they return ordinary lists, which the algorithms and the bar
+renderer index and mutate.
+
+Binary files are raw native-endian integers: 32-bit for *.i32 and
+64-bit for anything else (see BINARY_TYPES).
+"""
+
+import os
+import random
+import warnings
+from array import array
+from itertools import accumulate, islice
+from operator import le
+
+try:
+    import numpy as np
+except ImportError: # Optional: everything has a pure-Python fallback
+    np = None
+
+DISTRIBUTIONS = ("Uniform", "Nearly Sorted", "Reversed", "Few Unique", "Zipfian")
+NEARLY_SORTED_SWAPS = 0.02 # Fraction of positions swapped with a neighbor
+FEW_UNIQUE = 8             # Distinct values in "Few Unique"
+ZIPF_EXPONENT = 1.3        # Rank k is drawn with probability proportional to k^-s
+BINARY_TYPES = {".i32": "i", ".i64": "q"} # Extension -> array/NumPy typecode
+DEFAULT_BINARY_TYPE = "q"
+TEXT_EXTENSIONS = (".csv", ".txt")
+FILE_TYPES = [("Integer files", "*.bin *.i32 *.i64 *.csv *.txt"), ("All files", "*.*")] # For file dialogs
+
+
+def generate(kind, n, low=1, high=100, seed=None):
+    """n integers in low..high drawn according to kind (one of DISTRIBUTIONS).
+
+    "Nearly Sorted" is ascending with a few neighbors swapped,
+    "Reversed" descending, and "Zipfian" skewed toward low: the value
+    low + k - 1 has probability proportional to k^-ZIPF_EXPONENT.
+    """
+    if kind not in DISTRIBUTIONS: raise ValueError(f"unknown distribution {kind!r}")
+    if n <= 0: return []
+    if np is not None: return _generate_numpy(kind, n, low, high, seed)
+
+    rng = random.Random(seed)
+    if kind == "Few Unique":
+        values = [rng.randint(low, high) for _ in range(FEW_UNIQUE)]
+        return rng.choices(values, k=n)
+    if kind == "Zipfian":
+        cum_weights = list(accumulate(k ** -ZIPF_EXPONENT for k in range(1, high - low + 2)))
+        return rng.choices(range(low, high + 1), cum_weights=cum_weights, k=n)
+
+    data = rng.choices(range(low, high + 1), k=n)
+    if kind == "Nearly Sorted":
+        data.sort()
+        for _ in range(_swaps(n)):
+            i = rng.randrange(n - 1)
+            data[i], data[i + 1] = data[i + 1], data[i]
+    elif kind == "Reversed":
+        data.sort(reverse=True)
+    return data
+
+
+def _swaps(n):
+    return max(1, int(n * NEARLY_SORTED_SWAPS)) if n > 1 else 0
+
+
+def _generate_numpy(kind, n, low, high, seed):
+    rng = np.random.default_rng(seed)
+    if kind == "Few Unique":
+        data = rng.choice(rng.integers(low, high + 1, FEW_UNIQUE), n)
+    elif kind == "Zipfian":
+        ranks = np.arange(1, high - low + 2, dtype=np.float64)
+        cdf = np.cumsum(ranks ** -ZIPF_EXPONENT)
+        data = low + np.searchsorted(cdf, rng.random(n) * cdf[-1], side="right")
+    else:
+        data = rng.integers(low, high + 1, n)
+        if kind == "Nearly Sorted":
+            data.sort()
+            i = rng.integers(0, n - 1, _swaps(n))
+            data[i], data[i + 1] = data[i + 1], data[i]
+        elif kind == "Reversed":
+            data[::-1].sort() # Ascending through a reversed view is descending
+    return data.tolist()
+
+
+def parse_csv(text):
+    """Integers from comma- or newline-separated text.
+
+    Raises ValueError if anything other than integers is found, or if
+    there are none.
+    """
+    text = text.replace("\n", ",").strip().strip(",")
+    if not text: raise ValueError("no numbers given")
+    if np is not None:
+        with warnings.catch_warnings():
+            # fromstring stops at the first bad item and only warns
+            warnings.simplefilter("ignore", DeprecationWarning)
+            data = np.fromstring(text, dtype=np.int64, sep=",")
+        limits = np.iinfo(np.int64)
+        if len(data) == text.count(",") + 1 and not ((data == limits.min) | (data == limits.max)).any():
+            return data.tolist()
+        # Otherwise fromstring stopped early (let int() find the bad item) or
+        # clamped an out-of-range value to an int64 limit (int() keeps it exact)
+    return [int(x) for x in text.split(",")]
+
+
+def binary_type(path):
+    """array/NumPy typecode of the integers in the binary file path (see BINARY_TYPES)."""
+    return BINARY_TYPES.get(os.path.splitext(path)[1].lower(), DEFAULT_BINARY_TYPE)
+
+
+def load_file(path):
+    """Integers from a text file (CSV, one per line, ...) or a binary one.
+
+    Files ending in one of TEXT_EXTENSIONS are parsed as text; anything
+    else is read as raw integers of the type BINARY_TYPES gives its
+    extension.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in TEXT_EXTENSIONS:
+        with open(path) as f:
+            return parse_csv(f.read())
+    typecode = binary_type(path)
+    itemsize = array(typecode).itemsize
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(f"{os.path.basename(path)} is not a whole number of {8 * itemsize}-bit integers")
+    if np is not None:
+        return np.fromfile(path, dtype=typecode).tolist()
+    data = array(typecode)
+    with open(path, "rb") as f:
+        data.fromfile(f, size // itemsize)
+    return data.tolist()
+
+
+def save_binary(data, path):
+    """Write data as raw integers, typed by path's extension (see load_file)."""
+    typecode = binary_type(path)
+    with open(path, "wb") as f:
+        if np is not None: np.asarray(data, dtype=typecode).tofile(f)
+        else: array(typecode, data).tofile(f)
+
+
+def is_sorted(data):
+    """True if data is in ascending order.
+
+    Arrays (NumPy arrays, memoryviews, array.array) are compared in one
+    vectorized pass when NumPy is installed; lists are checked in plain
+    Python, which beats converting them first.
+    """
+    if np is not None and not isinstance(data, list) and len(data) > 1:
+        a = np.asarray(data)
+        return bool((a[:-1] <= a[1:]).all())
+    return all(map(le, data, islice(data, 1, None)))
@@ -0,0 +1,57 @@
+"""Event logs emitted by the algorithms for later replay.
+
+An algorithm runs at full speed and appends plain tuples
+``(kind, *args)`` to an EventLog; the GUI replays the log afterwards
+(see algoviz.player). Each app decides what the arguments of a kind
+mean for its own view.
+"""
+
+from itertools import zip_longest
+
+# Event kinds
+VISIT = "visit"        # A cell/node was expanded or discovered
+RELAX = "relax"        # A tentative distance was lowered
+EXPAND = "expand"      # A node is being processed (graph traversals)
+FINISH = "finish"      # A node has been fully processed
+COMPARE = "compare"    # Two positions (or one position and a target) were compared
+SWAP = "swap"          # Two positions were exchanged
+WRITE = "write"        # A value was stored at a position
+DISCARD = "discard"    # A range of positions was ruled out
+PAGE = "page"          # Pages first..last of a mapped file were read
+PATH = "path"          # One step of the final path
+STATUS = "status"      # Free-form status text
+DONE = "done"          # Final result of the run
+
+_SKIP = object()
+
+
+class EventLog(list):
+    """Append-only list of (kind, *args) event tuples."""
+
+    def emit(self, kind, *args):
+        self.append((kind,) + args)
+
+    def recorder(self, kind, *extra):
+        """Return a callback that records its arguments as a kind event.
+
+        Handy as an ``on_visit`` hook: ``dijkstra(..., on_visit=log.recorder(VISIT))``.
+        Any extra arguments are appended to every event, e.g. to tell the
+        two halves of a bidirectional search apart.
+        """
+        append = self.append
+        return lambda *args: append((kind,) + args + extra)
+
+
+def interleave(*logs):
+    """Merge several logs round-robin into one log of (lane, event) pairs.
+
+    Used by the race views: every frame advances each algorithm by the
+    same number of events, and a lane simply drops out once its log is
+    exhausted.
+    """
+    merged = EventLog()
+    for events in zip_longest(*logs, fillvalue=_SKIP):
+        for lane, event in enumerate(events):
+            if event is not _SKIP:
+                merged.append((lane, event))
+    return merged
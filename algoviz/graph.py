@@ -0,0 +1,117 @@
+"""Undirected graph model shared by the graph visualizers.
+
+The apps keep their own Node/Edge classes (they carry colors and canvas
+positions); this module only indexes them. Any edge object with
+``source`` and ``destination`` attributes can be stored.
+"""
+
+
+class Graph:
+    """Undirected graph with an incrementally maintained adjacency index.
+
+    Adding, looking up, replacing and removing an edge are all O(1), and
+    listing a node's neighbors is O(degree) instead of a scan over every
+    edge.
+
+    Attributes:
+        nodes: Nodes in insertion order.
+        adjacency: Maps each node to an ordered {neighbor: edge} dict.
+        history: Undo stack of ("node", node) and
+            ("edge", edge, replaced_edge) records.
+    """
+    def __init__(self):
+        self.nodes = []
+        self.adjacency = {}
+        self.history = []
+        self._edges = {}  # Ordered set of edge objects
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def edges(self):
+        """Live view of the edges, in insertion order."""
+        return self._edges.keys()
+
+    def add_node(self, node, record=True):
+        self.nodes.append(node)
+        self.adjacency[node] = {}
+        if record:
+            self.history.append(("node", node))
+        return node
+
+    def add_edge(self, edge, record=True):
+        """Insert edge, replacing any existing edge between the same nodes.
+
+        Returns the replaced edge, or None.
+        """
+        u, v = edge.source, edge.destination
+        replaced = self.adjacency[u].get(v)
+        if replaced is not None:
+            del self._edges[replaced]
+        self.adjacency[u][v] = edge
+        self.adjacency[v][u] = edge
+        self._edges[edge] = None
+        if record:
+            self.history.append(("edge", edge, replaced))
+        return replaced
+
+    def get_edge(self, u, v):
+        return self.adjacency[u].get(v)
+
+    def has_edge(self, u, v):
+        return v in self.adjacency[u]
+
+    def neighbors(self, node):
+        return list(self.adjacency[node])
+
+    def neighbors_with_weights(self, node):
+        return [(neighbor, edge.weight) for neighbor, edge in self.adjacency[node].items()]
+
+    def remove_edge(self, edge):
+        u, v = edge.source, edge.destination
+        if self.adjacency.get(u, {}).get(v) is not edge:
+            return False
+        del self.adjacency[u][v]
+        del self.adjacency[v][u]
+        del self._edges[edge]
+        return True
+
+    def remove_node(self, node):
+        if node not in self.adjacency:
+            return False
+        for edge in list(self.adjacency[node].values()):
+            self.remove_edge(edge)
+        del self.adjacency[node]
+        # Undo removes the newest node, so check the tail before scanning
+        if self.nodes and self.nodes[-1] is node:
+            self.nodes.pop()
+        else:
+            self.nodes.remove(node)
+        return True
+
+    def undo(self):
+        """Revert the most recent add_node/add_edge.
+
+        Returns the node or edge that was removed, or None when there is
+        nothing to undo.
+        """
+        while self.history:
+            record = self.history.pop()
+            if record[0] == "node":
+                if self.remove_node(record[1]):
+                    return record[1]
+            else:
+                _, edge, replaced = record
+                if self.remove_edge(edge):
+                    if replaced is not None and replaced.source in self.adjacency \
+                            and replaced.destination in self.adjacency:
+                        self.add_edge(replaced, record=False)
+                    return edge
+        return None
+
+    def clear(self):
+        self.nodes = []
+        self.adjacency = {}
+        self.history = []
+        self._edges = {}
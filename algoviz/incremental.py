@@ -0,0 +1,132 @@
+"""Incremental replanning on a grid whose walls change (LPA*).
+
+Lifelong Planning A* keeps its search state between queries. Every
+cell has g, its settled cost from the start, and rhs, the one-step
+lookahead min over its neighbors of g + step cost. A cell whose two
+values disagree is *inconsistent* and sits in the queue. Editing a
+cell only makes that cell and its neighbors inconsistent, so
+compute() repairs just the part of the shortest-path tree the edit
+touched instead of searching again from scratch.
+
+With heuristic=False this is incremental Dijkstra; with the Manhattan
+heuristic it is incremental A*. The start and end are fixed for the
+life of a planner (D* Lite would be needed for a moving start).
+"""
+
+import heapq
+from array import array
+
+from .pathfinding import INF, NO_PARENT, STEP_COST, SearchResult
+
+
+class LPAStar:
+    """LPA* planner for one (start, end) pair on one grid.
+
+    After writing a cell of the grid, call update_cell() for it, then
+    compute() for the repaired path.
+
+    Attributes:
+        grid: The grid being planned on (edited in place by the caller).
+        start, end: (row, col) endpoints.
+        g, rhs: Flat arrays of settled and lookahead costs.
+    """
+    def __init__(self, grid, start, end, heuristic=True):
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self._s = grid.index(*start)
+        self._t = grid.index(*end)
+        self.g = array("i", [INF]) * grid.size
+        self.rhs = array("i", [INF]) * grid.size
+        self.parents = array("i", [NO_PARENT]) * grid.size
+        self._heap = []
+        self._open = {} # cell id -> key it is queued with; older heap entries are stale
+
+        if heuristic:
+            stride = grid.stride
+            tr, tc = divmod(self._t, stride)
+            def h(i):
+                r, c = divmod(i, stride)
+                return abs(r - tr) + abs(c - tc)
+        else:
+            h = lambda i: 0
+        self._h = h
+
+        self.rhs[self._s] = 0
+        self._queue(self._s)
+
+    def _key(self, i):
+        m = min(self.g[i], self.rhs[i])
+        return (m + self._h(i), m)
+
+    def _queue(self, i):
+        key = self._key(i)
+        self._open[i] = key
+        heapq.heappush(self._heap, (key, i))
+
+    def _update(self, i):
+        # Recompute rhs(i) from its neighbors and (de)queue i to match
+        g, rhs, cells = self.g, self.rhs, self.grid.cells
+        if i != self._s:
+            weight = STEP_COST[cells[i]]
+            best = INF
+            if weight:
+                for off in self.grid.offsets:
+                    j = i + off
+                    if STEP_COST[cells[j]] and g[j] < best: best = g[j]
+            rhs[i] = best + weight if best != INF else INF
+        if g[i] != rhs[i]: self._queue(i)
+        else: self._open.pop(i, None)
+
+    def update_cell(self, r, c):
+        """Tell the planner cell (r, c) changed (wall, path or mud)."""
+        i = self.grid.index(r, c)
+        self._update(i)
+        for off in self.grid.offsets:
+            self._update(i + off)
+
+    def _top(self):
+        heap, open_keys = self._heap, self._open
+        while heap and open_keys.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def compute(self, on_visit=None):
+        """Repair the search and return a SearchResult for the current grid.
+
+        on_visit(r, c) is called for every cell expanded by this repair;
+        SearchResult.visited counts them too.
+        """
+        g, rhs, t = self.g, self.rhs, self._t
+        offsets, cell = self.grid.offsets, self.grid.cell
+        update = self._update
+        expanded = 0
+
+        while True:
+            top = self._top()
+            if top is None or (top >= self._key(t) and rhs[t] == g[t]): break
+            _, i = heapq.heappop(self._heap)
+            del self._open[i]
+            expanded += 1
+            if on_visit and i != t: on_visit(*cell(i))
+
+            if g[i] > rhs[i]: # Overconsistent: settle it
+                g[i] = rhs[i]
+            else:             # Underconsistent: a cost went up, re-derive it
+                g[i] = INF
+                update(i)
+            for off in offsets:
+                update(i + off)
+
+        cost = g[t] if g[t] != INF else None
+        if cost is not None: self._trace()
+        return SearchResult(self.grid, self.start, self.end, cost, expanded, self.parents, len(self._open))
+
+    def _trace(self):
+        # Walk back from the end through the neighbor with the lowest g
+        g, cells, parents, offsets = self.g, self.grid.cells, self.parents, self.grid.offsets
+        i = self._t
+        while i != self._s:
+            best = min((j for j in (i + off for off in offsets) if STEP_COST[cells[j]]), key=g.__getitem__)
+            parents[i] = best
+            i = best
@@ -0,0 +1,311 @@
+"""Seeded maze generators writing straight into a Grid buffer.
+
+Every generator takes a seed (or a ``random.Random``) and produces the
+same bytes for the same seed and size, so benchmark runs and side by
+side comparisons can be repeated exactly.
+
+Mazes follow the apps' convention: cells with an even row and column
+are rooms, the cells between two rooms are knocked-down walls, and
+(0, 0) / (rows - 1, cols - 1) are always open.
+
+The generators differ in the mazes they make, which matters when
+comparing solvers: the backtracker's long corridors favour A*,
+Kruskal and Prim give many short dead ends, recursive division gives
+long straight walls, and an open field is barely a maze at all.
+"""
+
+import random
+from array import array
+
+from .pathfinding import MUD, PATH, WALL, Grid
+
+
+def _rng(seed, rng):
+    return rng if rng is not None else random.Random(seed)
+
+
+def open_corners(grid):
+    """Open the start and end cells (and the end's two neighbors).
+
+    With an even number of rows or columns the last row/column holds
+    no rooms, so the end would otherwise be walled in.
+    """
+    rows, cols = grid.rows, grid.cols
+    grid[0, 0] = PATH
+    grid[rows - 1, cols - 1] = PATH
+    if rows > 1: grid[rows - 2, cols - 1] = PATH
+    if cols > 1: grid[rows - 1, cols - 2] = PATH
+    return grid
+
+
+def _fresh_rooms(grid, pad):
+    # fresh[pad + id] = 1 for every room not yet carved; the padding
+    # makes moves off the edge of the maze land on a zero
+    rows, cols = grid.rows, grid.cols
+    fresh = bytearray(len(grid.cells) + 2 * pad)
+    room_row = bytes([1, 0]) * (cols // 2) + bytes([1]) * (cols % 2)
+    for r in range(0, rows, 2):
+        k = pad + grid.index(r, 0)
+        fresh[k:k + cols] = room_row
+    return fresh
+
+
+def backtracker(rows, cols, seed=None, rng=None):
+    """Randomized depth-first backtracker: long, winding corridors.
+
+    Iterative, with flat ids: the stack holds cell ids, and a second
+    buffer marks rooms not yet carved, padded so moves off the edge of
+    the maze land on a zero instead of needing bounds checks.
+    """
+    grid = Grid(rows, cols)
+    choice = _rng(seed, rng).choice
+    cells, stride = grid.cells, grid.stride
+
+    pad = 2 * stride
+    fresh = _fresh_rooms(grid, pad)
+
+    steps = (-2 * stride, 2 * stride, -2, 2) # Up, down, left, right
+    i = grid.index(0, 0)
+    cells[i] = PATH
+    fresh[pad + i] = 0
+    stack = [i]
+
+    while stack:
+        i = stack[-1]
+        k = pad + i
+        options = [d for d in steps if fresh[k + d]]
+        if options:
+            d = choice(options)
+            j = i + d
+            cells[i + d // 2] = PATH # Knock down the wall between
+            cells[j] = PATH
+            fresh[pad + j] = 0
+            stack.append(j)
+        else:
+            stack.pop()
+
+    return open_corners(grid)
+
+
+def kruskal(rows, cols, seed=None, rng=None):
+    """Randomized Kruskal: knock down walls in random order with union-find.
+
+    Gives an unbiased spread of short dead ends. Every wall between two
+    rooms is shuffled once; the union-find uses path halving and union
+    by size over flat ids.
+    """
+    grid = Grid(rows, cols)
+    cells, stride = grid.cells, grid.stride
+
+    walls = [] # Wall ids; the wall at w joins w - step and w + step
+    for r in range(0, rows, 2):
+        for c in range(0, cols, 2):
+            i = grid.index(r, c)
+            cells[i] = PATH
+            if c + 2 < cols: walls.append(i + 1)
+            if r + 2 < rows: walls.append(i + stride)
+    _rng(seed, rng).shuffle(walls)
+
+    parent = array("i", range(len(cells)))
+    size = array("i", [1]) * len(cells)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for w in walls:
+        step = 1 if cells[w - 1] == PATH else stride
+        a, b = find(w - step), find(w + step)
+        if a == b: continue
+        if size[a] < size[b]: a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+        cells[w] = PATH
+
+    return open_corners(grid)
+
+
+def prim(rows, cols, seed=None, rng=None):
+    """Randomized Prim: grow one tree from (0, 0) through random frontier walls.
+
+    Gives many short, branching dead ends radiating from the start. The
+    frontier is a flat list of (wall, room) ids; a random entry is
+    removed in O(1) by swapping it with the last one.
+    """
+    grid = Grid(rows, cols)
+    randrange = _rng(seed, rng).randrange
+    cells, stride = grid.cells, grid.stride
+
+    pad = 2 * stride
+    fresh = _fresh_rooms(grid, pad)
+    steps = (-2 * stride, 2 * stride, -2, 2)
+
+    frontier = []
+    i = grid.index(0, 0)
+    while True:
+        cells[i] = PATH
+        fresh[pad + i] = 0
+        k = pad + i
+        for d in steps:
+            if fresh[k + d]: frontier.append((i + d // 2, i + d))
+
+        # Take random frontier walls until one leads to an uncarved room
+        while frontier:
+            n = randrange(len(frontier))
+            frontier[n], frontier[-1] = frontier[-1], frontier[n]
+            wall, i = frontier.pop()
+            if fresh[pad + i]:
+                cells[wall] = PATH
+                break
+        else:
+            break
+
+    return open_corners(grid)
+
+
+def eller_rows(rows, cols, seed=None, rng=None):
+    """Eller's algorithm, yielding the maze one row (bytes of cell codes) at a time.
+
+    Only the set labels of the current room row are kept, so memory is
+    O(cols) whatever the number of rows: mazes far too big to hold can be
+    written straight to a file. Corners are opened as in open_corners().
+    """
+    rnd = _rng(seed, rng).random
+    width = (cols + 1) // 2 # Rooms per row
+    labels = [0] * width # Set of each room in the current row; 0 = new
+    next_label = 1
+
+    for r in range(0, rows, 2):
+        last = r + 2 >= rows
+        members = {}
+        for j in range(width):
+            if not labels[j]:
+                labels[j] = next_label
+                next_label += 1
+            members.setdefault(labels[j], []).append(j)
+
+        # Join neighbors in different sets: randomly, or always on the last row
+        row = bytearray([WALL]) * cols
+        row[0::2] = bytes(width)
+        for j in range(width - 1):
+            a, b = labels[j], labels[j + 1]
+            if a == b or not (last or rnd() < 0.5): continue
+            if len(members[a]) < len(members[b]): a, b = b, a
+            for k in members[b]:
+                labels[k] = a
+            members[a].extend(members.pop(b))
+            row[2 * j + 1] = PATH
+
+        # Every set carries on into the next row through at least one room
+        below = bytearray([WALL]) * cols
+        if not last:
+            carried = [0] * width
+            for label, rooms in members.items():
+                down = [j for j in rooms if rnd() < 0.5] or [rooms[int(rnd() * len(rooms))]]
+                for j in down:
+                    carried[j] = label
+                    below[2 * j] = PATH
+            labels = carried
+
+        for out, n in ((row, r), (below, r + 1)):
+            if n >= rows: break
+            if n == rows - 1: out[-2:] = bytes(min(cols, 2))
+            elif n == rows - 2: out[-1] = PATH
+            yield bytes(out)
+
+
+def eller(rows, cols, seed=None, rng=None):
+    """Eller's algorithm as a Grid; see eller_rows() for the streaming form."""
+    grid = Grid(rows, cols)
+    cells = grid.cells
+    for r, row in enumerate(eller_rows(rows, cols, seed, rng)):
+        start = grid.index(r, 0)
+        cells[start:start + cols] = row
+    return grid
+
+
+def division(rows, cols, seed=None, rng=None):
+    """Recursive division: split open space with walls that each have one gap.
+
+    Gives long straight walls and a visibly boxy layout. Iterative; each
+    pending region is a (top, bottom, left, right) span of rooms.
+    """
+    grid = Grid(rows, cols, fill=PATH)
+    randrange = _rng(seed, rng).randrange
+    cells, stride = grid.cells, grid.stride
+
+    # The odd last row/column of an even-sized grid holds no rooms
+    if rows % 2 == 0: cells[grid.index(rows - 1, 0):grid.index(rows - 1, cols)] = bytes([WALL]) * cols
+    if cols % 2 == 0:
+        for r in range(rows): grid[r, cols - 1] = WALL
+
+    stack = [(0, rows - 1 - (rows + 1) % 2, 0, cols - 1 - (cols + 1) % 2)]
+    while stack:
+        top, bottom, left, right = stack.pop()
+        height, width = bottom - top, right - left
+        if height < 2 or width < 2: continue
+
+        if height > width or (height == width and randrange(2)):
+            wr = top + 2 * randrange(height // 2) + 1 # Odd row between two room rows
+            gap = left + 2 * randrange(width // 2 + 1)
+            start = grid.index(wr, left)
+            cells[start:start + width + 1] = bytes([WALL]) * (width + 1)
+            cells[start + gap - left] = PATH
+            stack.append((top, wr - 1, left, right))
+            stack.append((wr + 1, bottom, left, right))
+        else:
+            wc = left + 2 * randrange(width // 2) + 1
+            gap = top + 2 * randrange(height // 2 + 1)
+            i = grid.index(top, wc)
+            for _ in range(height + 1):
+                cells[i] = WALL
+                i += stride
+            cells[grid.index(gap, wc)] = PATH
+            stack.append((top, bottom, left, wc - 1))
+            stack.append((top, bottom, wc + 1, right))
+
+    return open_corners(grid)
+
+
+def open_field(rows, cols, seed=None, rng=None, density=0.3):
+    """Open ground with each cell a random obstacle with probability density.
+
+    Not a maze: there can be many routes, or none at all when density is
+    high. The start and end cells are always left open.
+    """
+    grid = Grid(rows, cols, fill=PATH)
+    rnd = _rng(seed, rng).random
+    cells = grid.cells
+    for r in range(rows):
+        start = grid.index(r, 0)
+        for i in range(start, start + cols):
+            if rnd() < density: cells[i] = WALL
+    return open_corners(grid)
+
+
+def add_mud(grid, density, seed=None, rng=None, keep=()):
+    """Turn each path cell into mud with probability density.
+
+    Cells listed in keep (e.g. start and end) are left alone.
+    """
+    rnd = _rng(seed, rng).random
+    cells = grid.cells
+    skip = {grid.index(r, c) for r, c in keep}
+    for r in range(grid.rows):
+        start = grid.index(r, 0)
+        for i in range(start, start + grid.cols):
+            if cells[i] == PATH and i not in skip and rnd() < density:
+                cells[i] = MUD
+    return grid
+
+
+GENERATORS = {
+    "Backtracker": backtracker,
+    "Kruskal": kruskal,
+    "Prim": prim,
+    "Eller": eller,
+    "Recursive Division": division,
+    "Open Field": open_field,
+}
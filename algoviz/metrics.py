@@ -0,0 +1,153 @@
+"""Operation counts and a simulated data cache for the sort and search apps.
+
+Metrics counts comparisons, swaps and array reads and writes, and
+passes every access through a CacheModel: a small set-associative LRU
+cache over the data array, laid out like a C array of 64-bit ints.
+Its misses estimate how many cache lines a real machine would load,
+which is where binary search (a handful of lines) and merge sort
+(sequential runs) pull ahead of a linear scan or bubble sort long
+before the operation counts alone show it.
+"""
+
+import csv
+
+from .events import COMPARE, SWAP, WRITE
+
+FIELDS = ["algorithm", "n", "compares", "swaps", "reads", "writes",
+          "cache_hits", "cache_misses", "lines_touched"]
+
+
+class CacheModel:
+    """Set-associative LRU cache over one array of fixed-size items.
+
+    The defaults model a 32 KiB, 8-way L1 data cache with 64-byte lines
+    holding 8-byte items.
+
+    Attributes:
+        hits, misses: Accesses that found / had to load their line.
+        lines_touched: Distinct lines loaded at least once.
+    """
+    def __init__(self, line_bytes=64, item_bytes=8, sets=64, ways=8):
+        self.items_per_line = max(1, line_bytes // item_bytes)
+        self.ways = ways
+        self.nsets = sets
+        self.reset()
+
+    def reset(self):
+        self.hits = self.misses = 0
+        self._sets = [[] for _ in range(self.nsets)] # Line numbers, least recently used first
+        self._seen = set()
+        self._last = None # Line of the previous access, always its set's most recent
+
+    @property
+    def lines_touched(self):
+        return len(self._seen)
+
+    def touch(self, i):
+        """Access item i; return True on a hit."""
+        line = i // self.items_per_line
+        if line == self._last:
+            self.hits += 1
+            return True
+        self._last = line
+        lines = self._sets[line % self.nsets]
+        if line in lines:
+            if lines[-1] != line: # Make it the most recently used
+                lines.remove(line)
+                lines.append(line)
+            self.hits += 1
+            return True
+        self.misses += 1
+        self._seen.add(line)
+        if len(lines) >= self.ways: del lines[0]
+        lines.append(line)
+        return False
+
+
+class Metrics:
+    """Operation counters for one run over a data array.
+
+    Apps call compare(), swap(), read() and write() with array indices
+    as their events are applied; record() does this for the event
+    vocabulary of algoviz.sorting.
+
+    Attributes:
+        compares, swaps, reads, writes: Operation counts.
+        cache: The CacheModel every read and write goes through.
+    """
+    def __init__(self, cache=None):
+        self.cache = cache or CacheModel()
+        self.reset()
+
+    def reset(self):
+        self.compares = self.swaps = self.reads = self.writes = 0
+        self.cache.reset()
+
+    def read(self, i):
+        self.reads += 1
+        self.cache.touch(i)
+
+    def write(self, i):
+        self.writes += 1
+        self.cache.touch(i)
+
+    def compare(self, *indices):
+        """One comparison reading the given positions."""
+        self.compares += 1
+        for i in indices:
+            self.read(i)
+
+    def swap(self, i, j):
+        self.swaps += 1
+        self.read(i)
+        self.read(j)
+        self.write(i)
+        self.write(j)
+
+    def record(self, event):
+        """Count a (COMPARE, i, j), (SWAP, i, j) or (WRITE, i, value) sorting event."""
+        # Inlined: the sort app feeds millions of these per run
+        kind, i, j = event
+        touch = self.cache.touch
+        if kind == COMPARE:
+            self.compares += 1
+            self.reads += 2
+            touch(i)
+            touch(j)
+        elif kind == SWAP:
+            self.swaps += 1
+            self.reads += 2
+            self.writes += 2
+            touch(i)
+            touch(j)
+            touch(i)
+            touch(j)
+        elif kind == WRITE:
+            self.writes += 1
+            touch(i)
+
+    def summary(self):
+        """Multi-line text for the apps' side panels."""
+        cache = self.cache
+        accesses = cache.hits + cache.misses
+        rate = f"{100 * cache.misses / accesses:.1f}%" if accesses else "-"
+        return (f"Compares   {self.compares:>12,}\n"
+                f"Swaps      {self.swaps:>12,}\n"
+                f"Reads      {self.reads:>12,}\n"
+                f"Writes     {self.writes:>12,}\n\n"
+                f"Cache hits {cache.hits:>12,}\n"
+                f"Misses     {cache.misses:>12,}\n"
+                f"Miss rate  {rate:>12}\n"
+                f"Lines      {cache.lines_touched:>12,}")
+
+    def row(self, algorithm, n):
+        """One result row (see FIELDS) for a run of algorithm over n items."""
+        return {"algorithm": algorithm, "n": n, "compares": self.compares, "swaps": self.swaps,
+                "reads": self.reads, "writes": self.writes, "cache_hits": self.cache.hits,
+                "cache_misses": self.cache.misses, "lines_touched": self.cache.lines_touched}
+
+
+def write_csv(rows, out):
+    writer = csv.DictWriter(out, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
@@ -0,0 +1,275 @@
+"""Memory-mapped integer files for datasets too large to load.
+
+A MappedArray maps a raw binary file of 32- or 64-bit integers (the
+format of algoviz.datasets) read-only and indexes it in place; the OS
+pages it in on demand, so a multi-GB sorted index can be binary
+searched while only a few dozen of its pages are ever read. The
+searches and the external merge sort here report which pages they
+touch, and PageMap draws those touches on a Tk canvas.
+"""
+
+import heapq
+import math
+import mmap
+import os
+import tempfile
+from array import array
+
+from .datasets import binary_type, is_sorted
+
+try:
+    import numpy as np
+except ImportError: # Optional: runs are then sorted as lists
+    np = None
+
+PAGE_SIZE = mmap.PAGESIZE
+CHUNK_ITEMS = 1 << 20 # Items sorted in memory per run of the external sort (8 MiB of int64)
+BLOCK_ITEMS = 1 << 14 # Items read from each run / written out per merge step
+MERGE_FAN_IN = 64     # Most runs merged at once (each holds a block in memory)
+SCAN_EVENTS = 100     # Page-range events a linear scan of the whole file is split into
+MAX_CELLS = 2048      # Most cells a PageMap draws; larger files share cells between pages
+
+
+class MappedArray:
+    """Read-only integer array backed by a memory-mapped file.
+
+    Indexing returns ints and slicing returns lists, so the searches
+    that run over lists run over a MappedArray unchanged. Use it as a
+    context manager or call close() when done.
+
+    Attributes:
+        path: The mapped file.
+        typecode: array typecode of the items ("i" or "q").
+        itemsize: Bytes per item.
+        pages: Number of PAGE_SIZE pages the file spans.
+    """
+    def __init__(self, path, typecode=None):
+        self.path = path
+        self.typecode = typecode or binary_type(path)
+        self.itemsize = array(self.typecode).itemsize
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if not size or size % self.itemsize:
+            self._file.close()
+            raise ValueError(f"{os.path.basename(path)} is not a whole number of {8 * self.itemsize}-bit integers")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self._map).cast(self.typecode)
+        self.pages = (size + PAGE_SIZE - 1) // PAGE_SIZE
+
+    def __len__(self):
+        return len(self.view)
+
+    def __getitem__(self, i):
+        # Slices are copied out so that no view outlives close()
+        if isinstance(i, slice): return self.view[i].tolist()
+        return self.view[i]
+
+    def page_of(self, i):
+        return i * self.itemsize // PAGE_SIZE
+
+    def close(self):
+        self.view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def find(self, value, on_pages=None):
+        """Index of the first item equal to value, or None: a linear scan.
+
+        The scan runs at memory speed through mmap.find on the packed
+        value; on_pages(first, last) is called for the page ranges it
+        reads, in up to SCAN_EVENTS steps.
+        """
+        try: needle = array(self.typecode, [value]).tobytes()
+        except OverflowError: return None # Cannot occur in this file
+        step = max(1, math.ceil(self.pages / SCAN_EVENTS)) * PAGE_SIZE
+        size = len(self._map)
+        start = 0
+        while start < size:
+            end = min(start + step, size)
+            # The value may straddle this step's end, so search a little past it
+            at = self._map.find(needle, start, min(end + len(needle) - 1, size))
+            while at >= 0 and at % self.itemsize:
+                at = self._map.find(needle, at + 1, min(end + len(needle) - 1, size))
+            last = (at if at >= 0 else end - 1) // PAGE_SIZE
+            if on_pages: on_pages(start // PAGE_SIZE, last)
+            if at >= 0: return at // self.itemsize
+            start = end
+        return None
+
+    def is_sorted(self):
+        """True if the items are ascending; checked CHUNK_ITEMS at a time."""
+        view, n = self.view, len(self.view)
+        for lo in range(0, n, CHUNK_ITEMS):
+            chunk = view[max(0, lo - 1):lo + CHUNK_ITEMS] # Overlap one item with the previous chunk
+            try:
+                if not is_sorted(chunk): return False
+            finally:
+                chunk.release()
+        return True
+
+
+def _read_run(f, start, count, typecode, itemsize):
+    # Values of the run of count items at item offset start in f, read
+    # BLOCK_ITEMS at a time; runs share f, so every read seeks first
+    pos, end = start * itemsize, (start + count) * itemsize
+    while pos < end:
+        f.seek(pos)
+        block = array(typecode)
+        block.frombytes(f.read(min(BLOCK_ITEMS * itemsize, end - pos)))
+        pos += len(block) * itemsize
+        yield from block
+
+
+def external_sort(src, dst, chunk_items=CHUNK_ITEMS, on_pages=None, should_stop=None):
+    """Sort the binary integer file src into dst, in bounded memory.
+
+    Sorted runs of chunk_items items are written one after another to
+    a temporary file, then merged at most MERGE_FAN_IN at a time (in
+    extra passes over temporary files if there are more) into dst, so
+    at most two temporary files are open however large src is.
+    on_pages(phase, first, last) reports the pages of src read ("read")
+    and of dst written ("write"); both files have the same page
+    numbering. should_stop() is polled between steps and, if true,
+    abandons the sort (dst is left incomplete). Returns the number of
+    runs, or None if stopped.
+
+    dst's extension must give the same integer type as src's (see
+    datasets.binary_type), since readers go by it; ValueError otherwise.
+    """
+    f = tempfile.TemporaryFile()
+    runs = [] # (start, count) in items, within f
+    try:
+        with MappedArray(src) as data:
+            typecode, itemsize, n = data.typecode, data.itemsize, len(data)
+            if binary_type(dst) != typecode:
+                raise ValueError(f"{os.path.basename(dst)} would be read as a different integer type "
+                                 f"than {os.path.basename(src)}")
+            for lo in range(0, n, chunk_items):
+                if should_stop and should_stop(): return None
+                hi = min(lo + chunk_items, n)
+                if np is not None: run = np.sort(np.asarray(data.view[lo:hi]))
+                else: run = array(typecode, sorted(data[lo:hi]))
+                run.tofile(f)
+                runs.append((lo, hi - lo))
+                if on_pages: on_pages("read", data.page_of(lo), data.page_of(hi - 1))
+        count = len(runs)
+
+        # Bound the runs merged at once (and their buffers): merge groups into longer runs first
+        while len(runs) > MERGE_FAN_IN:
+            merged_file = tempfile.TemporaryFile()
+            merged, start = [], 0
+            try:
+                for k in range(0, len(runs), MERGE_FAN_IN):
+                    group = runs[k:k + MERGE_FAN_IN]
+                    if not _merge(f, group, merged_file, typecode, itemsize, None, should_stop): return None
+                    items = sum(c for _, c in group)
+                    merged.append((start, items))
+                    start += items
+            finally:
+                f.close()
+                f = merged_file
+            runs = merged
+
+        with open(dst, "wb") as out:
+            if not _merge(f, runs, out, typecode, itemsize, on_pages, should_stop): return None
+        return count
+    finally:
+        f.close()
+
+
+def _merge(f, runs, out, typecode, itemsize, on_pages, should_stop):
+    # k-way merge of the sorted runs of f, appended to out; False if stopped
+    block = array(typecode)
+    written = 0
+    for value in heapq.merge(*(_read_run(f, start, count, typecode, itemsize) for start, count in runs)):
+        block.append(value)
+        if len(block) == BLOCK_ITEMS:
+            if should_stop and should_stop(): return False
+            written += _flush(block, out, written, itemsize, on_pages)
+    _flush(block, out, written, itemsize, on_pages)
+    return True
+
+
+def _flush(block, out, written, itemsize, on_pages):
+    # Append block to out, report its pages and empty it; return its length
+    count = len(block)
+    if not count: return 0
+    block.tofile(out)
+    if on_pages: on_pages("write", written * itemsize // PAGE_SIZE, ((written + count) * itemsize - 1) // PAGE_SIZE)
+    del block[:]
+    return count
+
+
+class PageMap:
+    """Grid of a file's pages on a Tk canvas, colored as they are touched.
+
+    Files of more than MAX_CELLS pages share each cell between
+    consecutive pages; a cell shows the last color given to any of them.
+    draw() only reconfigures the cells touched since the previous draw.
+
+    Attributes:
+        pages: Pages in the file shown.
+        touched: Distinct pages touched since the last load() or reset().
+    """
+    def __init__(self, canvas, width, height, color, offset=10):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.color = color
+        self.offset = offset
+        self.pages = 0
+        self.touched = 0
+        self._cells = []
+        self._shown = []
+        self._wanted = []
+        self._dirty = set()
+        self._seen = bytearray()
+        self._per_cell = 1
+
+    def load(self, pages):
+        self.canvas.delete("all")
+        self.pages = pages
+        self._cells, self._shown = [], []
+        if not pages: return self.reset()
+        self._per_cell = max(1, math.ceil(pages / MAX_CELLS))
+        cells = math.ceil(pages / self._per_cell)
+        w, h = self.width - 2 * self.offset, self.height - 2 * self.offset
+        cols = max(1, math.ceil(math.sqrt(cells * w / h)))
+        size = min(w / cols, h / math.ceil(cells / cols))
+        gap = 1 if size > 3 else 0
+        create = self.canvas.create_rectangle
+        for k in range(cells):
+            r, c = divmod(k, cols)
+            x, y = self.offset + c * size, self.offset + r * size
+            self._cells.append(create(x, y, x + size - gap, y + size - gap, fill=self.color, outline=""))
+        self._shown = [self.color] * cells
+        self.reset()
+
+    def reset(self):
+        self._wanted = [self.color] * len(self._cells)
+        self._dirty = set(range(len(self._cells)))
+        self._seen = bytearray(self.pages)
+        self.touched = 0
+
+    def touch(self, first, last, color):
+        """Color pages first..last."""
+        count = last + 1 - first
+        self.touched += count - self._seen[first:last + 1].count(1)
+        self._seen[first:last + 1] = b"\x01" * count
+        c0, c1 = first // self._per_cell, last // self._per_cell
+        self._wanted[c0:c1 + 1] = [color] * (c1 + 1 - c0)
+        self._dirty.update(range(c0, c1 + 1))
+
+    def draw(self):
+        canvas, cells, shown, wanted = self.canvas, self._cells, self._shown, self._wanted
+        for k in self._dirty:
+            if shown[k] != wanted[k]:
+                canvas.itemconfig(cells[k], fill=wanted[k])
+                shown[k] = wanted[k]
+        self._dirty = set()
@@ -0,0 +1,611 @@
+"""Headless pathfinding engine shared by the grid maze solvers.
+
+Pure Python implementations of Dijkstra, A* (both also bidirectional),
+Jump Point Search, BFS and DFS over a weighted 4-connected grid. Nothing here imports
+tkinter: the GUI apps pass an ``on_visit`` callback to animate the
+search, while batch jobs and profilers call the same functions without
+one and run at full speed.
+
+The grid is a single ``bytearray`` surrounded by a one-cell wall border,
+so a cell is a flat integer id and its neighbors are ``id + offset`` with
+no bounds checks. Distances, parents and the closed set are flat arrays
+allocated once per search; a path is only rebuilt from the parent
+pointers when ``SearchResult.path`` is read.
+"""
+
+import heapq
+import random
+from array import array
+from collections import deque
+
+from .pqueue import make_queue
+
+# Cell encoding shared by every maze app
+PATH = 0
+WALL = 1
+MUD = 5
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+NO_PARENT = -1
+INF = 2**31 - 1
+
+# Cost of stepping into a cell, indexed by its code; 0 = impassable
+STEP_COST = [0] * 256
+STEP_COST[PATH] = 1
+STEP_COST[MUD] = 5
+
+
+class Grid:
+    """Maze grid stored as one flat bytearray.
+
+    Cell (r, c) lives at id ``(r + 1) * stride + (c + 1)``; the extra
+    row/column on every side is permanently WALL so searches never step
+    outside the maze.
+
+    Attributes:
+        rows: Number of rows.
+        cols: Number of columns.
+        stride: Length of one padded row (cols + 2).
+        cells: Flat bytearray of cell codes (PATH, WALL or MUD).
+        offsets: Id deltas to the up, down, left and right neighbors.
+    """
+    def __init__(self, rows, cols, fill=WALL):
+        self.rows = rows
+        self.cols = cols
+        self.stride = cols + 2
+        border = bytes([WALL]) * self.stride
+        row = bytes([WALL]) + bytes([fill]) * cols + bytes([WALL])
+        self.cells = bytearray(border + row * rows + border)
+        self.offsets = (-self.stride, self.stride, -1, 1)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a grid from a list of row lists of cell codes."""
+        grid = cls(len(rows), len(rows[0]) if rows else 0)
+        for r, row in enumerate(rows):
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.cols] = bytes(row)
+        return grid
+
+    def to_rows(self):
+        return [list(self.cells[self.index(r, 0):self.index(r, 0) + self.cols]) for r in range(self.rows)]
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    @property
+    def size(self):
+        """Length of the flat buffer (including the border)."""
+        return len(self.cells)
+
+    def index(self, r, c):
+        return (r + 1) * self.stride + c + 1
+
+    def cell(self, i):
+        r, c = divmod(i, self.stride)
+        return r - 1, c - 1
+
+    def in_bounds(self, r, c):
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def __getitem__(self, pos):
+        r, c = pos
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(f"cell {pos} outside {self.rows}x{self.cols} grid")
+        return self.cells[(r + 1) * self.stride + c + 1]
+
+    def __setitem__(self, pos, value):
+        r, c = pos
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(f"cell {pos} outside {self.rows}x{self.cols} grid")
+        self.cells[(r + 1) * self.stride + c + 1] = value
+
+    def is_open(self, r, c):
+        return self[r, c] != WALL
+
+    def cost(self, r, c):
+        # Cost of stepping *into* a cell: mud is slower than plain path
+        return STEP_COST[self[r, c]]
+
+    def neighbors(self, i, offsets=None):
+        """Yield (neighbor id, step cost) for the open cells around id i."""
+        cells = self.cells
+        for off in offsets or self.offsets:
+            j = i + off
+            weight = STEP_COST[cells[j]]
+            if weight:
+                yield j, weight
+
+
+class SearchResult:
+    """Outcome of a single grid search.
+
+    Attributes:
+        cost: Total cost of the path, or None when no path exists.
+        visited: Number of cells expanded by the search.
+        parents: Flat array of parent ids (NO_PARENT for unreached cells).
+        peak_frontier: Largest size the open set (heap, queue or stack)
+            reached, stale heap entries included.
+        queue: Name of the priority queue used (see algoviz.pqueue), if any.
+    """
+    def __init__(self, grid, start, end, cost, visited, parents, peak_frontier=0, queue=None):
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.cost = cost
+        self.visited = visited
+        self.parents = parents
+        self.peak_frontier = peak_frontier
+        self.queue = queue
+        self._path = None
+
+    @property
+    def found(self):
+        return self.cost is not None
+
+    @property
+    def path(self):
+        """List of (row, col) cells from start to end, empty if unreachable."""
+        if self._path is None:
+            self._path = trace_path(self.grid, self.parents, self.start, self.end) if self.found else []
+        return self._path
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def trace_path(grid, parents, start, end):
+    """Follow parent ids back from end and return the (row, col) path."""
+    stop = grid.index(*start)
+    i = grid.index(*end)
+    path = [grid.cell(i)]
+    while i != stop:
+        i = parents[i]
+        path.append(grid.cell(i))
+    path.reverse()
+    return path
+
+
+def _new_parents(grid):
+    return array('i', [NO_PARENT]) * grid.size
+
+
+def _new_dist(grid):
+    return array('i', [INF]) * grid.size
+
+
+def shortest_path_tree(grid, source, queue="auto"):
+    """Dijkstra from source to every reachable cell.
+
+    Returns flat (dist, parents) arrays indexed by cell id; unreachable
+    cells keep INF and NO_PARENT.
+    """
+    cells, offsets = grid.cells, grid.offsets
+    s = grid.index(*source)
+    parents = _new_parents(grid)
+    dist = _new_dist(grid)
+    closed = bytearray(grid.size)
+
+    dist[s] = 0
+    pq = make_queue(step_weights(grid), queue)
+    push, pop = pq.push, pq.pop
+    push(0, s)
+
+    while pq:
+        cost, i = pop()
+        if closed[i]: continue
+        closed[i] = 1
+        for off in offsets:
+            j = i + off
+            weight = STEP_COST[cells[j]]
+            if not weight: continue
+            new_cost = cost + weight
+            if new_cost < dist[j]:
+                dist[j] = new_cost
+                parents[j] = i
+                push(new_cost, j)
+
+    return dist, parents
+
+
+def step_weights(grid):
+    """Set of step costs that occur in the grid (e.g. {1, 5} with mud)."""
+    cells = grid.cells
+    return {STEP_COST[code] for code in range(256) if STEP_COST[code] and bytes((code,)) in cells}
+
+
+def dijkstra(grid, start, end, on_visit=None, queue="auto"):
+    """Uniform-cost search from start to end.
+
+    on_visit(r, c) is called for every expanded cell except the goal.
+    queue names the priority queue (see algoviz.pqueue.QUEUES); "auto"
+    picks a bucket queue for the grid's small integer weights.
+    """
+    cells, offsets, cell = grid.cells, grid.offsets, grid.cell
+    s = grid.index(*start)
+    t = grid.index(*end)
+    parents = _new_parents(grid)
+    dist = _new_dist(grid)
+    closed = bytearray(grid.size)
+    visited = 0
+    peak = 1
+
+    # Entries: (cost, cell id); equal costs pop in insertion order
+    dist[s] = 0
+    pq = make_queue(step_weights(grid), queue)
+    push, pop = pq.push, pq.pop
+    push(0, s)
+
+    while pq:
+        cost, i = pop()
+        if closed[i]: continue
+        closed[i] = 1
+        visited += 1
+
+        if i == t:
+            return SearchResult(grid, start, end, cost, visited, parents, peak, pq.name)
+
+        if on_visit: on_visit(*cell(i))
+
+        for off in offsets:
+            j = i + off
+            weight = STEP_COST[cells[j]]
+            if not weight: continue
+            new_cost = cost + weight
+            if new_cost < dist[j]:
+                dist[j] = new_cost
+                parents[j] = i
+                push(new_cost, j)
+                if len(pq) > peak: peak = len(pq)
+
+    return SearchResult(grid, start, end, None, visited, parents, peak, pq.name)
+
+
+def astar(grid, start, end, on_visit=None, heuristic=None, potential=None):
+    """A* search from start to end.
+
+    heuristic(cell) defaults to the Manhattan distance to end; a
+    potential(i) over flat cell ids (e.g. Landmarks.potential(end))
+    takes precedence and skips the (row, col) conversion. Ties on f are
+    broken by the smaller h so the search prefers cells closer to the
+    goal.
+    """
+    cells, offsets, cell = grid.cells, grid.offsets, grid.cell
+    s = grid.index(*start)
+    t = grid.index(*end)
+    parents = _new_parents(grid)
+    g_costs = _new_dist(grid)
+    closed = bytearray(grid.size)
+    visited = 0
+    peak = 1
+
+    if potential is not None:
+        h = potential
+    elif heuristic is None:
+        stride = grid.stride
+        tr, tc = divmod(t, stride)
+        def h(j):
+            r, c = divmod(j, stride)
+            return abs(r - tr) + abs(c - tc)
+    else:
+        h = lambda j: heuristic(cell(j))
+
+    # Heap entries: (f, h, cell id)
+    g_costs[s] = 0
+    start_h = h(s)
+    pq = [(start_h, start_h, s)]
+
+    while pq:
+        _, _, i = heapq.heappop(pq)
+        if closed[i]: continue
+        closed[i] = 1
+        visited += 1
+
+        if i == t:
+            return SearchResult(grid, start, end, g_costs[i], visited, parents, peak)
+
+        if on_visit: on_visit(*cell(i))
+
+        g = g_costs[i]
+        for off in offsets:
+            j = i + off
+            weight = STEP_COST[cells[j]]
+            if not weight: continue
+            new_g = g + weight
+            if new_g < g_costs[j]:
+                g_costs[j] = new_g
+                parents[j] = i
+                new_h = h(j)
+                heapq.heappush(pq, (new_g + new_h, new_h, j))
+                if len(pq) > peak: peak = len(pq)
+
+    return SearchResult(grid, start, end, None, visited, parents, peak)
+
+
+def bidirectional_dijkstra(grid, start, end, on_visit=None, on_visit_back=None):
+    """Dijkstra run from both ends at once, meeting in the middle.
+
+    on_visit(r, c) is called for cells expanded by the forward search and
+    on_visit_back(r, c) (defaulting to on_visit) for the backward one.
+    """
+    return _bidirectional(grid, start, end, on_visit, on_visit_back, None)
+
+
+def bidirectional_astar(grid, start, end, on_visit=None, on_visit_back=None):
+    """Bidirectional A* with average Manhattan potentials.
+
+    Both searches use p(v) = (h_end(v) - h_start(v)) / 2 (negated going
+    backward), which keeps the reduced step costs non-negative, so the
+    same stopping rule as bidirectional Dijkstra still gives an optimal
+    path.
+    """
+    stride = grid.stride
+    sr, sc = divmod(grid.index(*start), stride)
+    tr, tc = divmod(grid.index(*end), stride)
+    def potential(j):
+        # Twice the forward potential, to stay in integers
+        r, c = divmod(j, stride)
+        return abs(r - tr) + abs(c - tc) - abs(r - sr) - abs(c - sc)
+    return _bidirectional(grid, start, end, on_visit, on_visit_back, potential)
+
+
+def _bidirectional(grid, start, end, on_visit, on_visit_back, potential):
+    # Heap keys are doubled distances (plus twice the potential for A*),
+    # ties going to the deeper cell. The search stops once the two
+    # smallest keys add up to at least twice the best meeting cost: no
+    # path through an unsettled cell can be shorter. Stepping into a
+    # cell costs that cell's weight, so going backward from v to u
+    # costs the weight of v.
+    cells, offsets, cell = grid.cells, grid.offsets, grid.cell
+    on_visit_back = on_visit_back or on_visit
+    s = grid.index(*start)
+    t = grid.index(*end)
+    if s == t:
+        return SearchResult(grid, start, end, 0, 1, _new_parents(grid), 1)
+
+    dist = (_new_dist(grid), _new_dist(grid))
+    parents = (_new_parents(grid), _new_parents(grid)) # Backward: next cell toward end
+    closed = (bytearray(grid.size), bytearray(grid.size))
+    sign = (1, -1)
+    pot = potential or (lambda j: 0)
+    dist[0][s] = dist[1][t] = 0
+    heaps = ([(pot(s), 0, s)], [(-pot(t), 0, t)]) # (key, -distance, cell id)
+    visits = (on_visit, on_visit_back)
+
+    best, meet = INF, -1
+    visited = 0
+    peak = 2
+
+    while heaps[0] and heaps[1]:
+        for side in (0, 1): # Drop entries for cells already settled
+            heap, done = heaps[side], closed[side]
+            while heap and done[heap[0][2]]: heapq.heappop(heap)
+        if not heaps[0] or not heaps[1]: break
+        if heaps[0][0][0] + heaps[1][0][0] >= 2 * best: break
+
+        # Expand the side with the smaller key
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        _, _, i = heapq.heappop(heaps[side])
+        d, par, done = dist[side], parents[side], closed[side]
+        other = dist[1 - side]
+        done[i] = 1
+        visited += 1
+        if visits[side]: visits[side](*cell(i))
+
+        d_i = d[i]
+        back_weight = STEP_COST[cells[i]] # Cost of u -> i when searching backward
+        for off in offsets:
+            j = i + off
+            weight = STEP_COST[cells[j]]
+            if not weight: continue
+            new_d = d_i + (weight if side == 0 else back_weight)
+            if new_d < d[j]:
+                d[j] = new_d
+                par[j] = i
+                heapq.heappush(heaps[side], (2 * new_d + sign[side] * pot(j), -new_d, j))
+                if other[j] != INF and new_d + other[j] < best:
+                    best, meet = new_d + other[j], j
+        if len(heaps[0]) + len(heaps[1]) > peak: peak = len(heaps[0]) + len(heaps[1])
+
+    if meet < 0:
+        return SearchResult(grid, start, end, None, visited, parents[0], peak)
+
+    # Splice the backward half onto the forward parent pointers
+    forward, backward = parents
+    i = meet
+    while i != t:
+        j = backward[i]
+        forward[j] = i
+        i = j
+    return SearchResult(grid, start, end, best, visited, forward, peak)
+
+
+def uniform_cost(grid):
+    """True if every open cell costs the same (no mud), as JPS requires."""
+    return not grid.cells.translate(None, bytes((PATH, WALL)))
+
+
+def jps(grid, start, end, on_visit=None):
+    """Jump Point Search for the 4-connected grid.
+
+    A* that only pushes jump points: from each expanded cell it scans
+    straight ahead until a wall, the goal, or a cell with a forced
+    neighbor, skipping whole corridors and open areas in one step.
+    Follows the never-move-diagonally rules of PathFinding.js, where a
+    vertical scan also stops at any cell with a horizontal jump point.
+
+    Only valid when every step costs the same: on grids with mud it
+    falls back to astar(). on_visit(r, c) is called for every expanded
+    jump point except the goal.
+    """
+    if not uniform_cost(grid):
+        return astar(grid, start, end, on_visit)
+
+    cells, cell, stride = grid.cells, grid.cell, grid.stride
+    s = grid.index(*start)
+    t = grid.index(*end)
+    parents = _new_parents(grid)
+    g_costs = _new_dist(grid)
+    closed = bytearray(grid.size)
+    visited = 0
+    peak = 1
+
+    tr, tc = divmod(t, stride)
+    def h(j):
+        r, c = divmod(j, stride)
+        return abs(r - tr) + abs(c - tc)
+
+    def jump_h(i, d):
+        # Scan along a row; return the next jump point or -1
+        while True:
+            i += d
+            if cells[i]: return -1
+            if i == t: return i
+            if (not cells[i - stride] and cells[i - d - stride]) or (not cells[i + stride] and cells[i - d + stride]):
+                return i
+
+    def jump_v(i, d):
+        # Scan along a column, also stopping where a row scan would find something
+        while True:
+            i += d
+            if cells[i]: return -1
+            if i == t: return i
+            if (not cells[i - 1] and cells[i - d - 1]) or (not cells[i + 1] and cells[i - d + 1]):
+                return i
+            if jump_h(i, 1) >= 0 or jump_h(i, -1) >= 0:
+                return i
+
+    g_costs[s] = 0
+    start_h = h(s)
+    pq = [(start_h, start_h, s)]
+
+    while pq:
+        _, _, i = heapq.heappop(pq)
+        if closed[i]: continue
+        closed[i] = 1
+        visited += 1
+
+        if i == t:
+            _fill_segments(parents, s, t, stride)
+            return SearchResult(grid, start, end, g_costs[i], visited, parents, peak)
+
+        if on_visit: on_visit(*cell(i))
+
+        # Prune to the directions JPS allows given how we arrived
+        if i == s:
+            dirs = (-stride, stride, -1, 1)
+        else:
+            diff = i - parents[i]
+            if abs(diff) < stride: # Arrived horizontally
+                d = 1 if diff > 0 else -1
+                dirs = (d, -stride, stride)
+            else:
+                d = stride if diff > 0 else -stride
+                dirs = (d, -1, 1)
+
+        g = g_costs[i]
+        for d in dirs:
+            if cells[i + d]: continue
+            j = jump_h(i, d) if abs(d) == 1 else jump_v(i, d)
+            if j < 0 or closed[j]: continue
+            new_g = g + abs(j - i) // abs(d)
+            if new_g < g_costs[j]:
+                g_costs[j] = new_g
+                parents[j] = i
+                new_h = h(j)
+                heapq.heappush(pq, (new_g + new_h, new_h, j))
+                if len(pq) > peak: peak = len(pq)
+
+    return SearchResult(grid, start, end, None, visited, parents, peak)
+
+
+def _fill_segments(parents, s, t, stride):
+    # Jump point parents skip straight runs of cells; give every cell on
+    # the final path its own parent so trace_path() can walk it
+    i = t
+    while i != s:
+        j = parents[i]
+        d = (1 if i > j else -1) * (1 if abs(i - j) < stride else stride)
+        k = i
+        while k != j:
+            parents[k] = k - d
+            k -= d
+        i = j
+
+
+def bfs(grid, start, end, on_visit=None):
+    """Breadth-first search (shortest path by number of steps)."""
+    return _uninformed(grid, start, end, on_visit, depth_first=False, rng=None)
+
+
+def dfs(grid, start, end, on_visit=None, rng=None):
+    """Depth-first search with randomized neighbor order.
+
+    rng is any object with a ``shuffle`` method (defaults to the
+    ``random`` module) so runs can be made reproducible.
+    """
+    return _uninformed(grid, start, end, on_visit, depth_first=True, rng=rng or random)
+
+
+def _uninformed(grid, start, end, on_visit, depth_first, rng):
+    cells, cell = grid.cells, grid.cell
+    s = grid.index(*start)
+    t = grid.index(*end)
+    parents = _new_parents(grid)
+    dist = _new_dist(grid)
+    parents[s] = s  # Marks the start as discovered; trace_path stops here
+    dist[s] = 0
+
+    frontier = [s] if depth_first else deque([s])
+    offsets = list(grid.offsets)
+    expanded = 0
+    peak = 1
+
+    while frontier:
+        i = frontier.pop() if depth_first else frontier.popleft()
+        expanded += 1
+
+        if i == t:
+            return SearchResult(grid, start, end, dist[i], expanded, parents, peak)
+
+        if on_visit: on_visit(*cell(i))
+
+        if depth_first: rng.shuffle(offsets)
+
+        for off in offsets:
+            j = i + off
+            weight = STEP_COST[cells[j]]
+            if weight and parents[j] == NO_PARENT:
+                parents[j] = i
+                dist[j] = dist[i] + weight
+                frontier.append(j)
+        if len(frontier) > peak: peak = len(frontier)
+
+    return SearchResult(grid, start, end, None, expanded, parents, peak)
+
+
+ALGORITHMS = {
+    "Dijkstra": dijkstra,
+    "A*": astar,
+    "Bidirectional Dijkstra": bidirectional_dijkstra,
+    "Bidirectional A*": bidirectional_astar,
+    "JPS": jps,
+    "BFS": bfs,
+    "DFS": dfs,
+}
+
+
+def solve(name, grid, start, end, on_visit=None, rng=None):
+    """Run the algorithm registered under name (see ALGORITHMS).
+
+    rng is passed on to the randomized algorithms (DFS); the others
+    ignore it.
+    """
+    algorithm = ALGORITHMS[name]
+    if algorithm is dfs: return dfs(grid, start, end, on_visit=on_visit, rng=rng)
+    return algorithm(grid, start, end, on_visit=on_visit)
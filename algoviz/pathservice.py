@@ -0,0 +1,229 @@
+"""Cached shortest-path queries on a maze that is edited a cell at a time.
+
+A PathService owns one Grid and a 64-bit fingerprint of its contents.
+The fingerprint is a hash of the whole buffer when a maze is loaded,
+then kept up to date in O(1) per edit: changing cell i from code a to
+b XORs in splitmix64 keys for (i, a) and (i, b), so toggling a wall
+twice restores the old fingerprint exactly.
+
+Results are cached under (fingerprint, query) in one LRU bounded by an
+estimate of its size in bytes:
+
+* Dijkstra trees per source cell. A tree is settled lazily, only as
+  far as the queries so far needed, and resumed for farther targets,
+  so any query from a known source is answered from the tree.
+* Anything else an app wants to reuse (recorded event logs, landmark
+  tables) through memo().
+
+Old fingerprints stay cached, so undoing an edit finds its results
+again.
+"""
+
+import hashlib
+from array import array
+from collections import OrderedDict
+
+from .pathfinding import INF, NO_PARENT, STEP_COST, SearchResult, step_weights
+from .pqueue import make_queue
+
+MASK64 = (1 << 64) - 1
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+EVENT_BYTES = 120 # Rough size of one recorded event tuple
+
+
+def splitmix64(x):
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def cell_key(i, code):
+    """Hash contribution of cell id i holding code."""
+    return splitmix64(i << 8 | code)
+
+
+def grid_hash(grid):
+    """64-bit fingerprint of the whole grid (size and cells)."""
+    digest = hashlib.blake2b(grid.cells, digest_size=8, person=b"%dx%d" % (grid.rows, grid.cols))
+    return int.from_bytes(digest.digest(), "little")
+
+
+class LRUCache:
+    """Least-recently-used cache bounded by an estimate of its size in bytes.
+
+    Attributes:
+        max_bytes: Budget; the oldest entries are evicted beyond it.
+        nbytes: Current estimated size.
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict() # key -> (value, nbytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None: return default
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, nbytes):
+        """Store value (or update its size), then evict down to max_bytes."""
+        old = self._entries.pop(key, None)
+        if old is not None: self.nbytes -= old[1]
+        self._entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+
+class ShortestPathTree:
+    """Dijkstra from one source, settled lazily as far as queries need.
+
+    Attributes:
+        source: (row, col) of the source.
+        dist: Flat distances (INF where not reached yet).
+        parents: Flat parent ids.
+        order: Cell ids in the order they were settled.
+        complete: True once every reachable cell is settled.
+    """
+    def __init__(self, grid, source):
+        self.grid = grid
+        self.source = source
+        self.dist = array("i", [INF]) * grid.size
+        self.parents = array("i", [NO_PARENT]) * grid.size
+        self.order = array("i")
+        self.complete = False
+        self._closed = bytearray(grid.size)
+        self._pq = make_queue(step_weights(grid))
+        self._steps = self._settle()
+
+    @property
+    def nbytes(self):
+        return 9 * len(self._closed) + 4 * len(self.order) + 32 * len(self._pq)
+
+    def _settle(self):
+        # Plain Dijkstra, paused after every settled cell
+        grid, dist, parents, closed, order = self.grid, self.dist, self.parents, self._closed, self.order
+        cells, offsets = grid.cells, grid.offsets
+        push, pop = self._pq.push, self._pq.pop
+        s = grid.index(*self.source)
+        dist[s] = 0
+        push(0, s)
+        while self._pq:
+            cost, i = pop()
+            if closed[i]: continue
+            closed[i] = 1
+            order.append(i)
+            for off in offsets:
+                j = i + off
+                weight = STEP_COST[cells[j]]
+                if not weight: continue
+                new_cost = cost + weight
+                if new_cost < dist[j]:
+                    dist[j] = new_cost
+                    parents[j] = i
+                    push(new_cost, j)
+            yield i
+
+    def reach(self, end):
+        """Settle cells until end is settled; return its cost or None."""
+        t = self.grid.index(*end)
+        if not self._closed[t] and not self.complete:
+            for i in self._steps:
+                if i == t: break
+            else:
+                self.complete = True
+        return self.dist[t] if self._closed[t] else None
+
+    def result(self, end, on_visit=None):
+        """SearchResult for end, as dijkstra() would return it.
+
+        on_visit(r, c) is replayed for every cell settled before end.
+        """
+        cost = self.reach(end)
+        visited = self.order.index(self.grid.index(*end)) + 1 if cost is not None else len(self.order)
+        if on_visit:
+            cell = self.grid.cell
+            for i in self.order[:visited - 1 if cost is not None else visited]:
+                on_visit(*cell(i))
+        return SearchResult(self.grid, self.source, end, cost, visited, self.parents, queue=self._pq.name)
+
+
+class PathService:
+    """Shortest-path queries on one grid, cached per grid state.
+
+    Load a maze with load() and make every later edit through
+    set_cell(), so the fingerprint stays in step with the cells.
+
+    Attributes:
+        grid: The grid being served.
+        hash: Fingerprint of its current contents.
+        cache: LRUCache shared by trees and memo() entries.
+        hits, misses: Cache statistics.
+    """
+    def __init__(self, grid=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.grid = None
+        self.hash = 0
+        self.cache = LRUCache(max_bytes)
+        self.hits = self.misses = 0
+        if grid is not None: self.load(grid)
+
+    def load(self, grid):
+        """Serve a new grid (hashing all of it once)."""
+        self.grid = grid
+        self.hash = grid_hash(grid)
+
+    def set_cell(self, r, c, code):
+        """Write one cell and update the fingerprint in O(1)."""
+        grid = self.grid
+        old = grid[r, c]
+        if old == code: return
+        grid[r, c] = code
+        i = grid.index(r, c)
+        self.hash ^= cell_key(i, old) ^ cell_key(i, code)
+
+    def tree(self, source):
+        """The (possibly partial) shortest-path tree from source."""
+        key = ("tree", self.hash, source)
+        tree = self.cache.get(key)
+        if tree is None:
+            self.misses += 1
+            tree = ShortestPathTree(self.grid, source)
+        else:
+            self.hits += 1
+        return tree
+
+    def dijkstra(self, start, end, on_visit=None):
+        """Same result as pathfinding.dijkstra(), from the cached tree of start."""
+        tree = self.tree(start)
+        result = tree.result(end, on_visit)
+        self.cache.put(("tree", self.hash, start), tree, tree.nbytes) # Size may have grown
+        return result
+
+    def memo(self, key, compute, nbytes=lambda log: len(log) * EVENT_BYTES):
+        """Return compute() for key under the current grid, computing it once.
+
+        nbytes(value) estimates the value's size for the cache budget;
+        the default suits an EventLog.
+        """
+        full = ("memo", self.hash) + tuple(key)
+        value = self.cache.get(full)
+        if value is None:
+            self.misses += 1
+            value = compute()
+            self.cache.put(full, value, nbytes(value))
+        else:
+            self.hits += 1
+        return value
@@ -0,0 +1,137 @@
+"""Tk replay of algorithm event logs.
+
+The algorithms record an EventLog as fast as they can (algoviz.events);
+a Player renders it on the Tk main loop with ``root.after`` at a
+user-selected frame rate, so the run time no longer depends on the
+animation and long runs can be paused, stepped, scrubbed or skipped.
+"""
+
+import tkinter as tk
+
+
+class Player:
+    """Play/pause/step/seek controls that feed an event log to the view.
+
+    The owning app supplies the callbacks and packs ``frame`` wherever
+    it wants the control bar.
+
+    Attributes:
+        frame: The control bar widget.
+        apply: apply(event) updates the view state for one event.
+        reset: reset() restores the view to before the first event, so
+            seeking backwards can replay from the start.
+        render: render() redraws once per frame after a batch of events.
+        on_finish: Called whenever playback reaches the end of the log.
+        log: The event log being played.
+        pos: Number of events applied so far.
+    """
+    def __init__(self, root, parent, apply, reset=None, render=None, on_finish=None,
+                 fps=30, speed=1, bg="#f0f0f0"):
+        self.root = root
+        self.apply = apply
+        self.reset = reset
+        self.render = render
+        self.on_finish = on_finish
+
+        self.log = []
+        self.pos = 0
+        self.playing = False
+        self._job = None
+
+        self.fps_var = tk.IntVar(value=fps)
+        self.speed_var = tk.IntVar(value=speed)
+        self.seek_var = tk.IntVar(value=0)
+
+        self.frame = tk.Frame(parent, bg=bg)
+        self._setup_ui(bg)
+
+    def _setup_ui(self, bg):
+        btn_style = {"bg": "#555", "fg": "white", "font": ("Segoe UI", 9, "bold"), "relief": "flat", "padx": 8}
+        scale_style = {"orient": tk.HORIZONTAL, "bg": bg, "highlightthickness": 0, "font": ("Segoe UI", 8)}
+
+        self.play_btn = tk.Button(self.frame, text="Play", width=6, command=self.toggle, **btn_style)
+        self.play_btn.pack(side=tk.LEFT, padx=3)
+        tk.Button(self.frame, text="Step", command=self.step, **btn_style).pack(side=tk.LEFT, padx=3)
+        tk.Button(self.frame, text="End", command=self.skip_to_end, **btn_style).pack(side=tk.LEFT, padx=3)
+
+        self.seek_scale = tk.Scale(self.frame, label="Event", from_=0, to=0, length=220,
+                                   variable=self.seek_var, command=self._on_seek, **scale_style)
+        self.seek_scale.pack(side=tk.LEFT, padx=6)
+        tk.Scale(self.frame, label="FPS", from_=1, to=120, length=90,
+                 variable=self.fps_var, **scale_style).pack(side=tk.LEFT, padx=3)
+        tk.Scale(self.frame, label="Events/frame", from_=1, to=1000, length=120,
+                 variable=self.speed_var, **scale_style).pack(side=tk.LEFT, padx=3)
+
+    @property
+    def finished(self):
+        return self.pos >= len(self.log)
+
+    def load(self, log, autoplay=True):
+        """Replace the current log and optionally start playing it."""
+        self.pause()
+        self.log = log
+        self.pos = 0
+        self.seek_scale.config(to=len(log))
+        self.seek_var.set(0)
+        if autoplay: self.play()
+
+    def clear(self):
+        """Stop playback and drop the log (e.g. after the input changed)."""
+        self.load([], autoplay=False)
+
+    def play(self):
+        if self.finished: return
+        self.playing = True
+        self.play_btn.config(text="Pause")
+        if self._job is None:
+            self._job = self.root.after(0, self._tick)
+
+    def pause(self):
+        self.playing = False
+        self.play_btn.config(text="Play")
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def toggle(self):
+        if self.playing: self.pause()
+        else: self.play()
+
+    def step(self):
+        self.pause()
+        self._advance(1)
+
+    def skip_to_end(self):
+        self.seek(len(self.log))
+
+    def seek(self, pos):
+        pos = max(0, min(pos, len(self.log)))
+        if pos < self.pos:
+            if self.reset: self.reset()
+            self.pos = 0
+        self._advance(pos - self.pos)
+
+    def _on_seek(self, value):
+        pos = int(float(value))
+        if pos != self.pos:
+            self.pause()
+            self.seek(pos)
+
+    def _tick(self):
+        self._job = None
+        if not self.playing: return
+        self._advance(max(1, self.speed_var.get()))
+        if self.playing:
+            self._job = self.root.after(max(1, 1000 // max(1, self.fps_var.get())), self._tick)
+
+    def _advance(self, count):
+        end = min(self.pos + count, len(self.log))
+        apply, log = self.apply, self.log
+        for i in range(self.pos, end):
+            apply(log[i])
+        self.pos = end
+        if self.render: self.render()
+        self.seek_var.set(self.pos)
+        if self.finished and self.log:
+            self.pause()
+            if self.on_finish: self.on_finish()
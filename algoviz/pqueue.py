@@ -0,0 +1,222 @@
+"""Priority queues for the shortest-path solvers.
+
+All queues share one small interface: ``push(key, item)``,
+``pop() -> (key, item)`` and ``len()``. Equal keys come out in
+insertion order for the heap and the bucket queue.
+
+The grid mazes only ever step with integer weights 1 and 5, so
+Dijkstra does not need a comparison heap: a BucketQueue (Dial's
+algorithm) pops in O(1) amortized, and a RadixHeap covers larger
+integer weights. Both are *monotone*: a pushed key must not be
+smaller than the last popped one, which always holds for Dijkstra.
+make_queue() picks one from the set of weights a search can meet.
+
+IndexedHeap is for searches over a small, known set of nodes (the
+graph apps): it holds each node at most once and lowers its key in
+place instead of queueing duplicates.
+"""
+
+import heapq
+import itertools
+from collections import deque
+
+BUCKET_LIMIT = 1024 # Largest step weight handled with buckets
+
+
+class HeapQueue:
+    """Binary heap (heapq) for any comparable keys."""
+    name = "heap"
+
+    def __init__(self):
+        self._heap = []
+        self._tie = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, key, item):
+        heapq.heappush(self._heap, (key, next(self._tie), item))
+
+    def pop(self):
+        key, _, item = heapq.heappop(self._heap)
+        return key, item
+
+
+class BucketQueue:
+    """Dial's bucket queue for integer keys with bounded steps.
+
+    A circular array of max_step + 1 FIFO buckets; every key pushed
+    must lie within max_step of the last key popped, so the bucket
+    index key % len(buckets) is never shared by two different keys.
+    """
+    name = "bucket"
+
+    def __init__(self, max_step):
+        self._buckets = [deque() for _ in range(max_step + 1)]
+        self._key = 0 # Last popped key; pop() scans forward from here
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, key, item):
+        n = len(self._buckets)
+        if key < self._key: raise ValueError(f"key {key} below the last popped key {self._key}")
+        if not self._size and key - self._key >= n: self._key = key # Skip the empty stretch
+        self._buckets[key % n].append(item)
+        self._size += 1
+
+    def pop(self):
+        if not self._size: raise IndexError("pop from an empty queue")
+        buckets, key = self._buckets, self._key
+        n = len(buckets)
+        bucket = buckets[key % n]
+        while not bucket:
+            key += 1
+            bucket = buckets[key % n]
+        self._key = key
+        self._size -= 1
+        return key, bucket.popleft()
+
+
+class RadixHeap:
+    """Monotone radix heap for non-negative integer keys.
+
+    Bucket b holds keys whose highest bit differing from the last popped
+    key is bit b - 1 (bucket 0: keys equal to it). Popping only rescans
+    the lowest non-empty bucket, and each key moves down at most once
+    per bit, so operations are O(log C) amortized for key range C.
+    """
+    name = "radix"
+
+    def __init__(self):
+        self._buckets = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, key, item):
+        if key < self._last: raise ValueError(f"key {key} below the last popped key {self._last}")
+        self._buckets[(key ^ self._last).bit_length()].append((key, item))
+        self._size += 1
+
+    def pop(self):
+        if not self._size: raise IndexError("pop from an empty queue")
+        buckets = self._buckets
+        if not buckets[0]:
+            b = 1
+            while not buckets[b]: b += 1
+            entries, buckets[b] = buckets[b], []
+            last = self._last = min(entry[0] for entry in entries)
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self._size -= 1
+        return buckets[0].pop()
+
+
+class IndexedHeap:
+    """Binary min-heap over the indices 0..n-1 with decrease-key.
+
+    Each index is queued at most once, so the heap never holds more
+    than n entries and needs no stale-entry checks. Equal keys pop the
+    lowest index first.
+    """
+    name = "indexed"
+
+    def __init__(self, n):
+        self._heap = []
+        self._pos = [-1] * n    # index -> position in _heap, -1 when not queued
+        self._keys = [None] * n # index -> (key, index)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, i):
+        return self._pos[i] >= 0
+
+    def push(self, key, i):
+        """Queue index i with key, or lower its key if it is already queued.
+
+        Returns False (and changes nothing) if i is queued with a key
+        that is not larger.
+        """
+        entry = (key, i)
+        pos = self._pos[i]
+        if pos < 0:
+            self._keys[i] = entry
+            self._heap.append(i)
+            self._sift_up(len(self._heap) - 1)
+            return True
+        if entry < self._keys[i]:
+            self._keys[i] = entry
+            self._sift_up(pos)
+            return True
+        return False
+
+    def pop(self):
+        heap, pos = self._heap, self._pos
+        i = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        pos[i] = -1
+        return self._keys[i][0], i
+
+    def _sift_up(self, n):
+        heap, pos, keys = self._heap, self._pos, self._keys
+        i = heap[n]
+        entry = keys[i]
+        while n:
+            parent = (n - 1) >> 1
+            j = heap[parent]
+            if not entry < keys[j]: break
+            heap[n] = j
+            pos[j] = n
+            n = parent
+        heap[n] = i
+        pos[i] = n
+
+    def _sift_down(self, n):
+        heap, pos, keys = self._heap, self._pos, self._keys
+        size = len(heap)
+        i = heap[n]
+        entry = keys[i]
+        while True:
+            child = 2 * n + 1
+            if child >= size: break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]: child += 1
+            j = heap[child]
+            if not keys[j] < entry: break
+            heap[n] = j
+            pos[j] = n
+            n = child
+        heap[n] = i
+        pos[i] = n
+
+
+QUEUES = ("auto", "heap", "bucket", "radix")
+
+
+def make_queue(weights, kind="auto"):
+    """Return an empty queue suited to a search over the given step weights.
+
+    kind is one of QUEUES; "auto" takes a BucketQueue for small integer
+    weights, a RadixHeap for other non-negative integers and a HeapQueue
+    otherwise.
+    """
+    weights = set(weights)
+    integral = all(isinstance(w, int) and w >= 0 for w in weights)
+    top = max(weights, default=0)
+    if kind == "auto":
+        if not integral: kind = "heap"
+        elif top <= BUCKET_LIMIT: kind = "bucket"
+        else: kind = "radix"
+
+    if kind == "heap": return HeapQueue()
+    if not integral: raise ValueError(f"a {kind} queue needs non-negative integer weights")
+    if kind == "bucket": return BucketQueue(top)
+    if kind == "radix": return RadixHeap()
+    raise ValueError(f"unknown queue kind {kind!r}")
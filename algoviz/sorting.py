@@ -0,0 +1,299 @@
+"""Instrumented sorting algorithms for the sorting visualizer.
+
+Every sort is a generator over a list: it sorts the list in place and
+yields one event per elementary operation,
+
+    (COMPARE, i, j)    positions i and j were compared
+    (SWAP, i, j)       positions i and j were exchanged
+    (WRITE, i, value)  value was stored at position i
+
+so replaying the SWAP and WRITE events on a copy of the input
+reproduces every intermediate state, and counting them counts the
+work done (see run()). Nothing here imports tkinter; the app records
+the events into an EventLog and plays them back.
+"""
+
+from collections import Counter
+
+from .events import COMPARE, SWAP, WRITE
+
+INSERTION_CUTOFF = 16    # Quick sort hands ranges this small to insertion sort
+MIN_MERGE = 32           # Timsort extends natural runs to about this length
+COUNTING_LIMIT = 1 << 24 # Largest value range counting sort allocates counts for
+SHELL_GAPS = (1, 4, 10, 23, 57, 132, 301, 701) # Ciura's gaps, extended by x2.25
+
+
+def bubble_sort(a):
+    n = len(a)
+    for i in range(n):
+        for j in range(n - i - 1):
+            yield (COMPARE, j, j + 1)
+            if a[j] > a[j + 1]:
+                a[j], a[j + 1] = a[j + 1], a[j]
+                yield (SWAP, j, j + 1)
+
+
+def _insertion(a, lo, hi, gap=1, first=None):
+    # Gapped insertion sort of a[lo:hi] by swaps; a[lo:first] is already sorted
+    for i in range(first or lo + gap, hi):
+        j = i
+        while j - gap >= lo:
+            yield (COMPARE, j - gap, j)
+            if a[j - gap] <= a[j]: break
+            a[j - gap], a[j] = a[j], a[j - gap]
+            yield (SWAP, j - gap, j)
+            j -= gap
+
+
+def insertion_sort(a):
+    yield from _insertion(a, 0, len(a))
+
+
+def shell_sort(a):
+    n = len(a)
+    gaps = list(SHELL_GAPS)
+    while gaps[-1] * 9 // 4 < n:
+        gaps.append(gaps[-1] * 9 // 4)
+    for gap in reversed(gaps):
+        if gap < n: yield from _insertion(a, 0, n, gap)
+
+
+def _merge(a, lo, mid, hi, buf):
+    # Merge sorted a[lo:mid] and a[mid:hi]; only the left run is copied out,
+    # into buf, which grows to the largest run once and is then reused
+    yield (COMPARE, mid - 1, mid)
+    if a[mid - 1] <= a[mid]: return # Already in order
+    left = mid - lo
+    buf[:left] = a[lo:mid]
+    i, j, k = 0, mid, lo
+    while i < left and j < hi:
+        yield (COMPARE, lo + i, j)
+        if buf[i] <= a[j]:
+            value = buf[i]
+            i += 1
+        else:
+            value = a[j]
+            j += 1
+        a[k] = value
+        yield (WRITE, k, value)
+        k += 1
+    while i < left: # The rest of the right run is already in place
+        a[k] = buf[i]
+        yield (WRITE, k, buf[i])
+        i += 1
+        k += 1
+
+
+def merge_sort(a):
+    """Bottom-up merge sort: runs of 1, 2, 4, ... merged with one shared buffer."""
+    n = len(a)
+    buf = []
+    width = 1
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            yield from _merge(a, lo, lo + width, min(lo + 2 * width, n), buf)
+        width *= 2
+
+
+def _sift(a, lo, root, n):
+    # Max-heap sift-down within the heap a[lo:lo + n]
+    while True:
+        child = 2 * root + 1
+        if child >= n: return
+        if child + 1 < n:
+            yield (COMPARE, lo + child, lo + child + 1)
+            if a[lo + child] < a[lo + child + 1]: child += 1
+        yield (COMPARE, lo + root, lo + child)
+        if a[lo + root] >= a[lo + child]: return
+        a[lo + root], a[lo + child] = a[lo + child], a[lo + root]
+        yield (SWAP, lo + root, lo + child)
+        root = child
+
+
+def _heap_range(a, lo, hi):
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        yield from _sift(a, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        yield (SWAP, lo, lo + end)
+        yield from _sift(a, lo, 0, end)
+
+
+def heap_sort(a):
+    yield from _heap_range(a, 0, len(a))
+
+
+def quick_sort(a):
+    """Introsort: 3-way quick sort, heap sort past 2 log2(n) levels, insertion sort on small ranges.
+
+    The 3-way partition keeps runs of equal keys out of the recursion,
+    so inputs with few distinct values stay O(n log n).
+    """
+    stack = [(0, len(a), 2 * len(a).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= INSERTION_CUTOFF:
+            yield from _insertion(a, lo, hi)
+            continue
+        if not depth:
+            yield from _heap_range(a, lo, hi)
+            continue
+
+        # Median of three as the pivot, moved to a[lo]
+        mid = (lo + hi) // 2
+        for i, j in ((lo, mid), (mid, hi - 1), (lo, mid)):
+            yield (COMPARE, i, j)
+            if a[i] > a[j]:
+                a[i], a[j] = a[j], a[i]
+                yield (SWAP, i, j)
+        a[lo], a[mid] = a[mid], a[lo]
+        yield (SWAP, lo, mid)
+
+        # a[lo:lt] < pivot == a[lt:i] < a[gt + 1:hi]
+        pivot = a[lo]
+        lt, i, gt = lo, lo + 1, hi - 1
+        while i <= gt:
+            yield (COMPARE, i, lt)
+            if a[i] < pivot:
+                a[lt], a[i] = a[i], a[lt]
+                yield (SWAP, lt, i)
+                lt += 1
+                i += 1
+            elif a[i] > pivot:
+                if i != gt:
+                    a[i], a[gt] = a[gt], a[i]
+                    yield (SWAP, i, gt)
+                gt -= 1
+            else:
+                i += 1
+
+        # Smaller side on top, so the stack stays O(log n) deep
+        sides = sorted(((lo, lt), (gt + 1, hi)), key=lambda side: side[0] - side[1])
+        for first, last in sides:
+            stack.append((first, last, depth - 1))
+
+
+def radix_sort(a):
+    """LSD radix sort on bytes: one stable 256-bucket pass per byte of the key range.
+
+    Negative numbers are handled by sorting value - min(a).
+    """
+    if not a: return
+    low = min(a)
+    passes = max(1, ((max(a) - low).bit_length() + 7) // 8)
+    n = len(a)
+    for shift in range(0, 8 * passes, 8):
+        buckets = [[] for _ in range(256)]
+        for value in a:
+            buckets[(value - low) >> shift & 255].append(value)
+        if max(map(len, buckets)) == n: continue # Every key shares this byte
+        k = 0
+        for bucket in buckets:
+            for value in bucket:
+                a[k] = value
+                yield (WRITE, k, value)
+                k += 1
+
+
+def counting_sort(a):
+    if not a: return
+    low, high = min(a), max(a)
+    if high - low >= COUNTING_LIMIT:
+        raise ValueError(f"counting sort needs a value range below {COUNTING_LIMIT}, got {high - low + 1}")
+    counts = [0] * (high - low + 1)
+    for value in a:
+        counts[value - low] += 1
+    k = 0
+    for offset, count in enumerate(counts):
+        value = low + offset
+        for _ in range(count):
+            a[k] = value
+            yield (WRITE, k, value)
+            k += 1
+
+
+def _min_run(n):
+    # Run length that makes n / run a power of two or just below one
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def tim_sort(a):
+    """Timsort-style merging of natural runs (without galloping).
+
+    Ascending runs are kept and strictly descending ones reversed; runs
+    shorter than the minimum run length are extended by insertion sort.
+    Runs are merged as Timsort does, keeping the stack's lengths growing
+    faster than the Fibonacci numbers, so merges stay balanced.
+    """
+    n = len(a)
+    min_run = _min_run(n)
+    runs = [] # Stack of (start, length)
+    buf = []
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            yield (COMPARE, lo, hi)
+            descending = a[hi] < a[lo]
+            hi += 1
+            while hi < n:
+                yield (COMPARE, hi - 1, hi)
+                if (a[hi] < a[hi - 1]) != descending: break
+                hi += 1
+            if descending:
+                i, j = lo, hi - 1
+                while i < j:
+                    a[i], a[j] = a[j], a[i]
+                    yield (SWAP, i, j)
+                    i += 1
+                    j -= 1
+        end = min(lo + min_run, n)
+        if hi < end:
+            yield from _insertion(a, lo, end, first=hi)
+            hi = end
+        runs.append((lo, hi - lo))
+        lo = hi
+
+        while len(runs) > 1:
+            k = len(runs) - 2
+            if k > 0 and runs[k - 1][1] <= runs[k][1] + runs[k + 1][1] or \
+                    k > 1 and runs[k - 2][1] <= runs[k - 1][1] + runs[k][1]:
+                if runs[k - 1][1] < runs[k + 1][1]: k -= 1
+            elif runs[k][1] > runs[k + 1][1]:
+                break
+            yield from _merge_runs(a, runs, k, buf)
+
+    while len(runs) > 1:
+        yield from _merge_runs(a, runs, len(runs) - 2, buf)
+
+
+def _merge_runs(a, runs, k, buf):
+    (start, length), (mid, right) = runs[k], runs[k + 1]
+    yield from _merge(a, start, mid, mid + right, buf)
+    runs[k] = (start, length + right)
+    del runs[k + 1]
+
+
+SORTS = {
+    "Bubble Sort": bubble_sort,
+    "Insertion Sort": insertion_sort,
+    "Shell Sort": shell_sort,
+    "Merge Sort": merge_sort,
+    "Quick Sort": quick_sort,
+    "Heap Sort": heap_sort,
+    "Radix Sort": radix_sort,
+    "Counting Sort": counting_sort,
+    "Timsort": tim_sort,
+}
+
+
+def run(name, data):
+    """Sort a copy of data with SORTS[name]; return (sorted list, Counter of event kinds)."""
+    a = list(data)
+    counts = Counter(event[0] for event in SORTS[name](a))
+    return a, counts
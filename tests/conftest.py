@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The apps put the repository root on sys.path the same way
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+"""All-pairs shortest paths: both engines against each other."""
+
+import io
+import random
+
+import pytest
+
+from algoviz import apsp
+from algoviz.apsp import all_pairs
+
+
+def test_floyd_matches_dijkstra():
+    rng = random.Random(3)
+    for n in (1, 2, 7, 30):
+        edges = [(i, j, rng.randint(1, 20)) for i in range(n) for j in range(i + 1, n) if rng.random() < 0.2]
+        floyd = all_pairs(n, edges, "floyd")
+        repeated = all_pairs(n, edges, "dijkstra")
+        assert floyd.dist == repeated.dist
+        weight = {}
+        for i, j, w in edges:
+            weight[i, j] = weight[j, i] = min(w, weight.get((i, j), w))
+        for i in range(n):
+            for j in range(n):
+                path = floyd.path(i, j)
+                if not path: continue
+                assert path[0] == i and path[-1] == j
+                assert sum(weight[a, b] for a, b in zip(path, path[1:])) == floyd.dist[i][j]
+
+
+def test_auto_picks_by_density():
+    assert all_pairs(4, [(0, 1, 1), (1, 2, 1), (2, 3, 1)]).method == "floyd"
+    assert all_pairs(20, [(i, i + 1, 1) for i in range(19)]).method == "dijkstra"
+
+
+def test_process_pool_matches_single_process(monkeypatch):
+    rng = random.Random(5)
+    n = 40
+    edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 9)) for _ in range(80)]
+    single = all_pairs(n, edges, "dijkstra", processes=1)
+    monkeypatch.setattr(apsp, "POOL_MIN_NODES", 2)
+    pooled = all_pairs(n, edges, "dijkstra", processes=2)
+    assert pooled.dist == single.dist and pooled.next == single.next
+
+
+def test_csv_leaves_unreachable_pairs_empty():
+    out = io.StringIO()
+    all_pairs(3, [(0, 1, 4)], "floyd").write_csv(out, labels="abc")
+    rows = out.getvalue().split()
+    assert rows[0] == "source,target,distance,next_hop"
+    assert "a,b,4,b" in rows and "a,c,," in rows and "c,c,0,c" in rows
+
+
+def test_numpy_floyd_matches_pure_python(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(6)
+    for n in (1, 5, 25):
+        edges = [(i, j, rng.choice([rng.randint(1, 20), rng.random() * 10]))
+                 for i in range(n) for j in range(i + 1, n) if rng.random() < 0.3]
+        vectorized = apsp.floyd_warshall(n, edges)
+        with monkeypatch.context() as m:
+            m.setattr(apsp, "np", None)
+            plain = apsp.floyd_warshall(n, edges)
+        assert vectorized.next == plain.next
+        for row, expected in zip(vectorized.dist, plain.dist):
+            assert row == pytest.approx(expected)
+            assert [type(d) for d in row] == [type(d) for d in expected]
@@ -0,0 +1,42 @@
+"""The headless benchmark runner."""
+
+import csv
+import io
+import json
+
+from algoviz import bench
+
+
+def test_rows_per_maze_and_algorithm():
+    results = bench.bench(21, 31, mud=0.2, seeds=range(3), memory=False, label="t")
+    assert len(results) == 3 * len(bench.ALGORITHMS)
+    for seed in range(3):
+        rows = {row["algorithm"]: row for row in results if row["seed"] == seed}
+        assert rows["Dijkstra"]["cost"] == rows["A*"]["cost"] is not None
+        assert all(row["expanded"] > 0 and row["peak_frontier"] > 0 for row in rows.values())
+
+
+def test_same_seed_same_maze():
+    first, second = (bench.bench(15, 15, mud=0.3, seeds=[7], memory=False) for _ in range(2))
+    assert [row["cost"] for row in first] == [row["cost"] for row in second]
+
+
+def test_main_writes_csv_and_json(tmp_path, capsys):
+    bench.main(["--rows", "9", "--cols", "9", "--no-memory"])
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert [row["algorithm"] for row in rows] == list(bench.ALGORITHMS)
+    out = tmp_path / "results.json"
+    bench.main(["--rows", "9", "--cols", "9", "--format", "json", "-o", str(out)])
+    assert len(json.loads(out.read_text())) == len(bench.ALGORITHMS)
+
+
+def test_dijkstra_runs_once_per_queue():
+    results = bench.bench(25, 25, mud=0.2, algorithms=["Dijkstra"], memory=False, queues=["heap", "bucket", "radix"])
+    assert [row["queue"] for row in results] == ["heap", "bucket", "radix"]
+    assert len({row["cost"] for row in results}) == 1
+
+
+def test_jps_rows_record_the_fallback_on_mud():
+    for mud, expected in ((0, "JPS"), (0.2, bench.JPS_FALLBACK)):
+        results = bench.bench(21, 21, mud=mud, algorithms=["JPS", "A*"], memory=False)
+        assert [row["algorithm"] for row in results] == [expected, "A*"]
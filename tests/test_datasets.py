@@ -0,0 +1,77 @@
+"""Dataset generation, parsing and loading."""
+
+from array import array
+from collections import Counter
+
+import pytest
+
+from algoviz import datasets
+from algoviz.datasets import DISTRIBUTIONS, FEW_UNIQUE, generate, is_sorted, load_file, parse_csv, save_binary
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    # Every test below runs on the pure-Python fallback and, if installed, on NumPy
+    if request.param == "numpy": pytest.importorskip("numpy")
+    else: monkeypatch.setattr(datasets, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("kind", DISTRIBUTIONS)
+def test_generate_is_seeded_and_in_range(backend, kind):
+    data = generate(kind, 2000, low=10, high=60, seed=1)
+    assert len(data) == 2000 and all(type(x) is int and 10 <= x <= 60 for x in data)
+    assert data == generate(kind, 2000, low=10, high=60, seed=1)
+    assert generate(kind, 0) == [] and len(generate(kind, 1)) == 1
+
+
+def test_distribution_shapes(backend):
+    assert generate("Reversed", 500, seed=2) == sorted(generate("Reversed", 500, seed=2), reverse=True)
+    nearly = generate("Nearly Sorted", 1000, high=10**6, seed=2)
+    assert not is_sorted(nearly) and sum(a > b for a, b in zip(nearly, nearly[1:])) <= 20
+    assert len(set(generate("Few Unique", 1000, seed=2))) <= FEW_UNIQUE
+    counts = Counter(generate("Zipfian", 5000, low=1, high=100, seed=2))
+    assert counts.most_common(1)[0][0] == 1 and counts[1] > counts[2] > counts[10]
+    with pytest.raises(ValueError):
+        generate("Gaussian", 10)
+
+
+def test_parse_csv(backend):
+    assert parse_csv("3, 1,2\n-7\n") == [3, 1, 2, -7]
+    for text in ("", " ,\n", "1, two, 3", "1.5"):
+        with pytest.raises(ValueError):
+            parse_csv(text)
+
+
+@pytest.mark.parametrize("ext", [".i32", ".i64", ".bin"])
+def test_binary_round_trip(backend, tmp_path, ext):
+    data = [0, -1, 2**31 - 1, -2**31, 12345]
+    path = str(tmp_path / ("data" + ext))
+    save_binary(data, path)
+    assert load_file(path) == data
+    assert (tmp_path / ("data" + ext)).stat().st_size == len(data) * (4 if ext == ".i32" else 8)
+
+
+def test_load_text_and_reject_partial_items(backend, tmp_path):
+    (tmp_path / "data.csv").write_text("5,4\n3\n")
+    assert load_file(str(tmp_path / "data.csv")) == [5, 4, 3]
+    (tmp_path / "bad.i32").write_bytes(b"123456")
+    with pytest.raises(ValueError):
+        load_file(str(tmp_path / "bad.i32"))
+
+
+def test_is_sorted(backend):
+    assert is_sorted([]) and is_sorted([1]) and is_sorted([1, 1, 2])
+    assert not is_sorted([2, 1])
+    assert is_sorted(array("q", [1, 2, 3])) and not is_sorted(memoryview(array("q", [3, 2])))
+
+
+def test_parse_csv_backends_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    # Includes values at and beyond the int64 limits, which NumPy would clamp
+    texts = ["5", "+5, -0", "  7 ,8", "9223372036854775807", "99999999999999999999,1", "-9223372036854775809"]
+    for text in texts:
+        vectorized = parse_csv(text)
+        with monkeypatch.context() as m:
+            m.setattr(datasets, "np", None)
+            assert vectorized == parse_csv(text), text
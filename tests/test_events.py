@@ -0,0 +1,18 @@
+"""Event logs recorded by the algorithms."""
+
+from algoviz.events import PATH, VISIT, EventLog, interleave
+from algoviz.pathfinding import Grid, dijkstra
+
+
+def test_recorder_logs_every_expanded_cell():
+    grid = Grid.from_rows([[0, 0, 0], [1, 1, 0], [0, 0, 0]])
+    log = EventLog()
+    result = dijkstra(grid, (0, 0), (2, 0), on_visit=log.recorder(VISIT))
+    log.emit(PATH, *result.path[-1])
+    assert log[:3] == [(VISIT, 0, 0), (VISIT, 0, 1), (VISIT, 0, 2)]
+    assert len(log) == result.visited and log[-1] == (PATH, 2, 0)
+
+
+def test_interleave_is_round_robin():
+    merged = interleave([1, 2, 3], ["a"], [])
+    assert merged == [(0, 1), (1, "a"), (0, 2), (0, 3)]
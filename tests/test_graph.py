@@ -0,0 +1,44 @@
+"""The adjacency index of the graph visualizers."""
+
+from algoviz.graph import Graph
+
+
+class Edge:
+    def __init__(self, source, destination, weight=1):
+        self.source = source
+        self.destination = destination
+        self.weight = weight
+
+
+def test_edges_are_indexed_both_ways():
+    graph = Graph()
+    a, b, c = (graph.add_node(name) for name in "abc")
+    ab, bc = graph.add_edge(Edge(a, b, 3)), graph.add_edge(Edge(b, c, 4))
+    assert ab is None and bc is None
+    assert graph.has_edge(b, a) and not graph.has_edge(a, c)
+    assert graph.neighbors(b) == [a, c]
+    assert graph.neighbors_with_weights(c) == [(b, 4)]
+
+
+def test_replacing_an_edge_and_undo_restores_it():
+    graph = Graph()
+    a, b = graph.add_node("a"), graph.add_node("b")
+    first = Edge(a, b, 1)
+    graph.add_edge(first)
+    second = Edge(b, a, 2)
+    assert graph.add_edge(second) is first
+    assert list(graph.edges) == [second]
+    assert graph.undo() is second
+    assert graph.get_edge(a, b) is first and list(graph.edges) == [first]
+
+
+def test_removing_a_node_removes_its_edges():
+    graph = Graph()
+    a, b, c = (graph.add_node(name) for name in "abc")
+    graph.add_edge(Edge(a, b))
+    graph.add_edge(Edge(b, c))
+    assert graph.remove_node(b)
+    assert graph.nodes == [a, c] and not graph.edges
+    assert graph.neighbors(a) == [] and graph.neighbors(c) == []
+    # Undo skips the records of the removed node and edges
+    assert graph.undo() is c and graph.undo() is a and graph.undo() is None
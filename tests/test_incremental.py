@@ -0,0 +1,33 @@
+"""LPA* repairs against solving the edited grid from scratch."""
+
+import random
+
+import pytest
+
+from algoviz.incremental import LPAStar
+from algoviz.mazegen import GENERATORS, add_mud
+from algoviz.pathfinding import MUD, PATH, WALL, dijkstra
+
+
+@pytest.mark.parametrize("heuristic", [True, False])
+def test_replans_match_fresh_solves(heuristic):
+    rng = random.Random(9)
+    for trial in range(150):
+        rows, cols = rng.randint(2, 12), rng.randint(2, 12)
+        grid = GENERATORS[rng.choice(list(GENERATORS))](rows, cols, rng=rng)
+        add_mud(grid, rng.random() * 0.5, rng=rng)
+        start, end = (0, 0), (rows - 1, cols - 1)
+        planner = LPAStar(grid, start, end, heuristic=heuristic)
+        for step in range(15):
+            for _ in range(rng.randint(1, 3) if step else 0):
+                r, c = rng.randrange(rows), rng.randrange(cols)
+                if (r, c) in (start, end): continue
+                grid[r, c] = rng.choice([PATH, WALL, MUD])
+                planner.update_cell(r, c)
+            result = planner.compute()
+            expected = dijkstra(grid, start, end)
+            assert result.cost == expected.cost
+            if result.found:
+                path = result.path
+                assert path[0] == start and path[-1] == end
+                assert sum(grid.cost(r, c) for r, c in path[1:]) == expected.cost
@@ -0,0 +1,57 @@
+"""Seeded maze generators."""
+
+import random
+
+import pytest
+
+from algoviz.mazegen import GENERATORS, add_mud
+from algoviz.pathfinding import MUD, PATH, WALL, bfs
+
+SIZES = [(1, 1), (1, 9), (2, 2), (7, 5), (20, 31), (31, 31)]
+MAZES = [name for name in GENERATORS if name != "Open Field"] # Perfect mazes
+
+
+@pytest.mark.parametrize("name", GENERATORS)
+def test_same_seed_same_maze(name):
+    for rows, cols in SIZES:
+        first, second = (GENERATORS[name](rows, cols, seed=3) for _ in range(2))
+        assert first.cells == second.cells
+        assert GENERATORS[name](rows, cols, rng=random.Random(3)).cells == first.cells
+
+
+@pytest.mark.parametrize("name", MAZES)
+def test_end_is_reachable(name):
+    for seed in range(5):
+        for rows, cols in SIZES:
+            grid = GENERATORS[name](rows, cols, seed=seed)
+            assert grid[0, 0] == PATH and grid[rows - 1, cols - 1] == PATH
+            assert bfs(grid, (0, 0), (rows - 1, cols - 1)).found
+
+
+@pytest.mark.parametrize("name", MAZES)
+def test_rooms_form_a_spanning_tree(name):
+    for seed in range(3):
+        grid = GENERATORS[name](31, 41, seed=seed)
+        assert all(grid[r, c] == PATH for r in range(0, 31, 2) for c in range(0, 41, 2))
+        open_cells = [(r, c) for r in range(31) for c in range(41) if grid.is_open(r, c)]
+        assert bfs(grid, (0, 0), (-1, -1)).visited == len(open_cells) # Connected
+        # A tree has one link fewer than cells; open_corners may add one cycle at the end
+        links = sum(grid.is_open(r + 1, c) for r, c in open_cells if r < 30) \
+            + sum(grid.is_open(r, c + 1) for r, c in open_cells if c < 40)
+        assert links - len(open_cells) in (-1, 0)
+
+
+def test_open_field_density():
+    assert GENERATORS["Open Field"](5, 6, seed=1, density=0).to_rows() == [[PATH] * 6] * 5
+    grid = GENERATORS["Open Field"](9, 9, seed=1, density=1)
+    assert grid[0, 0] == PATH and grid[8, 8] == PATH and grid[4, 4] == WALL
+
+
+def test_add_mud_keeps_listed_cells():
+    grid = GENERATORS["Backtracker"](21, 21, seed=2)
+    before = grid.to_rows()
+    add_mud(grid, 1.0, seed=2, keep=[(0, 0), (20, 20)])
+    for r, row in enumerate(before):
+        for c, code in enumerate(row):
+            expected = MUD if code == PATH and (r, c) not in ((0, 0), (20, 20)) else code
+            assert grid[r, c] == expected
@@ -0,0 +1,65 @@
+"""Operation counts and the simulated cache."""
+
+import io
+import random
+
+from algoviz.events import COMPARE, SWAP, WRITE
+from algoviz.metrics import FIELDS, CacheModel, Metrics, write_csv
+from algoviz.sorting import SORTS
+
+
+def reference_misses(accesses, items_per_line, sets, ways):
+    # Plain LRU per set, no shortcuts
+    lru = [[] for _ in range(sets)]
+    misses = 0
+    for i in accesses:
+        line = i // items_per_line
+        lines = lru[line % sets]
+        if line in lines: lines.remove(line)
+        else:
+            misses += 1
+            if len(lines) == ways: lines.pop(0)
+        lines.append(line)
+    return misses
+
+
+def test_cache_model_matches_plain_lru():
+    rng = random.Random(1)
+    for sets, ways in ((1, 1), (4, 2), (64, 8)):
+        accesses = [rng.randrange(5000) if rng.random() < 0.5 else rng.randrange(64) for _ in range(20000)]
+        cache = CacheModel(sets=sets, ways=ways)
+        for i in accesses:
+            cache.touch(i)
+        assert cache.misses == reference_misses(accesses, 8, sets, ways)
+        assert cache.hits + cache.misses == len(accesses)
+        assert cache.lines_touched == len({i // 8 for i in accesses})
+
+
+def test_sequential_scan_misses_once_per_line():
+    cache = CacheModel()
+    for i in range(8000):
+        cache.touch(i)
+    assert cache.misses == cache.lines_touched == 1000
+
+
+def test_record_counts_like_the_explicit_calls():
+    data = random.Random(2).sample(range(500), 500)
+    recorded, explicit = Metrics(), Metrics()
+    for event in SORTS["Merge Sort"](list(data)):
+        recorded.record(event)
+        kind, i, j = event
+        if kind == COMPARE: explicit.compare(i, j)
+        elif kind == SWAP: explicit.swap(i, j)
+        elif kind == WRITE: explicit.write(i)
+    assert recorded.row("Merge Sort", 500) == explicit.row("Merge Sort", 500)
+    assert recorded.writes > 0 and recorded.cache.misses > 0
+
+
+def test_rows_export_as_csv():
+    metrics = Metrics()
+    metrics.swap(0, 9)
+    out = io.StringIO()
+    write_csv([metrics.row("Bubble Sort", 10)], out)
+    header, row = out.getvalue().splitlines()
+    assert header.split(",") == FIELDS
+    assert row.startswith("Bubble Sort,10,0,1,2,2,")
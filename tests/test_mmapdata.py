@@ -0,0 +1,84 @@
+"""Memory-mapped files: search, sortedness and the external merge sort."""
+
+import random
+
+import pytest
+
+from algoviz import mmapdata
+from algoviz.datasets import load_file, save_binary
+from algoviz.mmapdata import MappedArray, external_sort
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(8)
+    return [rng.randint(-10**6, 10**6) for _ in range(20000)]
+
+
+@pytest.mark.parametrize("ext", [".i32", ".bin"])
+def test_find_matches_list_index(tmp_path, values, ext):
+    path = str(tmp_path / ("data" + ext))
+    save_binary(values, path)
+    with MappedArray(path) as data:
+        assert len(data) == len(values) and data[10:20] == values[10:20]
+        for target in values[::997] + [10**7, -10**7]:
+            pages = []
+            found = data.find(target, lambda first, last: pages.append((first, last)))
+            assert found == (values.index(target) if target in values else None)
+            assert pages[0][0] == 0
+
+
+def test_find_skips_unaligned_matches(tmp_path):
+    path = str(tmp_path / "data.i32")
+    save_binary([0x01000000, 2, 7], path) # Bytes 00 00 00 01 02 00 00 00 ...
+    with MappedArray(path) as data:
+        assert data.find(0x00020100) is None
+        assert data.find(7) == 2
+
+
+def test_is_sorted(tmp_path, values):
+    path = str(tmp_path / "data.bin")
+    save_binary(sorted(values), path)
+    with MappedArray(path) as data:
+        assert data.is_sorted()
+    save_binary(values, path)
+    with MappedArray(path) as data:
+        assert not data.is_sorted()
+
+
+@pytest.mark.parametrize("chunk_items", [10**6, 1000, 37])
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_external_sort(tmp_path, values, monkeypatch, chunk_items, backend):
+    # Runs are sorted with NumPy when it is installed, else in plain Python
+    if backend == "numpy": pytest.importorskip("numpy")
+    else: monkeypatch.setattr(mmapdata, "np", None)
+    monkeypatch.setattr(mmapdata, "MERGE_FAN_IN", 4) # Force extra merge passes
+    src, dst = str(tmp_path / "in.bin"), str(tmp_path / "out.bin")
+    save_binary(values, src)
+    phases = set()
+    runs = external_sort(src, dst, chunk_items=chunk_items, on_pages=lambda phase, first, last: phases.add(phase))
+    assert runs == -(-len(values) // chunk_items)
+    assert load_file(dst) == sorted(values)
+    assert phases == {"read", "write"}
+
+
+def test_external_sort_stops(tmp_path, values):
+    src, dst = str(tmp_path / "in.bin"), str(tmp_path / "out.bin")
+    save_binary(values, src)
+    assert external_sort(src, dst, chunk_items=100, should_stop=lambda: True) is None
+
+
+def test_rejects_partial_items(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"123")
+    with pytest.raises(ValueError):
+        MappedArray(str(path))
+
+
+def test_external_sort_keeps_the_item_type(tmp_path, values):
+    src = str(tmp_path / "in.i32")
+    save_binary(values, src)
+    external_sort(src, str(tmp_path / "out.i32"), chunk_items=1000)
+    assert load_file(str(tmp_path / "out.i32")) == sorted(values)
+    with pytest.raises(ValueError):
+        external_sort(src, str(tmp_path / "out.bin"))
@@ -0,0 +1,224 @@
+"""Every grid solver against a plain Dijkstra."""
+
+import heapq
+import random
+
+import pytest
+
+from algoviz.landmarks import Landmarks
+from algoviz.mazegen import GENERATORS, add_mud
+from algoviz.pathfinding import ALGORITHMS, MUD, PATH, WALL, Grid, astar, dijkstra, jps, solve, uniform_cost
+from algoviz.pathfinding import bidirectional_astar, bidirectional_dijkstra
+from algoviz.pathservice import LRUCache, PathService
+from algoviz.pqueue import QUEUES, BucketQueue, HeapQueue, IndexedHeap, RadixHeap, make_queue
+
+
+def reference_cost(grid, start, end):
+    # Textbook Dijkstra over (row, col) tuples; None if end is unreachable
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, (r, c) = heapq.heappop(heap)
+        if (r, c) == end: return d
+        if d > dist[r, c]: continue
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nxt = (r + dr, c + dc)
+            if not grid.in_bounds(*nxt) or not grid.is_open(*nxt): continue
+            if d + grid.cost(*nxt) < dist.get(nxt, float("inf")):
+                dist[nxt] = d + grid.cost(*nxt)
+                heapq.heappush(heap, (dist[nxt], nxt))
+    return None
+
+
+def check_path(grid, result, start, end):
+    path = result.path
+    assert path[0] == start and path[-1] == end
+    for (r0, c0), (r1, c1) in zip(path, path[1:]):
+        assert abs(r0 - r1) + abs(c0 - c1) == 1
+        assert grid.is_open(r1, c1)
+    return sum(grid.cost(r, c) for r, c in path[1:])
+
+
+def random_rows(rows, cols, rng, walls=0.3, mud=0.2):
+    # Random walls and mud, with the corners left open; some ends are unreachable
+    cells = [[rng.choices([PATH, WALL, MUD], [1 - walls - mud, walls, mud])[0] for _ in range(cols)] for _ in range(rows)]
+    cells[0][0] = cells[rows - 1][cols - 1] = PATH
+    return cells
+
+
+def mazes(count=40, seed=1):
+    # Alternately random grids and generated mazes, two in three with mud
+    rng = random.Random(seed)
+    generators = list(GENERATORS)
+    for k in range(count):
+        rows, cols = rng.randint(1, 25), rng.randint(2, 25)
+        mud = 0 if k % 3 == 0 else rng.random() * 0.4
+        if k % 2:
+            grid = GENERATORS[generators[k // 2 % len(generators)]](rows, cols, rng=rng)
+            add_mud(grid, mud, rng=rng, keep=[(0, 0), (rows - 1, cols - 1)])
+        else:
+            grid = Grid.from_rows(random_rows(rows, cols, rng, mud=mud))
+        yield grid, (0, 0), (rows - 1, cols - 1)
+
+
+@pytest.mark.parametrize("name", [name for name in ALGORITHMS if name not in ("BFS", "DFS")])
+def test_weighted_solvers_match_reference(name):
+    for grid, start, end in mazes():
+        result = solve(name, grid, start, end)
+        expected = reference_cost(grid, start, end)
+        assert result.cost == expected
+        if expected is not None: assert check_path(grid, result, start, end) == expected
+
+
+@pytest.mark.parametrize("name", ["BFS", "DFS"])
+def test_unweighted_solvers_find_valid_paths(name):
+    for grid, start, end in mazes():
+        result = solve(name, grid, start, end)
+        expected = reference_cost(grid, start, end)
+        assert result.found == (expected is not None)
+        if result.found:
+            assert check_path(grid, result, start, end) == result.cost
+            if name == "BFS" and MUD not in grid.cells: assert result.cost == expected
+
+
+def test_solve_passes_rng_to_dfs():
+    grid, start, end = next(mazes(2, seed=7))
+    paths = [solve("DFS", grid, start, end, rng=random.Random(5)).path for _ in range(2)]
+    assert paths[0] == paths[1]
+
+
+def test_on_visit_sees_expanded_cells():
+    grid, start, end = next(mazes(1, seed=5))
+    seen = []
+    result = solve("Dijkstra", grid, start, end, on_visit=lambda r, c: seen.append((r, c)))
+    assert len(set(seen)) == len(seen)
+    assert all(grid.is_open(r, c) for r, c in seen)
+    assert result.visited == len(seen) + result.found # The goal is not reported
+
+
+def test_grid_round_trips_rows():
+    rows = [[PATH, WALL, MUD], [MUD, PATH, PATH]]
+    grid = Grid.from_rows(rows)
+    assert grid.to_rows() == rows
+    assert grid[1, 0] == MUD and grid.cost(1, 0) == MUD and not grid.is_open(0, 1)
+    with pytest.raises(IndexError):
+        grid[2, 0]
+
+
+@pytest.mark.parametrize("search", [bidirectional_dijkstra, bidirectional_astar])
+def test_bidirectional_searches(search):
+    for grid, start, end in mazes(20, seed=12):
+        forward, backward = [], []
+        result = search(grid, start, end, on_visit=lambda r, c: forward.append((r, c)),
+                        on_visit_back=lambda r, c: backward.append((r, c)))
+        assert result.cost == reference_cost(grid, start, end) == search(grid, end, start).cost
+        assert result.visited == len(forward) + len(backward)
+        assert forward[:1] in ([], [start]) and backward[:1] in ([], [end])
+    grid, start, _ = next(mazes(1))
+    assert search(grid, start, start).path == [start]
+
+
+def test_jps_prunes_uniform_grids_and_falls_back_on_mud():
+    for grid, start, end in mazes(30, seed=13):
+        result = jps(grid, start, end)
+        assert result.cost == reference_cost(grid, start, end)
+        if result.found: assert check_path(grid, result, start, end) == result.cost
+        if not uniform_cost(grid): assert result.visited == astar(grid, start, end).visited
+    field = GENERATORS["Open Field"](60, 60, seed=1, density=0)
+    assert uniform_cost(field)
+    assert jps(field, (0, 0), (59, 59)).visited < astar(field, (0, 0), (59, 59)).visited
+
+
+@pytest.mark.parametrize("queue", QUEUES)
+def test_dijkstra_queues_match_reference(queue):
+    for grid, start, end in mazes():
+        assert dijkstra(grid, start, end, queue=queue).cost == reference_cost(grid, start, end)
+
+
+@pytest.mark.parametrize("make", [HeapQueue, lambda: BucketQueue(5), RadixHeap])
+def test_queue_pops_in_key_order(make):
+    # Monotone use, as in Dijkstra: keys pushed are never below the last popped
+    rng = random.Random(2)
+    pq, popped, last = make(), [], 0
+    pushed = 0
+    for _ in range(2000):
+        if pq and rng.random() < 0.5:
+            key, item = pq.pop()
+            popped.append(key)
+            last = key
+        else:
+            pq.push(last + rng.randint(0, 5), pushed)
+            pushed += 1
+    while pq:
+        popped.append(pq.pop()[0])
+    assert popped == sorted(popped) and len(popped) == pushed
+
+
+def test_make_queue_picks_by_weights():
+    assert make_queue({1, 5}).name == "bucket"
+    assert make_queue({1, 5000}).name == "radix"
+    assert make_queue({0.5}).name == "heap"
+    with pytest.raises(ValueError):
+        make_queue({0.5}, "bucket")
+
+
+def test_indexed_heap_decreases_keys():
+    rng = random.Random(5)
+    pq, best = IndexedHeap(200), {}
+    for _ in range(1000):
+        i, key = rng.randrange(200), rng.randint(0, 10**4)
+        assert pq.push(key, i) == (key < best.get(i, float("inf")))
+        best[i] = min(key, best.get(i, key))
+        assert i in pq
+    popped = [pq.pop() for _ in range(len(pq))]
+    assert popped == sorted((key, i) for i, key in best.items())
+    assert not pq and 0 not in pq
+
+
+def test_landmark_potential_keeps_astar_optimal():
+    rng = random.Random(4)
+    for grid, start, end in mazes(15, seed=4):
+        landmarks = Landmarks(grid, k=4)
+        h = landmarks.potential(end)
+        result = astar(grid, start, end, potential=h)
+        assert result.cost == reference_cost(grid, start, end)
+        for _ in range(10): # A lower bound on the true cost from any open cell
+            r, c = rng.randrange(grid.rows), rng.randrange(grid.cols)
+            cost = reference_cost(grid, (r, c), end) if grid.is_open(r, c) else None
+            if cost is not None: assert h(grid.index(r, c)) <= cost
+
+
+def test_path_service_tracks_edits():
+    grid, start, end = next(mazes(2, seed=11))
+    service = PathService(grid)
+    rng = random.Random(6)
+    for _ in range(30):
+        r, c = rng.randrange(grid.rows), rng.randrange(grid.cols)
+        if (r, c) not in (start, end): service.set_cell(r, c, rng.choice([PATH, WALL, MUD]))
+        assert service.dijkstra(start, end).cost == reference_cost(grid, start, end)
+        assert service.dijkstra(start, end).cost == reference_cost(grid, start, end) # From the cache
+
+
+def test_path_service_finds_results_again_after_undo():
+    grid = GENERATORS["Kruskal"](15, 15, seed=2)
+    service = PathService(grid)
+    before, calls = service.hash, []
+    compute = lambda: calls.append(1) or ["events"]
+    log = service.memo(["log"], compute)
+    old = grid[3, 3]
+    service.set_cell(3, 3, WALL if old != WALL else PATH)
+    assert service.hash != before
+    assert service.memo(["log"], compute) is not log
+    service.set_cell(3, 3, old)
+    assert service.hash == before
+    assert service.memo(["log"], compute) is log and calls == [1, 1]
+
+
+def test_lru_cache_evicts_oldest_by_size():
+    cache = LRUCache(max_bytes=10)
+    cache.put("a", 1, 4)
+    cache.put("b", 2, 4)
+    cache.get("a")
+    cache.put("c", 3, 4)
+    assert "b" not in cache and cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.nbytes == 8
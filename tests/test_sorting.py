@@ -0,0 +1,48 @@
+"""Every algorithm of the sorting engine against sorted()."""
+
+import random
+
+import pytest
+
+from algoviz.events import SWAP, WRITE
+from algoviz.sorting import SORTS, run
+
+rng = random.Random(4)
+INPUTS = [
+    [],
+    [7],
+    [2, 1],
+    list(range(50)),
+    list(range(50, 0, -1)),
+    [rng.randint(1, 5) for _ in range(200)],
+    [rng.randint(-1000, 1000) for _ in range(300)],
+    [rng.randint(0, 10**6) for _ in range(1000)],
+]
+
+
+def replay(data, events):
+    a = list(data)
+    for kind, i, j in events:
+        if kind == SWAP: a[i], a[j] = a[j], a[i]
+        elif kind == WRITE: a[i] = j
+    return a
+
+
+@pytest.mark.parametrize("name", SORTS)
+@pytest.mark.parametrize("data", INPUTS, ids=lambda data: f"n{len(data)}")
+def test_sorts_and_replays(name, data):
+    a = list(data)
+    events = list(SORTS[name](a))
+    assert a == sorted(data)
+    assert replay(data, events) == sorted(data)
+
+
+def test_run_counts_events():
+    result, counts = run("Bubble Sort", [3, 2, 1])
+    assert result == [1, 2, 3]
+    assert counts["swap"] == 3 and counts["compare"] == 3
+
+
+def test_counting_sort_rejects_huge_ranges():
+    with pytest.raises(ValueError):
+        list(SORTS["Counting Sort"]([0, 10**9]))